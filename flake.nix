@@ -83,7 +83,7 @@
                 prev.lib.optionalString
                 (prev.stdenv.isAarch64 && prev.stdenv.isDarwin)
                 "APPLE_SILICON=true"
-              } kdist -v build -j4
+              } kdist -v build -j4 evm-semantics.{plugin,llvm,llvm-profile,llvm-trace,haskell,haskell-standalone,kllvm,kllvm-runtime}
             '';
 
             installPhase = ''
@@ -176,14 +176,9 @@
 
         apps = {
           compare-profiles = flake-utils.lib.mkApp {
-            drv = pkgs.stdenv.mkDerivation {
-              name = "compare-profiles";
-              src = ./package/nix;
-              installPhase = ''
-                mkdir -p $out/bin
-                cp profile.py $out/bin/compare-profiles
-              '';
-            };
+            drv = pkgs.writeShellScriptBin "compare-profiles" ''
+              exec ${kevm}/bin/kevm bench compare --candidate "$1" --baseline "$2" "''${@:3}"
+            '';
           };
         };
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import contextlib
-import graphlib
 import json
 import logging
 import os
@@ -9,63 +8,57 @@ import sys
 import tempfile
 import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from filelock import SoftFileLock
-from pathos.pools import ProcessPool  # type: ignore
 from pyk.cli.pyk import parse_toml_args
-from pyk.cterm import CTermSymbolic
-from pyk.kast.outer import KApply, KRewrite, KSort, KToken
-from pyk.kcfg import KCFG
-from pyk.kcfg.explore import KCFGExplore
-from pyk.kdist import kdist
-from pyk.kore.rpc import KoreClient
-from pyk.kore.tools import kore_print
-from pyk.ktool.claim_loader import ClaimLoader
 from pyk.ktool.kompile import LLVMKompileType
-from pyk.proof import APRProof
-from pyk.proof.implies import EqualityProof
-from pyk.proof.show import APRProofShow
-from pyk.proof.tui import APRProofViewer
 from pyk.utils import FrozenDict, hash_str, single
 
 from . import VERSION, config
+from .bench import compare_samples, read_samples, record_trials
 from .cli import _create_argument_parser, generate_options, get_argument_type_setter, get_option_string_destination
-from .gst_to_kore import SORT_ETHEREUM_SIMULATION, gst_to_kore, kore_pgm_to_kore
-from .kevm import KEVM, KEVMSemantics, kevm_node_printer
 from .kompile import KompileTarget, kevm_kompile
-from .utils import (
-    claim_dependency_dict,
-    get_apr_proof_for_spec,
-    initialize_apr_proof,
-    legacy_explore,
-    print_failure_info,
-    run_prover,
-)
 
 if TYPE_CHECKING:
     from argparse import Namespace
     from collections.abc import Callable, Iterator
+    from subprocess import CompletedProcess
     from typing import Any, Final, TypeVar
 
+    from pathos.pools import ProcessPool  # type: ignore
     from pyk.kast.outer import KClaim
     from pyk.kcfg.tui import KCFGElem
+    from pyk.kore.syntax import Pattern
     from pyk.proof.proof import Proof
 
     from .cli import (
+        BenchCompareOptions,
+        BenchRecordOptions,
+        ConformanceOptions,
+        ConformanceReportOptions,
         KastOptions,
         KompileSpecOptions,
+        KoreCacheOptions,
         ProveOptions,
         PruneOptions,
+        RunBatchOptions,
         RunOptions,
         SectionEdgeOptions,
+        ServeOptions,
         ShowKCFGOptions,
         VersionOptions,
         ViewKCFGOptions,
     )
+    from .kevm import KEVM
+    from .kore_cache import KoreCache
+    from .proof_cache import ProofCache
+    from .proof_store import ProofStore
+    from .result_cache import ResultCache
+    from .utils import KoreServerPool
 
     T = TypeVar('T')
 
@@ -93,6 +86,8 @@ def main() -> None:
     options = generate_options(stripped_args)
 
     executor_name = 'exec_' + args.command.lower().replace('-', '_')
+    if args.command == 'bench':
+        executor_name += '_' + args.bench_command
     if executor_name not in globals():
         raise AssertionError(f'Unimplemented command: {args.command}')
 
@@ -143,9 +138,22 @@ class ZeroProcessPool:
     def map(self, f: Callable[[Any], Any], xs: list[Any]) -> list[Any]:
         return [f(x) for x in xs]
 
+    def apipe(self, f: Callable[..., Any], *args: Any) -> ZeroAsyncResult:
+        return ZeroAsyncResult(f(*args))
+
+
+@dataclass(frozen=True)
+class ZeroAsyncResult:
+    value: Any
+
+    def get(self) -> Any:
+        return self.value
+
 
 @contextlib.contextmanager
 def wrap_process_pool(workers: int) -> Iterator[ZeroProcessPool | ProcessPool]:
+    from pathos.pools import ProcessPool
+
     if workers <= 1:
         yield ZeroProcessPool()
     else:
@@ -153,6 +161,25 @@ def wrap_process_pool(workers: int) -> Iterator[ZeroProcessPool | ProcessPool]:
             yield pp
 
 
+@contextlib.contextmanager
+def wrap_kore_server_pool(workers: int, **server_args: Any) -> Iterator[KoreServerPool]:
+    from .utils import KoreServerPool, KoreServerPoolManager
+
+    if workers <= 1:
+        server_pool = KoreServerPool(**server_args)
+        try:
+            yield server_pool
+        finally:
+            server_pool.close()
+    else:
+        with KoreServerPoolManager() as manager:
+            server_pool = manager.KoreServerPool(size=workers, **server_args)  # type: ignore
+            try:
+                yield server_pool
+            finally:
+                server_pool.close()
+
+
 class JSONEncoder(json.JSONEncoder):
     def default(self, obj: Any) -> Any:
         if isinstance(obj, FrozenDict):
@@ -171,30 +198,14 @@ class KClaimJob:
         claim_hash = hash_str(json.dumps(self.claim.to_dict(), sort_keys=True, cls=JSONEncoder))
         return hash_str(f'{claim_hash}{deps_digest}')
 
-    def up_to_date(self, digest_file: Path | None) -> bool:
-        with SoftFileLock(f'{digest_file}.lock'):
-            if not isinstance(digest_file, Path) or not digest_file.exists():
-                return False
-            digest_dict = json.loads(digest_file.read_text())
-            if 'claims' not in digest_dict:
-                return False
-            if self.claim.label not in digest_dict['claims']:
-                return False
-            return digest_dict['claims'][self.claim.label] == self.digest
-
-    def update_digest(self, digest_file: Path | None) -> None:
-        if digest_file is None:
-            return
-        digest_dict = {}
-        with SoftFileLock(f'{digest_file}.lock'):
-            if digest_file.exists():
-                digest_dict = json.loads(digest_file.read_text())
-            if 'claims' not in digest_dict:
-                digest_dict['claims'] = {}
-            digest_dict['claims'][self.claim.label] = self.digest
-            digest_file.write_text(json.dumps(digest_dict, indent=4))
+    def up_to_date(self, proof_store: ProofStore | None) -> bool:
+        return proof_store is not None and proof_store.digest(self.claim.label) == self.digest
 
-            _LOGGER.info(f'Updated claim {self.claim.label} in digest file: {digest_file}')
+    def update_digest(self, proof_store: ProofStore | None) -> None:
+        if proof_store is None:
+            return
+        proof_store.set_digest(self.claim.label, self.digest)
+        _LOGGER.info(f'Updated claim {self.claim.label} in proof store: {proof_store.db_file}')
 
 
 def init_claim_jobs(spec_module_name: str, claims: list[KClaim]) -> frozenset[KClaimJob]:
@@ -218,11 +229,33 @@ def init_claim_jobs(spec_module_name: str, claims: list[KClaim]) -> frozenset[KC
 
 
 def exec_prove(options: ProveOptions) -> None:
+    from pyk.cterm import CTermSymbolic
+    from pyk.kast.outer import KApply, KRewrite
+    from pyk.kcfg.explore import KCFGExplore
+    from pyk.kdist import kdist
+    from pyk.kore.rpc import KoreClient
+    from pyk.ktool.claim_loader import ClaimLoader
+    from pyk.proof import APRProof
+    from pyk.proof.implies import EqualityProof
+
+    from .kevm import KEVM, KEVMSemantics
+    from .proof_store import ProofStore
+    from .timings import ClaimTiming, claim_costs, critical_path_priorities, estimate_makespan
+    from .utils import (
+        claim_dependency_dict,
+        initialize_apr_proof,
+        lease_kore_server,
+        legacy_explore,
+        print_failure_info,
+        run_in_dependency_order,
+        run_prover,
+    )
+
     md_selector = 'k'
 
     save_directory = options.save_directory or Path(tempfile.mkdtemp())
 
-    digest_file = save_directory / 'digest'
+    proof_store = ProofStore(save_directory)
 
     definition_dir = options.definition_dir or kdist.get('evm-semantics.haskell')
 
@@ -251,6 +284,7 @@ def exec_prove(options: ProveOptions) -> None:
         return not (type(claim_lhs) is KApply and claim_lhs.label.name == '<generatedTop>')
 
     llvm_definition_dir = definition_dir / 'llvm-library' if (options.use_booster or options.use_booster_dev) else None
+    proof_cache = _proof_cache(options, definition_dir=kevm.definition_dir, kore_rpc_command=kore_rpc_command)
 
     _LOGGER.info(f'Extracting claims from file: {options.spec_file}')
     all_claims = ClaimLoader(kevm).load_claims(
@@ -270,15 +304,27 @@ def exec_prove(options: ProveOptions) -> None:
     all_claim_jobs_by_label = {c.claim.label: c for c in all_claim_jobs}
     claims_graph = claim_dependency_dict(all_claims, spec_module_name=spec_module_name)
 
+    timings = proof_store.timings()
+    costs = claim_costs(claims_graph, timings)
+    if options.estimate:
+        estimate = estimate_makespan(claims_graph, costs, max(1, options.workers))
+        print(f'Estimated time with {options.workers} workers: {estimate.makespan:.1f}s')
+        print(f'Total proof time: {estimate.total:.1f}s, critical path: {estimate.critical_path:.1f}s')
+        if unknown := [label for label in claims_graph if label not in timings]:
+            print(
+                f'No timings for {len(unknown)} of {len(claims_graph)} claims, estimated at {costs[unknown[0]]:.1f}s each'
+            )
+        return
+
     def _init_and_run_proof(claim_job: KClaimJob) -> tuple[bool, list[str] | None]:
         proof_problem: Proof
         claim = claim_job.claim
-        up_to_date = claim_job.up_to_date(digest_file)
+        up_to_date = claim_job.up_to_date(proof_store)
         if up_to_date:
             _LOGGER.info(f'Claim is up to date: {claim.label}')
         else:
             _LOGGER.info(f'Claim reinitialized because it is out of date: {claim.label}')
-        claim_job.update_digest(digest_file)
+        claim_job.update_digest(proof_store)
 
         if is_functional(claim):
             if not options.reinit and up_to_date and EqualityProof.proof_exists(claim.label, save_directory):
@@ -292,25 +338,28 @@ def exec_prove(options: ProveOptions) -> None:
                 proof_problem = APRProof.from_claim(kevm.definition, claim, {}, proof_dir=save_directory)
         if proof_problem.passed and not proof_problem.admitted:
             _LOGGER.info(f'Proof already passed: {proof_problem.id}')
+            if proof_cache is not None:
+                proof_cache.put(claim_job.digest, proof_problem)
             return (True, [])
 
-        with legacy_explore(
-            kevm,
-            kcfg_semantics=KEVMSemantics(auto_abstract_gas=options.auto_abstract_gas),
-            id=claim.label,
-            llvm_definition_dir=llvm_definition_dir,
-            bug_report=options.bug_report,
-            kore_rpc_command=kore_rpc_command,
-            smt_timeout=options.smt_timeout,
-            smt_retry_limit=options.smt_retry_limit,
-            log_succ_rewrites=options.log_succ_rewrites,
-            log_fail_rewrites=options.log_fail_rewrites,
-            fallback_on=options.fallback_on,
-            interim_simplification=options.interim_simplification,
-            no_post_exec_simplify=(not options.post_exec_simplify),
-            port=options.port,
-            haskell_threads=options.max_frontier_parallel,
-        ) as kcfg_explore:
+        if proof_cache is not None and not options.reinit:
+            if proof_cache.restore(claim_job.digest, claim.label, save_directory):
+                proof_store.set_status(claim.label, 'passed')
+                return (True, [])
+
+        with (
+            lease_kore_server(server_pool) as port,
+            legacy_explore(
+                kevm,
+                kcfg_semantics=KEVMSemantics(auto_abstract_gas=options.auto_abstract_gas),
+                id=claim.label,
+                bug_report=options.bug_report,
+                log_succ_rewrites=options.log_succ_rewrites,
+                log_fail_rewrites=options.log_fail_rewrites,
+                start_server=False,
+                port=port,
+            ) as kcfg_explore,
+        ):
 
             def create_kcfg_explore() -> KCFGExplore:
                 dispatch = None
@@ -367,44 +416,67 @@ def exec_prove(options: ProveOptions) -> None:
             )
             end_time = time.time()
             _LOGGER.info(f'Proof timing {proof_problem.id}: {end_time - start_time}s')
+            nodes = len(proof_problem.kcfg.nodes) if type(proof_problem) is APRProof else None
+            proof_store.record_timing(claim.label, ClaimTiming(end_time - start_time, nodes))
+            proof_store.set_status(claim.label, proof_problem.status.value)
+            if passed and proof_cache is not None:
+                proof_cache.put(claim_job.digest, proof_problem)
             failure_log = None
             if not passed:
                 failure_log = print_failure_info(proof_problem, kcfg_explore)
 
             return passed, failure_log
 
-    topological_sorter = graphlib.TopologicalSorter(claims_graph)
-    topological_sorter.prepare()
-    with wrap_process_pool(workers=options.workers) as process_pool:
-        selected_results: list[tuple[bool, list[str] | None]] = []
-        selected_claims = []
-        while topological_sorter.is_active():
-            ready = topological_sorter.get_ready()
-            _LOGGER.info(f'Discharging proof obligations: {ready}')
-            curr_claim_list = [all_claim_jobs_by_label[label] for label in ready]
-            results: list[tuple[bool, list[str] | None]] = process_pool.map(_init_and_run_proof, curr_claim_list)
-            for label in ready:
-                topological_sorter.done(label)
-            selected_results.extend(results)
-            selected_claims.extend(curr_claim_list)
-
     failed = 0
-    for job, r in zip(selected_claims, selected_results, strict=True):
-        passed, failure_log = r
-        if passed:
-            print(f'PROOF PASSED: {job.claim.label}')
-        else:
-            failed += 1
-            print(f'PROOF FAILED: {job.claim.label}')
-            if options.failure_info and failure_log is not None:
-                for line in failure_log:
-                    print(line)
+    with (
+        wrap_kore_server_pool(
+            options.workers,
+            definition_dir=kevm.definition_dir,
+            module_name=kevm.main_module,
+            llvm_definition_dir=llvm_definition_dir,
+            port=options.port,
+            command=kore_rpc_command,
+            bug_report=options.bug_report,
+            smt_timeout=options.smt_timeout,
+            smt_retry_limit=options.smt_retry_limit,
+            haskell_threads=options.max_frontier_parallel,
+            fallback_on=options.fallback_on,
+            interim_simplification=options.interim_simplification,
+            no_post_exec_simplify=(not options.post_exec_simplify),
+        ) as server_pool,
+        wrap_process_pool(workers=options.workers) as process_pool,
+    ):
+
+        def start_proof(label: str) -> Callable[[], tuple[bool, list[str] | None]]:
+            _LOGGER.info(f'Discharging proof obligation: {label}')
+            return process_pool.apipe(_init_and_run_proof, all_claim_jobs_by_label[label]).get
+
+        results = run_in_dependency_order(
+            claims_graph,
+            start_proof,
+            max_running=max(1, options.workers),
+            priorities=critical_path_priorities(claims_graph, costs),
+        )
+        for label, (passed, failure_log) in results:
+            if passed:
+                print(f'PROOF PASSED: {label}')
+            else:
+                failed += 1
+                print(f'PROOF FAILED: {label}')
+                if options.failure_info and failure_log is not None:
+                    for line in failure_log:
+                        print(line)
 
     if failed:
         sys.exit(failed)
 
 
 def exec_prune(options: PruneOptions) -> None:
+    from pyk.ktool.claim_loader import ClaimLoader
+    from pyk.proof import APRProof
+
+    from .kevm import KEVM
+
     md_selector = 'k'
 
     if options.save_directory is None:
@@ -438,6 +510,12 @@ def exec_prune(options: PruneOptions) -> None:
 
 
 def exec_section_edge(options: SectionEdgeOptions) -> None:
+    from pyk.ktool.claim_loader import ClaimLoader
+    from pyk.proof import APRProof
+
+    from .kevm import KEVM, KEVMSemantics
+    from .utils import legacy_explore
+
     md_selector = 'k'
 
     if options.save_directory is None:
@@ -501,6 +579,10 @@ def exec_section_edge(options: SectionEdgeOptions) -> None:
 
 
 def exec_show_kcfg(options: ShowKCFGOptions) -> None:
+    from pyk.proof.show import APRProofShow
+
+    from .kevm import KEVM, KEVMSemantics, kevm_node_printer
+    from .utils import get_apr_proof_for_spec, legacy_explore, print_failure_info
 
     if options.definition_dir is None:
         raise ValueError('Must pass --definition to show-kcfg!')
@@ -547,6 +629,11 @@ def exec_show_kcfg(options: ShowKCFGOptions) -> None:
 
 
 def exec_view_kcfg(options: ViewKCFGOptions) -> None:
+    from pyk.kcfg import KCFG
+    from pyk.proof.tui import APRProofViewer
+
+    from .kevm import KEVM, kevm_node_printer
+    from .utils import get_apr_proof_for_spec
 
     if options.definition_dir is None:
         raise ValueError('Must pass --definition to view-kcfg!')
@@ -581,15 +668,75 @@ def exec_view_kcfg(options: ViewKCFGOptions) -> None:
 
 
 def exec_run(options: RunOptions) -> None:
+    from pyk.kast.outer import KSort, KToken
+    from pyk.kdist import kdist
+
+    from .gst_to_kore import SORT_ETHEREUM_SIMULATION, gst_to_kore, gst_to_kore_stream, kore_pgm_to_kore
+    from .kevm import KEVM
+
     target = options.target or 'llvm'
 
+    instrumented_target = _instrumented_target(options)
+    if instrumented_target is not None:
+        if target not in ('llvm', instrumented_target):
+            raise ValueError(f'Option --profile-rules or --trace-opcodes needs the llvm target, got: {target}')
+        if options.stream or options.schedules or options.debugger:
+            raise ValueError('Options --stream, --schedules and --debugger are not supported with instrumentation')
+        target = instrumented_target
+
     target_fqn = f'evm-semantics.{target}'
 
     kevm = KEVM(kdist.get(target_fqn), use_directory=options.save_directory)
 
+    if options.schedules:
+        _run_schedules(kevm, options)
+        return
+
+    if options.stream:
+        with options.input_file.open() as f:
+            for test_name, kore_pattern in gst_to_kore_stream(
+                f, options.schedule, options.mode, options.chainid, options.usegas, normalize=options.normalize
+            ):
+                _LOGGER.info(f'Running test: {test_name}')
+                kevm.run(
+                    kore_pattern,
+                    depth=options.depth,
+                    term=True,
+                    expand_macros=options.expand_macros,
+                    output=options.output,
+                    check=True,
+                    debugger=options.debugger,
+                )
+        return
+
+    kore_cache = _kore_cache(options)
+
     try:
+        if kore_cache is not None:
+            kore_text = kore_cache.gst_to_kore(
+                options.input_file.read_bytes(),
+                options.schedule,
+                options.mode,
+                options.chainid,
+                options.usegas,
+                normalize=options.normalize,
+            ).decode()
+            if instrumented_target is not None:
+                _run_instrumented(kevm, kore_text.encode(), options)
+                return
+            kevm.run_kore_text(
+                kore_text,
+                depth=options.depth,
+                expand_macros=options.expand_macros,
+                output=options.output,
+                check=True,
+                debugger=options.debugger,
+            )
+            return
         json_read = json.loads(options.input_file.read_text())
-        kore_pattern = gst_to_kore(json_read, options.schedule, options.mode, options.chainid, options.usegas)
+        kore_pattern = gst_to_kore(
+            json_read, options.schedule, options.mode, options.chainid, options.usegas, normalize=options.normalize
+        )
     except json.JSONDecodeError:
         pgm_token = KToken(options.input_file.read_text(), KSort('EthereumSimulation'))
         kast_pgm = kevm.parse_token(pgm_token)
@@ -598,6 +745,10 @@ def exec_run(options: RunOptions) -> None:
             kore_pgm, SORT_ETHEREUM_SIMULATION, options.schedule, options.mode, options.chainid, options.usegas
         )
 
+    if instrumented_target is not None:
+        _run_instrumented(kevm, kore_pattern.text.encode(), options)
+        return
+
     kevm.run(
         kore_pattern,
         depth=options.depth,
@@ -609,16 +760,274 @@ def exec_run(options: RunOptions) -> None:
     )
 
 
+def _instrumented_target(options: RunOptions) -> str | None:
+    if options.profile_rules and options.trace_opcodes is not None:
+        raise ValueError('Options --profile-rules and --trace-opcodes are mutually exclusive')
+    if options.profile_rules:
+        return 'llvm-profile'
+    if options.trace_opcodes is not None:
+        return 'llvm-trace'
+    return None
+
+
+def _run_instrumented(kevm: KEVM, init_kore: bytes, options: RunOptions) -> None:
+    from .opcode_trace import trace_opcodes
+    from .rule_profile import profile_rules
+
+    depth = -1 if options.depth is None else options.depth
+
+    if options.trace_opcodes is not None:
+        with options.trace_opcodes.open('w') as trace:
+            stats = trace_opcodes(init_kore, definition_dir=kevm.definition_dir, depth=depth, trace=trace)
+        _LOGGER.info(f'Wrote opcode trace: {options.trace_opcodes}')
+        print(stats.table())
+        return
+
+    profile = profile_rules(init_kore, definition_dir=kevm.definition_dir, depth=depth)
+    print(profile.table(limit=options.profile_limit))
+    if options.profile_stacks is not None:
+        with options.profile_stacks.open('w') as stacks:
+            profile.write_collapsed(stacks)
+        _LOGGER.info(f'Wrote rule profile stacks: {options.profile_stacks}')
+
+
+def _run_schedules(kevm: KEVM, options: RunOptions) -> None:
+    from .gst_to_kore import prepare_gst
+
+    assert options.schedules
+    if options.stream or options.debugger:
+        raise ValueError('Options --stream and --debugger are not supported with --schedules')
+
+    # The GST is converted and serialized once, only the chain options are patched in per schedule
+    prepared = prepare_gst(json.loads(options.input_file.read_text()), normalize=options.normalize)
+    prepared.precompute()
+
+    def run(schedule: str) -> CompletedProcess:
+        kore_text = prepared.to_kore_text(schedule, options.mode, options.chainid, options.usegas)
+        return kevm.krun_kore_text(kore_text, depth=options.depth, expand_macros=options.expand_macros)
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=options.workers) as executor:
+        for schedule, result in zip(options.schedules, executor.map(run, options.schedules), strict=True):
+            print(f'{schedule}:')
+            kevm.print_krun_output(result.stdout, options.output)
+            if result.returncode:
+                failed.append(schedule)
+
+    if failed:
+        _LOGGER.error(f'Failed schedules: {", ".join(failed)}')
+        sys.exit(len(failed))
+
+
+def exec_run_batch(options: RunBatchOptions) -> None:
+    from .interpreter import interpret_batch
+
+    failed = 0
+    for result in interpret_batch(
+        options.input_files,
+        options.schedule,
+        options.mode,
+        options.chainid,
+        options.usegas,
+        workers=options.workers,
+        backend=options.backend,
+        binary=options.binary,
+        normalize=options.normalize,
+        preload=options.preload,
+        kore_cache=_kore_cache(options),
+        max_pending=options.max_pending,
+    ):
+        if result.passed:
+            print(f'PASSED: {result.gst_file}')
+        else:
+            failed += 1
+            reason = result.error if result.error is not None else f'exit code {result.exit_code}'
+            print(f'FAILED: {result.gst_file}: {reason}')
+
+    if failed:
+        sys.exit(failed)
+
+
+def exec_conformance(options: ConformanceOptions) -> None:
+    from .conformance import (
+        ResultStatus,
+        discover_fixtures,
+        read_test_list,
+        run_conformance,
+        shard_fixtures,
+        skipped_tests,
+        write_manifest_entry,
+    )
+
+    if options.backend != 'llvm':
+        raise ValueError(f'Conformance tests can only be run on the llvm backend, got: {options.backend}')
+
+    fixtures = discover_fixtures(options.test_dir)
+    if options.shard is not None:
+        fixtures = shard_fixtures(fixtures, *options.shard)
+    _LOGGER.info(f'Running {len(fixtures)} fixtures')
+
+    failed = 0
+    with contextlib.ExitStack() as stack:
+        manifest = stack.enter_context(options.manifest.open('w')) if options.manifest is not None else None
+        for entry in run_conformance(
+            options.test_dir,
+            fixtures,
+            workers=options.workers,
+            skip=skipped_tests(read_test_list(skip_list) for skip_list in options.skip_lists),
+            binary=options.binary,
+            normalize=options.normalize,
+            preload=options.preload,
+            snapshot=options.snapshot,
+            timeout=options.timeout,
+            result_cache=_result_cache(options),
+        ):
+            if manifest is not None:
+                write_manifest_entry(manifest, entry)
+            if entry.status is ResultStatus.SKIPPED:
+                continue
+            if entry.status is ResultStatus.PASSED:
+                print(f'PASSED: {entry.fixture}: {entry.test}')
+            else:
+                failed += 1
+                reason = entry.error if entry.error is not None else f'exit code {entry.exit_code}'
+                print(f'FAILED: {entry.fixture}: {entry.test}: {reason}')
+
+    if failed:
+        sys.exit(failed)
+
+
+def exec_conformance_report(options: ConformanceReportOptions) -> None:
+    from .conformance import (
+        ResultStatus,
+        classify_tests,
+        merge_manifests,
+        read_manifest,
+        write_manifest_entry,
+        write_test_list,
+    )
+
+    entries = merge_manifests(read_manifest(manifest) for manifest in options.manifests)
+
+    if options.output is not None:
+        with options.output.open('w') as output:
+            for entry in entries:
+                write_manifest_entry(output, entry)
+
+    if options.slow_list is not None or options.failing_list is not None:
+        slow, failing = classify_tests(
+            entries,
+            slow_threshold=options.slow_threshold,
+            slow=_read_test_list_if_exists(options.slow_list),
+            failing=_read_test_list_if_exists(options.failing_list),
+        )
+        if options.slow_list is not None:
+            write_test_list(options.slow_list, slow)
+        if options.failing_list is not None:
+            write_test_list(options.failing_list, failing)
+
+    for status in ResultStatus:
+        print(f'{status.value}: {sum(1 for entry in entries if entry.status is status)}')
+    print(f'time: {sum(entry.time for entry in entries if entry.time is not None):.1f}s')
+    print(f'max_rss: {max((entry.max_rss for entry in entries if entry.max_rss is not None), default=0)} KiB')
+
+
+def _proof_cache(
+    options: ProveOptions, *, definition_dir: Path, kore_rpc_command: tuple[str, ...]
+) -> ProofCache | None:
+    from .proof_cache import ProofCache
+
+    if options.proof_cache_dir is None:
+        return None
+    # Only the options that change what is proven, the others only change how long it takes, or whether it finishes
+    proof_options = {
+        'kore_rpc_command': kore_rpc_command,
+        'auto_abstract_gas': options.auto_abstract_gas,
+        'assume_defined': options.assume_defined,
+    }
+    return ProofCache(options.proof_cache_dir, definition_dir=definition_dir, options=proof_options)
+
+
+def _result_cache(options: ConformanceOptions) -> ResultCache | None:
+    from .result_cache import ResultCache
+
+    if options.result_cache_dir is None:
+        return None
+    return ResultCache(options.result_cache_dir, refresh=options.force_rerun)
+
+
+def _read_test_list_if_exists(list_file: Path | None) -> list[tuple[str, str]]:
+    from .conformance import read_test_list
+
+    if list_file is None or not list_file.exists():
+        return []
+    return read_test_list(list_file)
+
+
+def exec_bench_record(options: BenchRecordOptions) -> None:
+    command = options.bench_args[1:] if options.bench_args[:1] == ['--'] else options.bench_args
+    if not command:
+        raise ValueError('No command to record, pass it after --')
+
+    exit_code = 0
+    options.manifest.parent.mkdir(parents=True, exist_ok=True)
+    for entry in record_trials(command, name=options.name, trials=options.trials):
+        with options.manifest.open('a') as manifest:
+            manifest.write(json.dumps(entry, sort_keys=True) + '\n')
+        exit_code = entry['exit_code']
+
+    sys.exit(exit_code)
+
+
+def exec_bench_compare(options: BenchCompareOptions) -> None:
+    comparison = compare_samples(
+        read_samples(options.baseline),
+        read_samples(options.candidate),
+        confidence=options.confidence,
+        time_threshold=options.time_threshold,
+        memory_threshold=options.memory_threshold,
+        min_time=options.min_time,
+    )
+    print(comparison.table(min_time=options.min_time))
+
+    regressions = comparison.regressions
+    if regressions:
+        print(f'Significant regressions: {len(regressions)}')
+        sys.exit(1)
+
+
 def exec_kast(options: KastOptions) -> None:
+    from pyk.kast.outer import KSort, KToken
+    from pyk.kdist import kdist
+    from pyk.kore.tools import kore_print
+
+    from .gst_to_kore import SORT_ETHEREUM_SIMULATION, gst_to_kore, kore_pgm_to_kore
+    from .kevm import KEVM
+
     target = options.target or 'llvm'
 
     target_fqn = f'evm-semantics.{target}'
 
     kevm = KEVM(kdist.get(target_fqn), use_directory=options.save_directory)
 
+    kore_cache = _kore_cache(options)
+
+    kore_pattern: Pattern | str
     try:
-        json_read = json.loads(options.input_file.read_text())
-        kore_pattern = gst_to_kore(json_read, options.schedule, options.mode, options.chainid, options.usegas)
+        if kore_cache is not None:
+            kore_pattern = kore_cache.gst_to_kore(
+                options.input_file.read_bytes(),
+                options.schedule,
+                options.mode,
+                options.chainid,
+                options.usegas,
+                normalize=options.normalize,
+            ).decode()
+        else:
+            json_read = json.loads(options.input_file.read_text())
+            kore_pattern = gst_to_kore(
+                json_read, options.schedule, options.mode, options.chainid, options.usegas, normalize=options.normalize
+            )
     except json.JSONDecodeError:
         pgm_token = KToken(options.input_file.read_text(), KSort('EthereumSimulation'))
         kast_pgm = kevm.parse_token(pgm_token)
@@ -631,9 +1040,37 @@ def exec_kast(options: KastOptions) -> None:
     print(output_text)
 
 
+def exec_serve(options: ServeOptions) -> None:
+    from .server import KEVMServer, make_server
+
+    kevm_server = KEVMServer(workers=options.workers, backend=options.backend, kore_cache=_kore_cache(options))
+    for target in options.load_targets:
+        kevm_server.load(target)
+
+    with make_server(kevm_server, socket_path=options.socket, port=options.port) as server:
+        _LOGGER.info(f'Listening on: {options.socket if options.socket is not None else f"localhost:{options.port}"}')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if options.socket is not None:
+                options.socket.unlink(missing_ok=True)
+
+
 # Helpers
 
 
+def _kore_cache(options: KoreCacheOptions) -> KoreCache | None:
+    from .kore_cache import KoreCache
+
+    if options.kore_cache_dir is None:
+        return None
+    if options.kore_cache_size is None:
+        return KoreCache(options.kore_cache_dir)
+    return KoreCache(options.kore_cache_dir, max_size=options.kore_cache_size)
+
+
 def _loglevel(args: Namespace) -> int:
     if args.debug:
         return logging.DEBUG
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import subprocess
+import time
+from dataclasses import dataclass, field
+from statistics import NormalDist, fmean, variance
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from pathlib import Path
+    from typing import Any, Final
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@dataclass
+class Samples:
+    """Wall times in seconds and peak RSS in KiB of the passing trials of a test."""
+
+    times: list[float] = field(default_factory=list)
+    max_rss: list[int] = field(default_factory=list)
+
+
+def read_samples(manifests: Iterable[Path]) -> dict[str, Samples]:
+    """Read the passing trials of each test from JSON lines manifests.
+
+    Both `kevm bench record` and `kevm conformance --manifest` manifests are read, entries of conformance manifests
+    are named `fixture:test`. Each entry of a test, in the same or in different manifests, is one trial. Entries of
+    result cache hits only repeat the time of an earlier run, so they are skipped.
+    """
+    samples: dict[str, Samples] = {}
+    for manifest in manifests:
+        with manifest.open() as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                dct = json.loads(line)
+                if dct.get('status') != 'passed' or dct.get('time') is None or dct.get('cached'):
+                    continue
+                test = f'{dct["fixture"]}:{dct["test"]}' if 'fixture' in dct else dct['test']
+                test_samples = samples.setdefault(test, Samples())
+                test_samples.times.append(dct['time'])
+                if dct.get('max_rss') is not None:
+                    test_samples.max_rss.append(dct['max_rss'])
+    return samples
+
+
+@dataclass(frozen=True)
+class Delta:
+    """Means of a metric in the baseline and candidate, and a confidence interval of the difference of the means.
+
+    There is no confidence interval unless both had more than one trial.
+    """
+
+    baseline: float
+    candidate: float
+    ci: tuple[float, float] | None
+
+    @property
+    def relative(self) -> float:
+        if self.baseline == 0:
+            return 0.0 if self.candidate == 0 else math.inf
+        return self.candidate / self.baseline - 1
+
+    def regression(self, threshold: float) -> bool:
+        """Whether the candidate is worse by more than `threshold`, relative to the baseline, and significantly so.
+
+        Without a confidence interval, only the threshold is checked.
+        """
+        return self.relative > threshold and (self.ci is None or self.ci[0] > 0)
+
+
+class _Estimate(NamedTuple):
+    mean: float
+    var: float  # Variance of the mean
+    df: int | None
+
+
+def _estimate(values: Sequence[float]) -> _Estimate:
+    if len(values) < 2:
+        return _Estimate(fmean(values), 0.0, None)
+    return _Estimate(fmean(values), variance(values) / len(values), len(values) - 1)
+
+
+def _delta(baselines: Sequence[_Estimate], candidates: Sequence[_Estimate], confidence: float) -> Delta:
+    """Compare the sums of the means, with a Welch-Satterthwaite confidence interval of their difference."""
+    baseline = sum(estimate.mean for estimate in baselines)
+    candidate = sum(estimate.mean for estimate in candidates)
+    diff = candidate - baseline
+    estimates = list(baselines) + list(candidates)
+    if any(estimate.df is None for estimate in estimates):
+        return Delta(baseline, candidate, None)
+
+    var = sum(estimate.var for estimate in estimates)
+    if var == 0:
+        return Delta(baseline, candidate, (diff, diff))
+    df = var**2 / sum(estimate.var**2 / estimate.df for estimate in estimates if estimate.df)
+    margin = t_quantile((1 + confidence) / 2, df) * math.sqrt(var)
+    return Delta(baseline, candidate, (diff - margin, diff + margin))
+
+
+def t_quantile(p: float, df: float) -> float:
+    """Quantile of Student's t-distribution.
+
+    Below 5 degrees of freedom, where the Cornish-Fisher expansion around the normal quantile is too low, the CDF is
+    inverted by bisection.
+    """
+    if df < 5:
+        return _t_quantile_exact(p, df)
+    z = NormalDist().inv_cdf(p)
+    terms = (
+        (z**3 + z) / 4,
+        (5 * z**5 + 16 * z**3 + 3 * z) / 96,
+        (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / 384,
+        (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / 92160,
+    )
+    return z + sum(term / df ** (i + 1) for i, term in enumerate(terms))
+
+
+def _t_quantile_exact(p: float, df: float) -> float:
+    if p < 0.5:
+        return -_t_quantile_exact(1 - p, df)
+    lo, hi = 0.0, 1.0
+    while _t_cdf(hi, df) < p:
+        lo, hi = hi, 2 * hi
+    for _ in range(100):
+        mid = (lo + hi) / 2
+        if _t_cdf(mid, df) < p:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+def _t_cdf(t: float, df: float) -> float:
+    """CDF of Student's t-distribution at `t >= 0`."""
+    return 1 - _betainc(df / 2, 0.5, df / (df + t**2)) / 2
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function, by its continued fraction evaluated with the modified Lentz method."""
+    if x <= 0 or x >= 1:
+        return max(0.0, min(x, 1.0))
+    if x > (a + 1) / (a + b + 2):
+        # The continued fraction converges quickly only below this point
+        return 1 - _betainc(b, a, 1 - x)
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)) / a
+    tiny = 1e-300
+    c, d = 1.0, 1 - (a + b) * x / (a + 1)
+    d = 1 / (d if abs(d) > tiny else tiny)
+    f = d
+    for m in range(1, 200):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1 + numerator * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            f *= c * d
+        if abs(c * d - 1) < 1e-15:
+            break
+    return front * f
+
+
+@dataclass(frozen=True)
+class Comparison:
+    test: str
+    time: Delta
+    memory: Delta | None
+    time_regression: bool
+    memory_regression: bool
+
+
+@dataclass(frozen=True)
+class BenchComparison:
+    tests: tuple[Comparison, ...]
+    total: Comparison
+    baseline_only: tuple[str, ...]
+    candidate_only: tuple[str, ...]
+
+    @property
+    def regressions(self) -> tuple[Comparison, ...]:
+        return tuple(
+            comparison
+            for comparison in self.tests + (self.total,)
+            if comparison.time_regression or comparison.memory_regression
+        )
+
+    def table(self, *, min_time: float = 0.0) -> str:
+        """Format the comparison of tests that took at least `min_time` seconds, largest relative time delta first."""
+        tests = [
+            comparison
+            for comparison in self.tests
+            if max(comparison.time.baseline, comparison.time.candidate) >= min_time
+        ]
+        tests.sort(key=lambda comparison: comparison.time.relative, reverse=True)
+        rows: list[tuple[str, ...]] = [
+            ('Test', 'Baseline', 'Candidate', 'Time', 'Time CI', 'Baseline RSS', 'Candidate RSS', 'RSS', '')
+        ]
+        rows += [_row(comparison) for comparison in tests + [self.total]]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = [
+            ' | '.join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)).rstrip() for row in rows
+        ]
+        lines.insert(1, '-+-'.join('-' * width for width in widths))
+        if self.baseline_only or self.candidate_only:
+            lines.append(
+                f'Not compared: {len(self.baseline_only)} tests passing only in the baseline, '
+                f'{len(self.candidate_only)} only in the candidate'
+            )
+        return '\n'.join(lines)
+
+
+def _row(comparison: Comparison) -> tuple[str, ...]:
+    time_delta, memory = comparison.time, comparison.memory
+    time_ci = f'[{time_delta.ci[0]:+.2f}s, {time_delta.ci[1]:+.2f}s]' if time_delta.ci is not None else '-'
+    flags = [
+        flag
+        for flag, regression in (('TIME', comparison.time_regression), ('RSS', comparison.memory_regression))
+        if regression
+    ]
+    return (
+        comparison.test,
+        f'{time_delta.baseline:.2f}s',
+        f'{time_delta.candidate:.2f}s',
+        f'{100 * time_delta.relative:+.1f}%',
+        time_ci,
+        f'{memory.baseline:.0f}KiB' if memory is not None else '-',
+        f'{memory.candidate:.0f}KiB' if memory is not None else '-',
+        f'{100 * memory.relative:+.1f}%' if memory is not None else '-',
+        f'REGRESSION ({", ".join(flags)})' if flags else '',
+    )
+
+
+def compare_samples(
+    baseline: Mapping[str, Samples],
+    candidate: Mapping[str, Samples],
+    *,
+    confidence: float = 0.95,
+    time_threshold: float = 0.035,
+    memory_threshold: float = 0.05,
+    min_time: float = 2.0,
+) -> BenchComparison:
+    """Compare the tests passing in both the baseline and the candidate, and their totals.
+
+    A test regresses in time or memory if the candidate is significantly worse, by more than the threshold relative to
+    the baseline. Time regressions of tests that took less than `min_time` seconds in both are ignored.
+    """
+    common = sorted(baseline.keys() & candidate.keys())
+    tests: list[Comparison] = []
+    time_estimates: tuple[list[_Estimate], list[_Estimate]] = ([], [])
+    memory_estimates: tuple[list[_Estimate], list[_Estimate]] | None = ([], [])
+
+    for test in common:
+        base_time, cand_time = _estimate(baseline[test].times), _estimate(candidate[test].times)
+        time_delta = _delta([base_time], [cand_time], confidence)
+        time_estimates[0].append(base_time)
+        time_estimates[1].append(cand_time)
+
+        memory_delta: Delta | None = None
+        if baseline[test].max_rss and candidate[test].max_rss:
+            base_rss, cand_rss = _estimate(baseline[test].max_rss), _estimate(candidate[test].max_rss)
+            memory_delta = _delta([base_rss], [cand_rss], confidence)
+            if memory_estimates is not None:
+                memory_estimates[0].append(base_rss)
+                memory_estimates[1].append(cand_rss)
+        else:
+            memory_estimates = None
+
+        tests.append(
+            Comparison(
+                test=test,
+                time=time_delta,
+                memory=memory_delta,
+                time_regression=max(time_delta.baseline, time_delta.candidate) >= min_time
+                and time_delta.regression(time_threshold),
+                memory_regression=memory_delta is not None and memory_delta.regression(memory_threshold),
+            )
+        )
+
+    total_time = _delta(*time_estimates, confidence)
+    total_memory = _delta(*memory_estimates, confidence) if memory_estimates is not None and common else None
+    total = Comparison(
+        test='TOTAL',
+        time=total_time,
+        memory=total_memory,
+        time_regression=total_time.regression(time_threshold),
+        memory_regression=total_memory is not None and total_memory.regression(memory_threshold),
+    )
+    return BenchComparison(
+        tests=tuple(tests),
+        total=total,
+        baseline_only=tuple(sorted(baseline.keys() - candidate.keys())),
+        candidate_only=tuple(sorted(candidate.keys() - baseline.keys())),
+    )
+
+
+def record_trials(command: Sequence[str], *, name: str | None = None, trials: int = 1) -> Iterator[dict[str, Any]]:
+    """Run a command repeatedly, measuring the wall time and peak RSS of each trial as a manifest entry."""
+    test = name if name is not None else ' '.join(command)
+    for trial in range(trials):
+        _LOGGER.info(f'Running trial {trial + 1}/{trials}: {test}')
+        start_time = time.time()
+        proc = subprocess.Popen(command)
+        _, status, rusage = os.wait4(proc.pid, 0)
+        elapsed = time.time() - start_time
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        yield {
+            'test': test,
+            'trial': trial,
+            'status': 'passed' if proc.returncode == 0 else 'failed',
+            'exit_code': proc.returncode,
+            'time': round(elapsed, 3),
+            'max_rss': rusage.ru_maxrss,
+        }
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from argparse import ArgumentParser
+from argparse import REMAINDER, ArgumentParser, ArgumentTypeError
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -19,24 +19,40 @@ from pyk.cli.args import (
     SMTOptions,
     SpecOptions,
 )
-from pyk.cli.utils import file_path
-from pyk.kore.rpc import FallbackReason
+from pyk.cli.utils import arg_pair_of, dir_path, file_path
 from pyk.kore.tools import PrintOutput
-from pyk.ktool.krun import KRunOutput
 
 from .kompile import KompileTarget
-from .utils import arg_pair_of
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Final, TypeVar
 
     from pyk.kcfg.kcfg import NodeIdLike
+    from pyk.kore.rpc import FallbackReason
+    from pyk.ktool.krun import KRunOutput
 
     T = TypeVar('T')
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+SCHEDULES: Final = (
+    'DEFAULT',
+    'FRONTIER',
+    'HOMESTEAD',
+    'TANGERINE_WHISTLE',
+    'SPURIOUS_DRAGON',
+    'BYZANTIUM',
+    'CONSTANTINOPLE',
+    'PETERSBURG',
+    'ISTANBUL',
+    'BERLIN',
+    'LONDON',
+    'MERGE',
+    'SHANGHAI',
+    'CANCUN',
+)
+
 
 def list_of(elem_type: Callable[[str], T], delim: str = ';') -> Callable[[str], list[T]]:
     def parse(s: str | list[str]) -> list[T]:
@@ -46,6 +62,39 @@ def list_of(elem_type: Callable[[str], T], delim: str = ';') -> Callable[[str],
     return parse
 
 
+def schedule(s: str) -> str:
+    if s not in SCHEDULES:
+        raise ArgumentTypeError(f"Invalid schedule: {s} (choose from {'|'.join(SCHEDULES)})")
+    return s
+
+
+# The enums below are imported on use, as importing their modules dominates the startup time of light commands
+
+
+def krun_output(s: str) -> KRunOutput:
+    from pyk.ktool.krun import KRunOutput
+
+    try:
+        return KRunOutput(s)
+    except ValueError:
+        raise ArgumentTypeError(
+            f"Invalid output: {s} (choose from {'|'.join(output.value for output in KRunOutput)})"
+        ) from None
+
+
+def fallback_reason(s: str) -> FallbackReason:
+    from pyk.kore.rpc import FallbackReason
+
+    return FallbackReason(s)
+
+
+def shard(s: str) -> tuple[int, int]:
+    index, sep, count = s.partition('/')
+    if not sep or not index.isdigit() or not count.isdigit() or not 0 <= int(index) < int(count):
+        raise ArgumentTypeError(f'Invalid shard, expected INDEX/COUNT with 0 <= INDEX < COUNT: {s}')
+    return int(index), int(count)
+
+
 def node_id_like(s: str) -> NodeIdLike:
     try:
         return int(s)
@@ -72,8 +121,24 @@ def generate_options(args: dict[str, Any]) -> LoggingOptions:
             return ViewKCFGOptions(args)
         case 'kast':
             return KastOptions(args)
+        case 'serve':
+            return ServeOptions(args)
         case 'run':
             return RunOptions(args)
+        case 'run-batch':
+            return RunBatchOptions(args)
+        case 'conformance':
+            return ConformanceOptions(args)
+        case 'conformance-report':
+            return ConformanceReportOptions(args)
+        case 'bench':
+            match args['bench_command']:
+                case 'record':
+                    return BenchRecordOptions(args)
+                case 'compare':
+                    return BenchCompareOptions(args)
+                case _:
+                    raise ValueError(f'Unrecognized bench command: {args["bench_command"]}')
         case _:
             raise ValueError(f'Unrecognized command: {command}')
 
@@ -97,8 +162,20 @@ def get_option_string_destination(command: str, option_string: str) -> str:
             option_string_destinations = ViewKCFGOptions.from_option_string()
         case 'kast':
             option_string_destinations = KastOptions.from_option_string()
+        case 'serve':
+            option_string_destinations = ServeOptions.from_option_string()
         case 'run':
             option_string_destinations = RunOptions.from_option_string()
+        case 'run-batch':
+            option_string_destinations = RunBatchOptions.from_option_string()
+        case 'conformance':
+            option_string_destinations = ConformanceOptions.from_option_string()
+        case 'conformance-report':
+            option_string_destinations = ConformanceReportOptions.from_option_string()
+        case 'bench':
+            option_string_destinations = (
+                BenchRecordOptions.from_option_string() | BenchCompareOptions.from_option_string()
+            )
 
     return option_string_destinations.get(option_string, option_string.replace('-', '_'))
 
@@ -125,8 +202,18 @@ def get_argument_type_setter(command: str, option_string: str) -> Callable[[str]
             option_types = ViewKCFGOptions.get_argument_type()
         case 'kast':
             option_types = KastOptions.get_argument_type()
+        case 'serve':
+            option_types = ServeOptions.get_argument_type()
         case 'run':
             option_types = RunOptions.get_argument_type()
+        case 'run-batch':
+            option_types = RunBatchOptions.get_argument_type()
+        case 'conformance':
+            option_types = ConformanceOptions.get_argument_type()
+        case 'conformance-report':
+            option_types = ConformanceReportOptions.get_argument_type()
+        case 'bench':
+            option_types = BenchRecordOptions.get_argument_type() | BenchCompareOptions.get_argument_type()
 
     return option_types.get(option_string, func)
 
@@ -177,6 +264,19 @@ def _create_argument_parser() -> ArgumentParser:
         action='store_true',
         help='Reinitialize CFGs even if they already exist.',
     )
+    prove_args.add_argument(
+        '--estimate',
+        dest='estimate',
+        default=None,
+        action='store_true',
+        help='Estimate the time to prove the claims on --workers workers from previous timings, without proving them.',
+    )
+    prove_args.add_argument(
+        '--proof-cache-dir',
+        dest='proof_cache_dir',
+        type=Path,
+        help='Directory of a cache of passed proofs, claims already proven against the same definition are restored.',
+    )
     prove_args.add_argument(
         '--max-frontier-parallel',
         type=int,
@@ -222,17 +322,19 @@ def _create_argument_parser() -> ArgumentParser:
         help='Run KEVM test/simulation.',
         parents=[
             kevm_cli_args.logging_args,
+            kevm_cli_args.parallel_args,
             kevm_cli_args.target_args,
             kevm_cli_args.evm_chain_args,
             kevm_cli_args.k_args,
+            kevm_cli_args.kore_cache_args,
             config_args.config_args,
         ],
     )
     run_args.add_argument('input_file', type=file_path, help='Path to input file.')
     run_args.add_argument(
         '--output',
-        type=KRunOutput,
-        choices=list(KRunOutput),
+        type=krun_output,
+        help='Output format, such as pretty, kore, json or none (default: pretty).',
     )
     run_args.add_argument(
         '--expand-macros',
@@ -255,6 +357,235 @@ def _create_argument_parser() -> ArgumentParser:
         action='store_true',
         help='Run GDB debugger for execution.',
     )
+    run_args.add_argument(
+        '--stream',
+        dest='stream',
+        default=None,
+        action='store_true',
+        help='Read the GST file incrementally and run its tests one at a time.',
+    )
+    run_args.add_argument(
+        '--schedules',
+        dest='schedules',
+        type=list_of(schedule, delim=','),
+        help='Comma-separated schedules to run the GST file under in parallel, overriding --schedule.',
+    )
+    run_args.add_argument(
+        '--profile-rules',
+        dest='profile_rules',
+        default=None,
+        action='store_true',
+        help='Print rule application counts instead of the output, needs target evm-semantics.llvm-profile.',
+    )
+    run_args.add_argument(
+        '--profile-stacks',
+        dest='profile_stacks',
+        type=Path,
+        help='With --profile-rules, write rule applications as collapsed stacks for flame graph tools to this file.',
+    )
+    run_args.add_argument(
+        '--profile-limit',
+        dest='profile_limit',
+        type=int,
+        help='With --profile-rules, print only this many of the most applied rules.',
+    )
+    run_args.add_argument(
+        '--trace-opcodes',
+        dest='trace_opcodes',
+        type=Path,
+        help=(
+            'Write each executed instruction as a JSON line [pc,opcode,gas,depth] to this file and print opcode '
+            'statistics instead of the output, needs target evm-semantics.llvm-trace.'
+        ),
+    )
+
+    run_batch_args = command_parser.add_parser(
+        'run-batch',
+        help='Run a batch of GeneralStateTest files on a pool of interpreter workers.',
+        parents=[
+            kevm_cli_args.logging_args,
+            kevm_cli_args.parallel_args,
+            kevm_cli_args.evm_chain_args,
+            kevm_cli_args.interpreter_args,
+            kevm_cli_args.kore_cache_args,
+            config_args.config_args,
+        ],
+    )
+    run_batch_args.add_argument('input_files', type=file_path, nargs='+', help='Paths to GST files.')
+    run_batch_args.add_argument(
+        '--max-pending',
+        dest='max_pending',
+        type=int,
+        help='Maximum number of files queued for the workers at once (default: twice the number of workers).',
+    )
+
+    conformance_args = command_parser.add_parser(
+        'conformance',
+        help='Run the conformance test suite, recording the result, wall time and peak RSS of each test.',
+        parents=[
+            kevm_cli_args.logging_args,
+            kevm_cli_args.parallel_args,
+            kevm_cli_args.interpreter_args,
+            config_args.config_args,
+        ],
+    )
+    conformance_args.add_argument('test_dir', type=dir_path, help='Path to a checkout of ethereum/tests.')
+    conformance_args.add_argument(
+        '--shard',
+        type=shard,
+        help='Only run shard INDEX/COUNT of the fixtures, for 0 <= INDEX < COUNT.',
+    )
+    conformance_args.add_argument(
+        '--manifest',
+        dest='manifest',
+        type=Path,
+        help='Write a JSON-lines manifest of the test results to this file.',
+    )
+    conformance_args.add_argument(
+        '--skip-list',
+        dest='skip_lists',
+        type=file_path,
+        action='append',
+        help='Skip the tests of a list such as tests/failing.llvm, can be given multiple times.',
+    )
+    conformance_args.add_argument(
+        '--timeout',
+        dest='timeout',
+        type=float,
+        help='Kill tests running for longer than this many seconds.',
+    )
+    conformance_args.add_argument(
+        '--normalize-gst',
+        dest='normalize',
+        default=None,
+        action='store_true',
+        help='Sort keys, drop ignored keys and decode hex strings of GST input before passing it to K.',
+    )
+    conformance_args.add_argument(
+        '--snapshot-pre-state',
+        dest='snapshot',
+        default=None,
+        action='store_true',
+        help='Run tests sharing a pre-state from a single serialized initial configuration.',
+    )
+    conformance_args.add_argument(
+        '--result-cache-dir',
+        dest='result_cache_dir',
+        type=Path,
+        help='Directory of a cache of test results, only tests whose input or kompiled definition changed are re-run.',
+    )
+    conformance_args.add_argument(
+        '--force-rerun',
+        dest='force_rerun',
+        default=None,
+        action='store_true',
+        help='Re-run all tests, refreshing the results in the result cache.',
+    )
+
+    conformance_report_args = command_parser.add_parser(
+        'conformance-report',
+        help='Merge conformance manifests and regenerate the slow and failing test lists from them.',
+        parents=[
+            kevm_cli_args.logging_args,
+            config_args.config_args,
+        ],
+    )
+    conformance_report_args.add_argument('manifests', type=file_path, nargs='+', help='Paths to manifests.')
+    conformance_report_args.add_argument(
+        '--output',
+        dest='output',
+        type=Path,
+        help='Write the merged manifest to this file.',
+    )
+    conformance_report_args.add_argument(
+        '--slow-list',
+        dest='slow_list',
+        type=Path,
+        help='Regenerate this list of slow tests, such as tests/slow.llvm.',
+    )
+    conformance_report_args.add_argument(
+        '--failing-list',
+        dest='failing_list',
+        type=Path,
+        help='Regenerate this list of failing tests, such as tests/failing.llvm.',
+    )
+    conformance_report_args.add_argument(
+        '--slow-threshold',
+        dest='slow_threshold',
+        type=float,
+        help='Classify tests running for longer than this many seconds as slow (default: 60).',
+    )
+
+    bench_args = command_parser.add_parser('bench', help='Record and compare timings of proofs and conformance runs.')
+    bench_command_parser = bench_args.add_subparsers(dest='bench_command', required=True)
+
+    bench_record_args = bench_command_parser.add_parser(
+        'record',
+        help='Run a command repeatedly, appending the wall time and peak RSS of each trial to a manifest.',
+        parents=[
+            kevm_cli_args.logging_args,
+            config_args.config_args,
+        ],
+    )
+    bench_record_args.add_argument('bench_args', nargs=REMAINDER, help='Command to run, after --.')
+    bench_record_args.add_argument(
+        '--manifest', dest='manifest', type=Path, required=True, help='Append the trials to this manifest.'
+    )
+    bench_record_args.add_argument(
+        '--name', dest='name', type=str, help='Name of the test in the manifest (default: the command).'
+    )
+    bench_record_args.add_argument(
+        '--trials', dest='trials', type=int, help='Number of times to run the command (default: 1).'
+    )
+
+    bench_compare_args = bench_command_parser.add_parser(
+        'compare',
+        help='Compare the time and peak RSS of tests in two sets of manifests, failing on significant regressions.',
+        parents=[
+            kevm_cli_args.logging_args,
+            config_args.config_args,
+        ],
+    )
+    bench_compare_args.add_argument(
+        '--baseline',
+        dest='baseline',
+        type=file_path,
+        action='append',
+        required=True,
+        help='Manifest of the baseline, repeat for more trials.',
+    )
+    bench_compare_args.add_argument(
+        '--candidate',
+        dest='candidate',
+        type=file_path,
+        action='append',
+        required=True,
+        help='Manifest of the candidate, repeat for more trials.',
+    )
+    bench_compare_args.add_argument(
+        '--confidence',
+        dest='confidence',
+        type=float,
+        help='Confidence level of the intervals regressions must be significant at (default: 0.95).',
+    )
+    bench_compare_args.add_argument(
+        '--time-threshold',
+        dest='time_threshold',
+        type=float,
+        help='Relative time increase to count as a regression (default: 0.035).',
+    )
+    bench_compare_args.add_argument(
+        '--memory-threshold',
+        dest='memory_threshold',
+        type=float,
+        help='Relative peak RSS increase to count as a regression (default: 0.05).',
+    )
+    bench_compare_args.add_argument(
+        '--min-time',
+        dest='min_time',
+        type=float,
+        help='Ignore tests taking less than this many seconds in both (default: 2.0).',
+    )
 
     kast_args = command_parser.add_parser(
         'kast',
@@ -264,6 +595,7 @@ def _create_argument_parser() -> ArgumentParser:
             kevm_cli_args.target_args,
             kevm_cli_args.evm_chain_args,
             kevm_cli_args.k_args,
+            kevm_cli_args.kore_cache_args,
             config_args.config_args,
         ],
     )
@@ -274,6 +606,34 @@ def _create_argument_parser() -> ArgumentParser:
         choices=list(PrintOutput),
     )
 
+    serve_args = command_parser.add_parser(
+        'serve',
+        help='Serve run, kast and gst-to-kore requests on a local socket, keeping the definitions loaded.',
+        parents=[
+            kevm_cli_args.logging_args,
+            kevm_cli_args.parallel_args,
+            kevm_cli_args.kore_cache_args,
+            config_args.config_args,
+        ],
+    )
+    serve_args.add_argument('--socket', type=Path, help='Path of a Unix socket to listen on.')
+    serve_args.add_argument('--port', type=int, help='TCP port to listen on, on localhost.')
+    serve_args.add_argument(
+        '--load-target',
+        dest='load_targets',
+        action='append',
+        choices=['llvm', 'haskell', 'haskell-standalone', 'foundry'],
+        help='Load the definition of a target on startup, can be given multiple times (default: llvm).',
+    )
+    serve_args.add_argument(
+        '--backend',
+        choices=['llvm', 'kllvm'],
+        help=(
+            'Run the llvm target in the kllvm runtime loaded into the server (kllvm, default), '
+            'or start an interpreter process per run (llvm).'
+        ),
+    )
+
     return parser
 
 
@@ -328,7 +688,7 @@ class RPCOptions(Options):
 
     @staticmethod
     def get_argument_type() -> dict[str, Callable]:
-        return {'fallback-on': list_of(FallbackReason, delim=',')}
+        return {'fallback-on': list_of(fallback_reason, delim=',')}
 
 
 class ExploreOptions(Options):
@@ -444,6 +804,7 @@ class EVMChainOptions(Options):
     chainid: int
     mode: str
     usegas: bool
+    normalize: bool
 
     @staticmethod
     def default() -> dict[str, Any]:
@@ -452,12 +813,14 @@ class EVMChainOptions(Options):
             'chainid': 1,
             'mode': 'NORMAL',
             'usegas': True,
+            'normalize': False,
         }
 
     @staticmethod
     def from_option_string() -> dict[str, str]:
         return {
             'no-gas': 'no_usegas',
+            'normalize-gst': 'normalize',
         }
 
 
@@ -553,12 +916,16 @@ class ProveOptions(
     KProveOptions,
 ):
     reinit: bool
+    estimate: bool
+    proof_cache_dir: Path | None
     max_frontier_parallel: int
 
     @staticmethod
     def default() -> dict[str, Any]:
         return {
             'reinit': False,
+            'estimate': False,
+            'proof_cache_dir': None,
             'max_frontier_parallel': 1,
         }
 
@@ -588,6 +955,7 @@ class ProveOptions(
             | ExploreOptions.get_argument_type()
             | SpecOptions.get_argument_type()
             | KProveOptions.get_argument_type()
+            | {'proof-cache-dir': Path}
         )
 
 
@@ -695,57 +1063,308 @@ class ViewKCFGOptions(
         return LoggingOptions.get_argument_type() | KOptions.get_argument_type() | SpecOptions.get_argument_type()
 
 
+class KoreCacheOptions(Options):
+    kore_cache_dir: Path | None
+    kore_cache_size: int | None
+
+    @staticmethod
+    def default() -> dict[str, Any]:
+        return {
+            'kore_cache_dir': None,
+            'kore_cache_size': None,
+        }
+
+    @staticmethod
+    def get_argument_type() -> dict[str, Callable]:
+        return {
+            'kore-cache-dir': Path,
+        }
+
+
 class RunOptions(
     LoggingOptions,
+    ParallelOptions,
     KOptions,
     EVMChainOptions,
     TargetOptions,
     SaveDirOptions,
+    KoreCacheOptions,
 ):
     input_file: Path
     output: KRunOutput
     expand_macros: bool
     debugger: bool
+    stream: bool
+    schedules: list[str] | None
+    profile_rules: bool
+    profile_stacks: Path | None
+    profile_limit: int | None
+    trace_opcodes: Path | None
 
     @staticmethod
     def default() -> dict[str, Any]:
+        from pyk.ktool.krun import KRunOutput
+
         return {
             'output': KRunOutput.PRETTY,
             'expand_macros': True,
             'debugger': False,
+            'stream': False,
+            'schedules': None,
+            'profile_rules': False,
+            'profile_stacks': None,
+            'profile_limit': None,
+            'trace_opcodes': None,
         }
 
     @staticmethod
     def from_option_string() -> dict[str, str]:
         return (
             LoggingOptions.from_option_string()
+            | ParallelOptions.from_option_string()
             | KOptions.from_option_string()
             | EVMChainOptions.from_option_string()
             | TargetOptions.from_option_string()
             | SaveDirOptions.from_option_string()
+            | KoreCacheOptions.from_option_string()
         )
 
     @staticmethod
     def get_argument_type() -> dict[str, Callable]:
         return (
             LoggingOptions.get_argument_type()
+            | ParallelOptions.get_argument_type()
             | KOptions.get_argument_type()
             | EVMChainOptions.get_argument_type()
             | TargetOptions.get_argument_type()
             | SaveDirOptions.get_argument_type()
+            | KoreCacheOptions.get_argument_type()
             | {
                 'input_file': file_path,
-                'output': KRunOutput,
+                'output': krun_output,
+                'schedules': list_of(schedule, delim=','),
+                'profile-stacks': Path,
+                'profile-limit': int,
+                'trace-opcodes': Path,
+            }
+        )
+
+
+class InterpreterOptions(Options):
+    backend: str
+    binary: bool
+    preload: bool
+
+    @staticmethod
+    def default() -> dict[str, Any]:
+        return {
+            'backend': 'llvm',
+            'binary': False,
+            'preload': False,
+        }
+
+    @staticmethod
+    def from_option_string() -> dict[str, str]:
+        return {
+            'binary-kore': 'binary',
+            'preload-pre-state': 'preload',
+        }
+
+
+class RunBatchOptions(
+    LoggingOptions,
+    ParallelOptions,
+    EVMChainOptions,
+    InterpreterOptions,
+    KoreCacheOptions,
+):
+    input_files: list[Path]
+    max_pending: int | None
+
+    @staticmethod
+    def default() -> dict[str, Any]:
+        return {
+            'max_pending': None,
+        }
+
+    @staticmethod
+    def from_option_string() -> dict[str, str]:
+        return (
+            LoggingOptions.from_option_string()
+            | ParallelOptions.from_option_string()
+            | EVMChainOptions.from_option_string()
+            | InterpreterOptions.from_option_string()
+            | KoreCacheOptions.from_option_string()
+        )
+
+    @staticmethod
+    def get_argument_type() -> dict[str, Callable]:
+        return (
+            LoggingOptions.get_argument_type()
+            | ParallelOptions.get_argument_type()
+            | EVMChainOptions.get_argument_type()
+            | InterpreterOptions.get_argument_type()
+            | KoreCacheOptions.get_argument_type()
+            | {
+                'input_files': list_of(file_path),
             }
         )
 
 
+class ConformanceOptions(
+    LoggingOptions,
+    ParallelOptions,
+    InterpreterOptions,
+):
+    test_dir: Path
+    shard: tuple[int, int] | None
+    manifest: Path | None
+    skip_lists: list[Path]
+    timeout: float | None
+    normalize: bool
+    snapshot: bool
+    result_cache_dir: Path | None
+    force_rerun: bool
+
+    @staticmethod
+    def default() -> dict[str, Any]:
+        return {
+            'shard': None,
+            'manifest': None,
+            'skip_lists': [],
+            'timeout': None,
+            'normalize': False,
+            'snapshot': False,
+            'result_cache_dir': None,
+            'force_rerun': False,
+        }
+
+    @staticmethod
+    def from_option_string() -> dict[str, str]:
+        return (
+            LoggingOptions.from_option_string()
+            | ParallelOptions.from_option_string()
+            | InterpreterOptions.from_option_string()
+            | {
+                'skip-list': 'skip_lists',
+                'normalize-gst': 'normalize',
+                'snapshot-pre-state': 'snapshot',
+            }
+        )
+
+    @staticmethod
+    def get_argument_type() -> dict[str, Callable]:
+        return (
+            LoggingOptions.get_argument_type()
+            | ParallelOptions.get_argument_type()
+            | InterpreterOptions.get_argument_type()
+            | {
+                'test_dir': dir_path,
+                'shard': shard,
+                'manifest': Path,
+                'skip-list': list_of(file_path),
+                'result-cache-dir': Path,
+            }
+        )
+
+
+class ConformanceReportOptions(LoggingOptions):
+    manifests: list[Path]
+    output: Path | None
+    slow_list: Path | None
+    failing_list: Path | None
+    slow_threshold: float
+
+    @staticmethod
+    def default() -> dict[str, Any]:
+        return {
+            'output': None,
+            'slow_list': None,
+            'failing_list': None,
+            'slow_threshold': 60.0,
+        }
+
+    @staticmethod
+    def from_option_string() -> dict[str, str]:
+        return LoggingOptions.from_option_string()
+
+    @staticmethod
+    def get_argument_type() -> dict[str, Callable]:
+        return LoggingOptions.get_argument_type() | {
+            'manifests': list_of(file_path),
+            'output': Path,
+            'slow-list': Path,
+            'failing-list': Path,
+        }
+
+
+class BenchRecordOptions(LoggingOptions):
+    bench_command: str
+    bench_args: list[str]
+    manifest: Path
+    name: str | None
+    trials: int
+
+    @staticmethod
+    def default() -> dict[str, Any]:
+        return {
+            'name': None,
+            'trials': 1,
+        }
+
+    @staticmethod
+    def from_option_string() -> dict[str, str]:
+        return LoggingOptions.from_option_string()
+
+    @staticmethod
+    def get_argument_type() -> dict[str, Callable]:
+        return LoggingOptions.get_argument_type() | {
+            'manifest': Path,
+            'trials': int,
+        }
+
+
+class BenchCompareOptions(LoggingOptions):
+    bench_command: str
+    baseline: list[Path]
+    candidate: list[Path]
+    confidence: float
+    time_threshold: float
+    memory_threshold: float
+    min_time: float
+
+    @staticmethod
+    def default() -> dict[str, Any]:
+        return {
+            'confidence': 0.95,
+            'time_threshold': 0.035,
+            'memory_threshold': 0.05,
+            'min_time': 2.0,
+        }
+
+    @staticmethod
+    def from_option_string() -> dict[str, str]:
+        return LoggingOptions.from_option_string()
+
+    @staticmethod
+    def get_argument_type() -> dict[str, Callable]:
+        return LoggingOptions.get_argument_type() | {
+            'baseline': list_of(file_path),
+            'candidate': list_of(file_path),
+            'confidence': float,
+            'time-threshold': float,
+            'memory-threshold': float,
+            'min-time': float,
+        }
+
+
 class KastOptions(
     LoggingOptions,
     TargetOptions,
     EVMChainOptions,
     KOptions,
     SaveDirOptions,
+    KoreCacheOptions,
 ):
     input_file: Path
     output: PrintOutput
@@ -764,6 +1383,7 @@ class KastOptions(
             | EVMChainOptions.from_option_string()
             | KOptions.from_option_string()
             | SaveDirOptions.from_option_string()
+            | KoreCacheOptions.from_option_string()
         )
 
     @staticmethod
@@ -774,12 +1394,52 @@ class KastOptions(
             | EVMChainOptions.get_argument_type()
             | TargetOptions.get_argument_type()
             | SaveDirOptions.get_argument_type()
+            | KoreCacheOptions.get_argument_type()
             | {
                 'input_file': file_path,
             }
         )
 
 
+class ServeOptions(LoggingOptions, ParallelOptions, KoreCacheOptions):
+    socket: Path | None
+    port: int | None
+    load_targets: list[str]
+    backend: str
+
+    @staticmethod
+    def default() -> dict[str, Any]:
+        return {
+            'socket': None,
+            'port': None,
+            'load_targets': ['llvm'],
+            'backend': 'kllvm',
+        }
+
+    @staticmethod
+    def from_option_string() -> dict[str, str]:
+        return (
+            LoggingOptions.from_option_string()
+            | ParallelOptions.from_option_string()
+            | KoreCacheOptions.from_option_string()
+            | {
+                'load-target': 'load_targets',
+            }
+        )
+
+    @staticmethod
+    def get_argument_type() -> dict[str, Callable]:
+        return (
+            LoggingOptions.get_argument_type()
+            | ParallelOptions.get_argument_type()
+            | KoreCacheOptions.get_argument_type()
+            | {
+                'socket': Path,
+                'load-target': list_of(str),
+            }
+        )
+
+
 class ConfigArgs:
     @cached_property
     def config_args(self) -> ArgumentParser:
@@ -807,6 +1467,47 @@ class KEVMCLIArgs(KCLIArgs):
         args.add_argument('--target', choices=['llvm', 'haskell', 'haskell-standalone', 'foundry'])
         return args
 
+    @cached_property
+    def kore_cache_args(self) -> ArgumentParser:
+        args = ArgumentParser(add_help=False)
+        args.add_argument(
+            '--kore-cache-dir',
+            dest='kore_cache_dir',
+            type=Path,
+            help='Directory of a cache of converted GST inputs, shareable between concurrent runs.',
+        )
+        args.add_argument(
+            '--kore-cache-size',
+            dest='kore_cache_size',
+            type=int,
+            help='Maximum size of the KORE cache in bytes before least recently used entries are evicted (default: 1 GiB).',
+        )
+        return args
+
+    @cached_property
+    def interpreter_args(self) -> ArgumentParser:
+        args = ArgumentParser(add_help=False)
+        args.add_argument(
+            '--backend',
+            choices=['llvm', 'kllvm'],
+            help='Run the LLVM interpreter binary per test (llvm) or the in-process kllvm runtime (kllvm).',
+        )
+        args.add_argument(
+            '--binary-kore',
+            dest='binary',
+            default=None,
+            action='store_true',
+            help='Exchange binary instead of textual KORE with the LLVM interpreter binary.',
+        )
+        args.add_argument(
+            '--preload-pre-state',
+            dest='preload',
+            default=None,
+            action='store_true',
+            help='Build the pre-state into the initial configuration instead of loading it through the semantics.',
+        )
+        return args
+
     @cached_property
     def k_args(self) -> ArgumentParser:
         args = super().definition_args
@@ -895,29 +1596,13 @@ class KEVMCLIArgs(KCLIArgs):
 
     @cached_property
     def evm_chain_args(self) -> ArgumentParser:
-        schedules = (
-            'DEFAULT',
-            'FRONTIER',
-            'HOMESTEAD',
-            'TANGERINE_WHISTLE',
-            'SPURIOUS_DRAGON',
-            'BYZANTIUM',
-            'CONSTANTINOPLE',
-            'PETERSBURG',
-            'ISTANBUL',
-            'BERLIN',
-            'LONDON',
-            'MERGE',
-            'SHANGHAI',
-            'CANCUN',
-        )
         modes = ('NORMAL', 'VMTESTS')
 
         args = ArgumentParser(add_help=False)
         args.add_argument(
             '--schedule',
-            choices=schedules,
-            help=f"schedule to use for execution [{'|'.join(schedules)}].",
+            choices=SCHEDULES,
+            help=f"schedule to use for execution [{'|'.join(SCHEDULES)}].",
         )
         args.add_argument('--chainid', type=int, help='chain ID to use for execution.')
         args.add_argument(
@@ -928,6 +1613,13 @@ class KEVMCLIArgs(KCLIArgs):
         args.add_argument(
             '--no-gas', default=None, action='store_false', dest='usegas', help='omit gas cost computations.'
         )
+        args.add_argument(
+            '--normalize-gst',
+            default=None,
+            action='store_true',
+            dest='normalize',
+            help='sort keys, drop ignored keys and decode hex strings of GST input before passing it to K.',
+        )
         return args
 
     @cached_property
@@ -989,7 +1681,7 @@ class KEVMCLIArgs(KCLIArgs):
         args.add_argument(
             '--fallback-on',
             dest='fallback_on',
-            type=list_of(FallbackReason, delim=','),
+            type=list_of(fallback_reason, delim=','),
             help='Comma-separated reasons to fallback from booster to kore, only usable with --use-booster. Options [Branching,Aborted,Stuck].',
         )
         args.add_argument(
@@ -19,4 +19,8 @@ PLUGIN_DIR: Final = KPROJ_DIR / 'plugin'
 INCLUDE_DIRS: Final = (EVM_SEMANTICS_DIR, PLUGIN_DIR)
 
 
+# The `ethereum/tests` submodule, when running from a checkout of the repository
+ETHEREUM_TESTS_DIR: Final = MODULE_DIR.parents[2] / 'tests' / 'ethereum-tests'
+
+
 NIX_LIBS: Final = os.getenv('NIX_LIBS')
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .interpreter import interpret_tests
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from concurrent.futures import Executor
+    from typing import Any, ContextManager, Final, TextIO
+
+    from .interpreter import GSTTestResult
+    from .result_cache import ResultCache
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+VM_TEST_DIR: Final = Path('BlockchainTests/GeneralStateTests/VMTests')
+ALL_TEST_DIR: Final = Path('BlockchainTests/GeneralStateTests')
+
+ALL_TESTS: Final = '*'
+
+
+@dataclass(frozen=True)
+class Fixture:
+    path: Path
+    schedule: str
+    mode: str
+
+
+def discover_fixtures(test_dir: Path) -> list[Fixture]:
+    """Return the conformance fixtures of an `ethereum/tests` checkout, with paths relative to it, sorted by path."""
+    paths = sorted(path.relative_to(test_dir) for path in (test_dir / ALL_TEST_DIR).glob('**/*.json'))
+    return [fixture_of(path) for path in paths]
+
+
+def fixture_of(path: Path) -> Fixture:
+    """Return the fixture at a path relative to an `ethereum/tests` checkout, with the schedule and mode to run it."""
+    if path.parent.parent == VM_TEST_DIR:
+        return Fixture(path, 'DEFAULT', 'VMTESTS')
+    return Fixture(path, 'CANCUN', 'NORMAL')
+
+
+def select_tests(test_dir: Path, tests: Iterable[tuple[str, str]]) -> Iterator[tuple[Fixture, str, Any]]:
+    """Read the tests of a test list such as `tests/failing.llvm` from an `ethereum/tests` checkout, in list order.
+
+    Raises `ValueError` if a test is not in its fixture.
+    """
+    gst_data: dict[str, Any] = {}
+    for fixture_path, test_name in tests:
+        if fixture_path not in gst_data:
+            gst_data[fixture_path] = json.loads((test_dir / fixture_path).read_text())
+        fixture = fixture_of(Path(fixture_path))
+        if test_name == ALL_TESTS:
+            yield from ((fixture, name, test) for name, test in gst_data[fixture_path].items())
+        elif test_name in gst_data[fixture_path]:
+            yield fixture, test_name, gst_data[fixture_path][test_name]
+        else:
+            raise ValueError(f'Test not found in fixture {fixture_path}: {test_name}')
+
+
+def shard_fixtures(fixtures: Iterable[Fixture], shard: int, shards: int) -> list[Fixture]:
+    """Return the fixtures of shard `shard` out of `shards`.
+
+    Fixtures are assigned to shards by a hash of their path, so every machine computes the same assignment, and adding
+    or removing a fixture does not move the others between shards.
+    """
+    if not 0 <= shard < shards:
+        raise ValueError(f'Invalid shard: {shard}/{shards}')
+    return [fixture for fixture in fixtures if _shard_of(fixture.path, shards) == shard]
+
+
+def _shard_of(path: Path, shards: int) -> int:
+    digest = hashlib.sha256(path.as_posix().encode()).digest()
+    return int.from_bytes(digest[:8], 'big') % shards
+
+
+class ResultStatus(Enum):
+    PASSED = 'passed'
+    FAILED = 'failed'
+    ERROR = 'error'
+    TIMEOUT = 'timeout'
+    SKIPPED = 'skipped'
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """A line of a conformance manifest: the result, wall time in seconds and peak RSS in KiB of a single test."""
+
+    fixture: str
+    test: str
+    status: ResultStatus
+    exit_code: int | None = None
+    time: float | None = None
+    max_rss: int | None = None
+    error: str | None = None
+    cached: bool = False
+
+    @staticmethod
+    def from_result(fixture: Path, result: GSTTestResult) -> ManifestEntry:
+        if result.skipped:
+            status = ResultStatus.SKIPPED
+        elif result.timed_out:
+            status = ResultStatus.TIMEOUT
+        elif result.error is not None:
+            status = ResultStatus.ERROR
+        elif result.passed:
+            status = ResultStatus.PASSED
+        else:
+            status = ResultStatus.FAILED
+        return ManifestEntry(
+            fixture=fixture.as_posix(),
+            test=result.test_name,
+            status=status,
+            exit_code=result.exit_code,
+            time=result.time,
+            max_rss=result.max_rss,
+            error=result.error,
+            cached=result.cached,
+        )
+
+    @staticmethod
+    def from_dict(dct: Mapping[str, Any]) -> ManifestEntry:
+        return ManifestEntry(
+            fixture=dct['fixture'],
+            test=dct['test'],
+            status=ResultStatus(dct['status']),
+            exit_code=dct.get('exit_code'),
+            time=dct.get('time'),
+            max_rss=dct.get('max_rss'),
+            error=dct.get('error'),
+            cached=dct.get('cached', False),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        dct: dict[str, Any] = {'fixture': self.fixture, 'test': self.test, 'status': self.status.value}
+        optional = {'exit_code': self.exit_code, 'time': self.time, 'max_rss': self.max_rss, 'error': self.error}
+        dct.update((key, value) for key, value in optional.items() if value is not None)
+        if self.cached:
+            dct['cached'] = True
+        return dct
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.fixture, self.test
+
+
+def run_conformance(
+    test_dir: Path,
+    fixtures: Iterable[Fixture],
+    *,
+    workers: int = 1,
+    skip: Mapping[str, Iterable[str]] | None = None,
+    chainid: int = 1,
+    usegas: bool = True,
+    binary: bool = False,
+    normalize: bool = False,
+    preload: bool = False,
+    snapshot: bool = False,
+    timeout: float | None = None,
+    result_cache: ResultCache | None = None,
+) -> Iterator[ManifestEntry]:
+    """Run the tests of each fixture on the LLVM interpreter, measuring the wall time and peak RSS of each test.
+
+    `skip` maps fixture paths, as in the manifest, to the names of tests not to run, or to `ALL_TESTS`.
+    """
+    skip = skip if skip is not None else {}
+    executor_context: ContextManager[Executor | None]
+    executor_context = ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+
+    with executor_context as executor:
+        for fixture in fixtures:
+            fixture_path = fixture.path.as_posix()
+            _LOGGER.info(f'Running tests: {fixture_path}')
+            try:
+                gst_data = json.loads((test_dir / fixture.path).read_text())
+            except (OSError, ValueError) as err:
+                _LOGGER.error(f'Failed to read fixture: {fixture_path}', exc_info=True)
+                yield ManifestEntry(fixture_path, ALL_TESTS, ResultStatus.ERROR, error=f'{type(err).__name__}: {err}')
+                continue
+
+            skipped_tests = set(skip.get(fixture_path, ()))
+            for result in interpret_tests(
+                gst_data,
+                fixture.schedule,
+                fixture.mode,
+                chainid,
+                usegas,
+                executor=executor,
+                skip=gst_data.keys() if ALL_TESTS in skipped_tests else skipped_tests,
+                binary=binary,
+                normalize=normalize,
+                preload=preload,
+                snapshot=snapshot,
+                measure=True,
+                timeout=timeout,
+                result_cache=result_cache,
+            ):
+                yield ManifestEntry.from_result(fixture.path, result)
+
+
+def write_manifest_entry(manifest: TextIO, entry: ManifestEntry) -> None:
+    manifest.write(json.dumps(entry.to_dict(), sort_keys=True) + '\n')
+    manifest.flush()
+
+
+def read_manifest(manifest_file: Path) -> list[ManifestEntry]:
+    with manifest_file.open() as manifest:
+        return [ManifestEntry.from_dict(json.loads(line)) for line in manifest if line.strip()]
+
+
+def merge_manifests(manifests: Iterable[Iterable[ManifestEntry]]) -> list[ManifestEntry]:
+    """Merge the manifests of several shards or runs, sorted by fixture and test.
+
+    For a test occurring in several manifests, the last measured entry wins over earlier and skipped ones.
+    """
+    merged: dict[tuple[str, str], ManifestEntry] = {}
+    for manifest in manifests:
+        for entry in manifest:
+            prev = merged.get(entry.key)
+            if prev is None or entry.status is not ResultStatus.SKIPPED or prev.status is ResultStatus.SKIPPED:
+                merged[entry.key] = entry
+    return [merged[key] for key in sorted(merged)]
+
+
+def read_test_list(list_file: Path) -> list[tuple[str, str]]:
+    """Read a list of tests such as `tests/failing.llvm`, with rows `fixture,test` where `test` may be `ALL_TESTS`."""
+    with list_file.open(newline='') as file:
+        return [(row[0], row[1]) for row in csv.reader(file) if row]
+
+
+def write_test_list(list_file: Path, tests: Iterable[tuple[str, str]]) -> None:
+    with list_file.open('w', newline='') as file:
+        csv.writer(file, lineterminator='\n').writerows(tests)
+
+
+def skipped_tests(test_lists: Iterable[Iterable[tuple[str, str]]]) -> dict[str, list[str]]:
+    skip: dict[str, list[str]] = {}
+    for test_list in test_lists:
+        for fixture, test in test_list:
+            skip.setdefault(fixture, []).append(test)
+    return skip
+
+
+def classify_tests(
+    entries: Iterable[ManifestEntry],
+    *,
+    slow_threshold: float,
+    slow: Iterable[tuple[str, str]] = (),
+    failing: Iterable[tuple[str, str]] = (),
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Regenerate the slow and failing test lists from measured results.
+
+    A test is slow if it timed out or ran for longer than `slow_threshold` seconds, and failing otherwise if it did not
+    pass. Tests without a measurement keep their classification from `slow` and `failing`. Measured fixtures whose
+    tests are all in the same list are listed as `ALL_TESTS`. Rows that remain in a list keep their order, new rows
+    are appended sorted.
+    """
+    entries = list(entries)
+    measured = {entry.key: entry for entry in entries if entry.status is not ResultStatus.SKIPPED}
+    measured_fixtures = {fixture for fixture, _ in measured}
+    fixture_tests: dict[str, set[str]] = {}
+    for entry in entries:
+        if entry.fixture in measured_fixtures and entry.test != ALL_TESTS:
+            fixture_tests.setdefault(entry.fixture, set()).add(entry.test)
+
+    new_slow: set[tuple[str, str]] = set()
+    new_failing: set[tuple[str, str]] = set()
+    for old_list, new_list in ((slow, new_slow), (failing, new_failing)):
+        for fixture, test in old_list:
+            unmeasured = fixture not in measured_fixtures if test == ALL_TESTS else (fixture, test) not in measured
+            if unmeasured:
+                new_list.add((fixture, test))
+
+    for entry in measured.values():
+        if entry.status is ResultStatus.TIMEOUT or (entry.time is not None and entry.time > slow_threshold):
+            new_slow.add(entry.key)
+        elif entry.status is not ResultStatus.PASSED:
+            new_failing.add(entry.key)
+
+    return (
+        _ordered_test_list(slow, _collapse_fixtures(new_slow, fixture_tests)),
+        _ordered_test_list(failing, _collapse_fixtures(new_failing, fixture_tests)),
+    )
+
+
+def _collapse_fixtures(tests: set[tuple[str, str]], fixture_tests: Mapping[str, set[str]]) -> set[tuple[str, str]]:
+    listed: dict[str, set[str]] = {}
+    for fixture, test in tests:
+        listed.setdefault(fixture, set()).add(test)
+
+    res: set[tuple[str, str]] = set()
+    for fixture, names in listed.items():
+        if ALL_TESTS in names or fixture_tests.get(fixture) and fixture_tests[fixture] <= names:
+            res.add((fixture, ALL_TESTS))
+        else:
+            res.update((fixture, name) for name in names)
+    return res
+
+
+def _ordered_test_list(old: Iterable[tuple[str, str]], new: set[tuple[str, str]]) -> list[tuple[str, str]]:
+    kept = [row for row in dict.fromkeys(old) if row in new]
+    return kept + sorted(new - set(kept))
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pyk.kore.prelude import (
+    BYTES,
+    INT,
+    SORT_JSON,
+    SORT_K_ITEM,
+    bytes_dv,
+    inj,
+    int_dv,
+    json_entry,
+    json_key,
+    json_list,
+    json_object,
+    json_to_kore,
+    jsons,
+    map_pattern,
+)
+from pyk.kore.syntax import App, SortApp
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from typing import Any, Final
+
+    from pyk.kore.syntax import Pattern
+
+
+SORT_MAP: Final = SortApp('SortMap')
+SORT_ACCOUNT_CODE: Final = SortApp('SortAccountCode')
+
+POW160: Final = 2**160
+
+# Keys dropped one at a time by `#discardKeys` in `driver.md`
+DISCARD_KEYS: Final = frozenset(
+    [
+        '//',
+        '_info',
+        'callcreates',
+        'sealEngine',
+        'transactionSequence',
+        'chainname',
+        'expectException',
+        'lastblockhash',
+    ]
+)
+
+_DECIMAL: Final = re.compile(r'-?[0-9]+')
+_HEX: Final = re.compile(r'[0-9a-fA-F]*')
+
+
+@dataclass(frozen=True)
+class IntMap:
+    """A `Map{Int, Int}` value embedded into `JSON`, as produced by `#parseMap`."""
+
+    entries: dict[int, int]
+
+
+def normalize_gst(gst_data: Mapping[str, Any]) -> dict[str, Any]:
+    """Do the bookkeeping of `driver.md` on the GST data upfront.
+
+    Each test has its keys sorted and discarded keys removed, and hex strings are decoded into `int`, `bytes` and
+    `IntMap` values wherever the semantics would unconditionally parse them. The result is converted to KORE with
+    `normalized_json_to_kore`.
+    """
+    return {test_name: _normalize_test(test) for test_name, test in gst_data.items()}
+
+
+def normalized_json_to_kore(data: Any) -> Pattern:
+    match data:
+        case bytes():
+            return inj(BYTES, SORT_JSON, bytes_dv(data))
+        case IntMap():
+            return inj(SORT_MAP, SORT_JSON, _int_map_to_kore(data))
+        case list():
+            return json_list(jsons(normalized_json_to_kore(elem) for elem in data))
+        case dict():
+            return json_object(
+                jsons(json_entry(json_key(key), normalized_json_to_kore(value)) for key, value in data.items())
+            )
+        case _:
+            return json_to_kore(data)
+
+
+def pre_state_to_kore(pre: Any) -> Pattern | None:
+    """Build the contents of the `<accounts>` cell that `load "pre"` would produce for the given pre-state.
+
+    Returns `None` if the pre-state cannot be loaded faithfully upfront, in which case it should be left to the
+    semantics.
+    """
+    if type(pre) is not dict:
+        return None
+
+    accounts: dict[int, Pattern] = {}
+    for acct_id, acct in pre.items():
+        parsed_id = _parse_hex_word(acct_id)
+        if type(parsed_id) is not int or type(acct) is not dict:
+            return None
+        # `#parseAddr` chops the account ID to 160 bits, `mkAcct` fails on accounts that already exist
+        parsed_id %= POW160
+        if parsed_id in accounts:
+            return None
+        account = _account_cell(parsed_id, _normalize_account(acct))
+        if account is None:
+            return None
+        accounts[parsed_id] = account
+
+    return map_pattern(
+        *(
+            (App("Lbl'-LT-'acctID'-GT-'", (), (int_dv(acct_id),)), account)
+            for acct_id, account in sorted(accounts.items())
+        ),
+        cell='AccountCell',
+    )
+
+
+def _account_cell(acct_id: int, acct: dict[str, Any]) -> Pattern | None:
+    if not acct.keys() <= {'balance', 'code', 'nonce', 'storage'}:
+        return None
+    balance = acct.get('balance', 0)
+    code = acct.get('code', b'')
+    nonce = acct.get('nonce', 0)
+    storage = acct.get('storage', IntMap({}))
+    if type(balance) is not int or type(code) is not bytes or type(nonce) is not int or type(storage) is not IntMap:
+        return None
+
+    storage_pattern = _int_map_to_kore(storage)
+    return App(
+        "Lbl'-LT-'account'-GT-'",
+        (),
+        (
+            App("Lbl'-LT-'acctID'-GT-'", (), (int_dv(acct_id),)),
+            App("Lbl'-LT-'balance'-GT-'", (), (int_dv(balance),)),
+            App("Lbl'-LT-'code'-GT-'", (), (inj(BYTES, SORT_ACCOUNT_CODE, bytes_dv(code)),)),
+            App("Lbl'-LT-'storage'-GT-'", (), (storage_pattern,)),
+            App("Lbl'-LT-'origStorage'-GT-'", (), (storage_pattern,)),
+            App("Lbl'-LT-'transientStorage'-GT-'", (), (map_pattern(),)),
+            App("Lbl'-LT-'nonce'-GT-'", (), (int_dv(nonce),)),
+        ),
+    )
+
+
+def _int_map_to_kore(int_map: IntMap) -> Pattern:
+    return map_pattern(
+        *(
+            (inj(INT, SORT_K_ITEM, int_dv(key)), inj(INT, SORT_K_ITEM, int_dv(value)))
+            for key, value in int_map.entries.items()
+        )
+    )
+
+
+def _normalize_test(test: Any) -> Any:
+    if type(test) is not dict:
+        return test
+    # `run` sorts the keys of each test with `qsortJSONs`
+    return dict(sorted(_normalize_entries(test).items()))
+
+
+def _normalize_entries(entries: dict[str, Any]) -> dict[str, Any]:
+    res = {}
+    for key, value in entries.items():
+        if key in DISCARD_KEYS:
+            continue
+        normalizer = _ENTRY_NORMALIZERS.get(key)
+        res[key] = normalizer(value) if normalizer is not None else value
+    return res
+
+
+def _normalize_object(value_normalizers: Mapping[str, Callable[[str], Any]]) -> Callable[[Any], Any]:
+    def normalize(obj: Any) -> Any:
+        if type(obj) is not dict:
+            return obj
+        return {key: _normalize_str(value, value_normalizers.get(key)) for key, value in obj.items()}
+
+    return normalize
+
+
+def _normalize_str(value: Any, normalizer: Callable[[str], Any] | None) -> Any:
+    if normalizer is None or type(value) is not str:
+        return value
+    return normalizer(value)
+
+
+def _normalize_accounts(accounts: Any) -> Any:
+    if type(accounts) is not dict:
+        return accounts
+    # Account IDs are kept as strings, as `load "pre"` and `check` only match on `String` keys
+    return {acct_id: _normalize_account(acct) for acct_id, acct in accounts.items()}
+
+
+def _normalize_account(acct: Any) -> Any:
+    if type(acct) is not dict:
+        return acct
+    res = _normalize_object({'balance': _parse_word, 'nonce': _parse_word, 'code': _parse_byte_stack})(acct)
+    if type(storage := res.get('storage')) is dict:
+        res['storage'] = _parse_map(storage)
+    return res
+
+
+def _normalize_blocks(blocks: Any) -> Any:
+    if type(blocks) is not list:
+        return blocks
+    return [_normalize_entries(block) if type(block) is dict else block for block in blocks]
+
+
+def _normalize_block_header(header: Any) -> Any:
+    if type(header) is not dict:
+        return header
+    return {key: _normalize_str(value, _parse_byte_stack) for key, value in header.items()}
+
+
+def _normalize_genesis_block_header(header: Any) -> Any:
+    if type(header) is not dict or 'hash' not in header:
+        return header
+    # All keys but `hash` are ignored by `check "genesisBlockHeader"`
+    hash = header['hash']
+    if type(hash) is str and type(parsed := _parse_byte_stack(hash)) is bytes:
+        return {'hash': int.from_bytes(parsed, 'big')}
+    return {'hash': hash}
+
+
+def _normalize_transactions(transactions: Any) -> Any:
+    match transactions:
+        case list():
+            return [_normalize_transactions(transaction) for transaction in transactions]
+        case dict():
+            return {key: _normalize_str(value, _parse_byte_stack) for key, value in transactions.items()}
+        case _:
+            return transactions
+
+
+def _parse_word(s: str) -> int | str:
+    if not s:
+        return 0
+    if s.startswith('0x'):
+        return _parse_hex_word(s)
+    if _DECIMAL.fullmatch(s):
+        return int(s)
+    return s
+
+
+def _parse_hex_word(s: str) -> int | str:
+    if s in ('', '0x'):
+        return 0
+    digits = s.replace('0x', '')
+    if digits and _HEX.fullmatch(digits):
+        return int(digits, 16)
+    return s
+
+
+def _parse_byte_stack(s: str) -> bytes | str:
+    digits = s.replace('0x', '')
+    if not _HEX.fullmatch(digits):
+        return s
+    if len(digits) % 2:
+        digits = '0' + digits
+    return bytes.fromhex(digits)
+
+
+def _parse_map(storage: dict[str, Any]) -> IntMap | dict[str, Any]:
+    entries: dict[int, int] = {}
+    # `#parseMap` folds from the right, so the first occurrence of a key takes precedence
+    for key, value in reversed(storage.items()):
+        parsed_key = _parse_hex_word(key)
+        parsed_value = _parse_hex_word(value) if type(value) is str else None
+        if type(parsed_key) is not int or type(parsed_value) is not int:
+            return storage
+        if parsed_value != 0:
+            entries[parsed_key] = parsed_value
+    return IntMap(dict(sorted(entries.items())))
+
+
+_ENTRY_NORMALIZERS: Final[dict[str, Callable[[Any], Any]]] = {
+    'pre': _normalize_accounts,
+    'post': _normalize_accounts,
+    'postState': _normalize_accounts,
+    'expect': _normalize_accounts,
+    'export': _normalize_accounts,
+    'expet': _normalize_accounts,
+    'env': _normalize_object(
+        {
+            'currentTimestamp': _parse_word,
+            'currentGasLimit': _parse_word,
+            'currentNumber': _parse_word,
+            'currentDifficulty': _parse_word,
+            'currentBaseFee': _parse_word,
+            'currentCoinbase': _parse_hex_word,
+            'previousHash': _parse_hex_word,
+        }
+    ),
+    'exec': _normalize_object(
+        {
+            'gas': _parse_word,
+            'gasPrice': _parse_word,
+            'value': _parse_word,
+            'address': _parse_hex_word,
+            'caller': _parse_hex_word,
+            'origin': _parse_hex_word,
+            'code': _parse_byte_stack,
+            'data': _parse_byte_stack,
+        }
+    ),
+    'gas': lambda value: _normalize_str(value, _parse_word),
+    'out': lambda value: _normalize_str(value, _parse_byte_stack),
+    'blocknumber': lambda value: _normalize_str(value, _parse_word),
+    'blocks': _normalize_blocks,
+    'rlp_decoded': lambda value: _normalize_entries(value) if type(value) is dict else value,
+    'blockHeader': _normalize_block_header,
+    'genesisBlockHeader': _normalize_genesis_block_header,
+    'transactions': _normalize_transactions,
+}
@@ -4,6 +4,8 @@ import json
 import logging
 import sys
 from argparse import ArgumentParser
+from dataclasses import dataclass
+from functools import cache, cached_property
 from typing import TYPE_CHECKING
 
 from pyk.cli.utils import file_path
@@ -11,11 +13,14 @@ from pyk.kore.prelude import BOOL, INT, SORT_JSON, SORT_K_ITEM, bool_dv, inj, in
 from pyk.kore.syntax import App, SortApp
 
 from .cli import KEVMCLIArgs
+from .gst_normalize import normalize_gst, normalized_json_to_kore
+from .kllvm import kllvm_available, kore_to_binary
 
 if TYPE_CHECKING:
     from argparse import Namespace
+    from collections.abc import Iterator
     from pathlib import Path
-    from typing import Any, Final
+    from typing import Any, Final, TextIO
 
     from pyk.kore.syntax import Pattern
 
@@ -29,19 +34,149 @@ SORT_MODE: Final = SortApp('SortMode')
 SORT_ETHEREUM_SIMULATION: Final = SortApp('SortEthereumSimulation')
 
 
-def gst_to_kore(gst_data: Any, schedule: str, mode: str, chainid: int, usegas: bool) -> App:
-    return kore_pgm_to_kore(json_to_kore(gst_data), SORT_JSON, schedule, mode, chainid, usegas)
+def gst_to_kore(gst_data: Any, schedule: str, mode: str, chainid: int, usegas: bool, *, normalize: bool = False) -> App:
+    return prepare_gst(gst_data, normalize=normalize).to_kore(schedule, mode, chainid, usegas)
+
+
+def prepare_gst(gst_data: Any, *, normalize: bool = False) -> PreparedProgram:
+    pgm = normalized_json_to_kore(normalize_gst(gst_data)) if normalize else json_to_kore(gst_data)
+    return PreparedProgram(pgm, SORT_JSON)
+
+
+def gst_to_kore_stream(
+    gst_file: TextIO, schedule: str, mode: str, chainid: int, usegas: bool, *, normalize: bool = False
+) -> Iterator[tuple[str, App]]:
+    for test_name, test in iter_gst_tests(gst_file):
+        yield test_name, gst_to_kore({test_name: test}, schedule, mode, chainid, usegas, normalize=normalize)
+
+
+def iter_gst_tests(gst_file: TextIO, *, chunk_size: int = 1 << 20) -> Iterator[tuple[str, Any]]:
+    stream = _JSONStream(gst_file, chunk_size)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+    while True:
+        test_name = stream.decode()
+        if type(test_name) is not str:
+            raise ValueError(f'Expected test name, got: {test_name!r}')
+        stream.expect(':')
+        yield test_name, stream.decode()
+        if stream.peek() == '}':
+            return
+        stream.expect(',')
+
+
+class _JSONStream:
+    _file: TextIO
+    _chunk_size: int
+    _decoder: json.JSONDecoder
+    _buf: str
+    _pos: int
+    _eof: bool
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in ' \t\n\r':
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError('Unexpected end of JSON input')
+
+    def expect(self, char: str) -> None:
+        actual = self.peek()
+        if actual != char:
+            raise ValueError(f'Expected {char!r} in JSON input, got: {actual!r}')
+        self._pos += 1
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A value ending exactly at the buffer end might be a truncated number
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        # Grow geometrically so that decoding a large value is retried only logarithmically often
+        chunk = self._file.read(max(self._chunk_size, len(self._buf) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
 
 
 def kore_pgm_to_kore(pgm: Pattern, pattern_sort: SortApp, schedule: str, mode: str, chainid: int, usegas: bool) -> App:
-    config = {
-        '$PGM': inj(pattern_sort, SORT_K_ITEM, pgm),
+    return PreparedProgram(pgm, pattern_sort).to_kore(schedule, mode, chainid, usegas)
+
+
+@dataclass(frozen=True)
+class PreparedProgram:
+    """A `$PGM` converted to KORE once, from which initial configurations for any chain options are created cheaply.
+
+    `to_kore_text` splices the serialized program into a cached textual configuration template, so the program is
+    only serialized once, however many schedules, modes and chain IDs it is run under.
+    """
+
+    pgm: Pattern
+    pattern_sort: SortApp
+
+    def to_kore(self, schedule: str, mode: str, chainid: int, usegas: bool) -> App:
+        return top_cell_initializer(
+            _config(inj(self.pattern_sort, SORT_K_ITEM, self.pgm), schedule, mode, chainid, usegas)
+        )
+
+    def to_kore_text(self, schedule: str, mode: str, chainid: int, usegas: bool) -> str:
+        prefix, suffix = _config_text_template(self.pattern_sort, schedule, mode, chainid, usegas)
+        return prefix + self.pgm_text + suffix
+
+    def precompute(self) -> None:
+        """Serialize the program now, e.g. before `to_kore_text` is called from several threads."""
+        self.pgm_text
+
+    @cached_property
+    def pgm_text(self) -> str:
+        return self.pgm.text
+
+
+_PGM_TEXT_PLACEHOLDER: Final = App("Lbl'Hash'pgmPlaceholder")
+
+
+@cache
+def _config_text_template(
+    pattern_sort: SortApp, schedule: str, mode: str, chainid: int, usegas: bool
+) -> tuple[str, str]:
+    config = _config(inj(pattern_sort, SORT_K_ITEM, _PGM_TEXT_PLACEHOLDER), schedule, mode, chainid, usegas)
+    prefix, suffix = top_cell_initializer(config).text.split(_PGM_TEXT_PLACEHOLDER.text)
+    return prefix, suffix
+
+
+def _config(pgm: Pattern, schedule: str, mode: str, chainid: int, usegas: bool) -> dict[str, Pattern]:
+    return {
+        '$PGM': pgm,
         '$SCHEDULE': inj(SORT_SCHEDULE, SORT_K_ITEM, _schedule_to_kore(schedule)),
         '$MODE': inj(SORT_MODE, SORT_K_ITEM, _mode_to_kore(mode)),
         '$CHAINID': inj(INT, SORT_K_ITEM, int_dv(chainid)),
         '$USEGAS': inj(BOOL, SORT_K_ITEM, bool_dv(usegas)),
     }
-    return top_cell_initializer(config)
 
 
 def _schedule_to_kore(schedule: str) -> App:
@@ -55,17 +190,52 @@ def _mode_to_kore(mode: str) -> App:
 def main() -> None:
     sys.setrecursionlimit(15000000)
     args = _parse_args()
-    _exec_gst_to_kore(args.input_file, args.schedule, args.mode, args.chainid, args.usegas)
+    _exec_gst_to_kore(
+        args.input_file,
+        args.schedule,
+        args.mode,
+        args.chainid,
+        args.usegas,
+        args.binary_kore,
+        args.stream,
+        bool(args.normalize),
+    )
+
+
+def _exec_gst_to_kore(
+    input_file: Path,
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    binary_kore: bool = False,
+    stream: bool = False,
+    normalize: bool = False,
+) -> None:
+    binary_kore = binary_kore and kllvm_available()
 
+    if stream:
+        with input_file.open() as f:
+            for test_name, kore in gst_to_kore_stream(f, schedule, mode, chainid, usegas, normalize=normalize):
+                _write_kore(kore, binary_kore)
+                _LOGGER.info(f'Finished writing KORE for test: {test_name}')
+        return
 
-def _exec_gst_to_kore(input_file: Path, schedule: str, mode: str, chainid: int, usegas: bool) -> None:
     gst_data = json.loads(input_file.read_text())
-    kore = gst_to_kore(gst_data, schedule, mode, chainid, usegas)
-    kore.write(sys.stdout)
-    sys.stdout.write('\n')
+    kore = gst_to_kore(gst_data, schedule, mode, chainid, usegas, normalize=normalize)
+    _write_kore(kore, binary_kore)
     _LOGGER.info('Finished writing KORE')
 
 
+def _write_kore(kore: App, binary_kore: bool) -> None:
+    if binary_kore:
+        sys.stdout.buffer.write(kore_to_binary(kore))
+        sys.stdout.buffer.flush()
+    else:
+        kore.write(sys.stdout)
+        sys.stdout.write('\n')
+
+
 def _parse_args() -> Namespace:
     kevm_cli_args = KEVMCLIArgs()
     parser = ArgumentParser(
@@ -73,6 +243,20 @@ def _parse_args() -> Namespace:
         parents=[kevm_cli_args.evm_chain_args],
     )
     parser.add_argument('input_file', type=file_path, help='path to GST')
+    parser.add_argument(
+        '--binary-kore',
+        dest='binary_kore',
+        default=False,
+        action='store_true',
+        help='emit binary KORE instead of text, falling back to text if evm-semantics.kllvm is not built.',
+    )
+    parser.add_argument(
+        '--stream',
+        dest='stream',
+        default=False,
+        action='store_true',
+        help='read the GST incrementally and emit one KORE configuration per test.',
+    )
     return parser.parse_args()
 
 
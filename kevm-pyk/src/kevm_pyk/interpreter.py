@@ -1,32 +1,711 @@
 from __future__ import annotations
 
+import json
+import logging
+import os
+import re
+import signal
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from enum import Enum
+from functools import cache
+from subprocess import CompletedProcess
+from tempfile import NamedTemporaryFile, TemporaryFile
+from threading import Event, Timer
 from typing import TYPE_CHECKING
 
 from pyk.kdist import kdist
 from pyk.kore.parser import KoreParser
+from pyk.kore.prelude import JSON_NULL, SORT_JSON, json_to_kore
+from pyk.kore.syntax import DV, App
 from pyk.utils import run_process_2
 
-from .gst_to_kore import gst_to_kore
+from .gst_normalize import normalize_gst, normalized_json_to_kore, pre_state_to_kore
+from .gst_to_kore import gst_to_kore, kore_pgm_to_kore
+from .kllvm import binary_to_llvm, kllvm_available, kllvm_runtime, kore_to_binary
 
 if TYPE_CHECKING:
-    from subprocess import CompletedProcess
-    from typing import Any
+    from collections.abc import Callable, Container, Iterable, Iterator, Mapping
+    from concurrent.futures import Executor, Future
+    from pathlib import Path
+    from typing import Any, Final
 
+    from pyk.kllvm.ast import Pattern as LLVMPattern
     from pyk.kore.syntax import Pattern
 
+    from .kore_cache import KoreCache
+    from .result_cache import ResultCache
 
-def interpret(gst_data: Any, schedule: str, mode: str, chainid: int, usegas: bool, *, check: bool = True) -> Pattern:
-    proc_res = _interpret(gst_data, schedule, mode, chainid, usegas)
 
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+def preloaded_gst_to_kore(
+    gst_data: Mapping[str, Any],
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    *,
+    backend: str = 'llvm',
+    normalize: bool = False,
+) -> Pattern:
+    """Convert a single GST test to an initial configuration with its pre-state already in the `<accounts>` cell.
+
+    The rest of the configuration is taken from the initial configuration computed by the interpreter for the chain
+    options, which is cached per process. Falls back to `gst_to_kore` if the pre-state cannot be loaded upfront.
+    """
+    if len(gst_data) != 1:
+        raise ValueError(f'Expected a single test to preload, got: {len(gst_data)}')
+    ((test_name, test),) = gst_data.items()
+
+    accounts = pre_state_to_kore(test.get('pre')) if type(test) is dict else None
+    if accounts is None:
+        _LOGGER.info(f'Cannot preload pre-state, falling back to load rules: {test_name}')
+        return gst_to_kore(gst_data, schedule, mode, chainid, usegas, normalize=normalize)
+
+    pgm = _pgm_without_pre(test_name, test, normalize=normalize)
+    template = _config_template(schedule, mode, chainid, usegas, backend)
+    return _patch_config(template, pgm, accounts)
+
+
+def _pgm_without_pre(test_name: str, test: Mapping[str, Any], *, normalize: bool) -> Pattern:
+    pgm_data = {test_name: {key: value for key, value in test.items() if key != 'pre'}}
+    return normalized_json_to_kore(normalize_gst(pgm_data)) if normalize else json_to_kore(pgm_data)
+
+
+@dataclass(frozen=True)
+class PreStateSnapshot:
+    """The textual initial configuration with a pre-state loaded, shared by all tests that run against that pre-state.
+
+    The configuration is built and serialized once, each test then only has its own program, without `"pre"`,
+    converted and spliced in.
+    """
+
+    prefix: str
+    suffix: str
+
+    @staticmethod
+    def create(pre: Any, schedule: str, mode: str, chainid: int, usegas: bool) -> PreStateSnapshot | None:
+        """Return `None` if the pre-state cannot be loaded upfront, see `pre_state_to_kore`."""
+        accounts = pre_state_to_kore(pre)
+        if accounts is None:
+            return None
+        template = _config_template(schedule, mode, chainid, usegas, 'llvm')
+        text = _patch_config(template, _SNAPSHOT_PLACEHOLDER, accounts).text
+        prefix, suffix = text.split(_SNAPSHOT_PLACEHOLDER.text)
+        return PreStateSnapshot(prefix, suffix)
+
+    def to_kore_text(self, test_name: str, test: Mapping[str, Any], *, normalize: bool = False) -> str:
+        return self.prefix + _pgm_without_pre(test_name, test, normalize=normalize).text + self.suffix
+
+
+@cache
+def _config_template(schedule: str, mode: str, chainid: int, usegas: bool, backend: str) -> Pattern:
+    init_kore = kore_pgm_to_kore(_PGM_PLACEHOLDER, SORT_JSON, schedule, mode, chainid, usegas)
+    match backend:
+        case 'llvm':
+            proc_res = _interpret(init_kore.text.encode(), depth=0)
+            proc_res.check_returncode()
+            return KoreParser(proc_res.stdout).pattern()
+        case 'kllvm':
+            from pyk.kllvm.convert import llvm_to_pattern, pattern_to_llvm
+
+            return llvm_to_pattern(kllvm_runtime().step(pattern_to_llvm(init_kore), depth=0))
+        case _:
+            raise ValueError(f'Unsupported interpreter backend: {backend}')
+
+
+_PGM_PLACEHOLDER: Final = JSON_NULL
+_SNAPSHOT_PLACEHOLDER: Final = App("Lbl'Hash'snapshotPlaceholder")
+
+
+def _patch_config(pattern: Pattern, pgm: Pattern, accounts: Pattern) -> Pattern:
+    if type(pattern) is not App:
+        return pattern
+    match pattern.symbol:
+        case "Lbl'-LT-'k'-GT-'":
+            return _replace(pattern, _PGM_PLACEHOLDER, pgm)
+        case "Lbl'-LT-'accounts'-GT-'":
+            return pattern.let(args=(accounts,))
+        case _:
+            return pattern.let(args=tuple(_patch_config(arg, pgm, accounts) for arg in pattern.args))
+
+
+def _replace(pattern: Pattern, old: Pattern, new: Pattern) -> Pattern:
+    if pattern == old:
+        return new
+    if type(pattern) is not App:
+        return pattern
+    return pattern.let(args=tuple(_replace(arg, old, new) for arg in pattern.args))
+
+
+class Projection(Enum):
+    EXIT_CODE = 'exit-code'
+    ACCOUNTS = 'accounts'
+    FULL = 'full'
+
+    @property
+    def cell_symbol(self) -> str | None:
+        if self is Projection.FULL:
+            return None
+        return "Lbl'-LT-'" + self.value + "'-GT-'"
+
+
+def interpret(
+    gst_data: Any,
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    *,
+    check: bool = True,
+    backend: str = 'llvm',
+    binary: bool = False,
+    normalize: bool = False,
+    preload: bool = False,
+    kore_cache: KoreCache | None = None,
+    projection: Projection = Projection.FULL,
+) -> Pattern:
+    match backend:
+        case 'llvm':
+            binary = binary and kllvm_available()
+            init_kore = _llvm_init_kore(
+                gst_data,
+                schedule,
+                mode,
+                chainid,
+                usegas,
+                binary=binary,
+                normalize=normalize,
+                preload=preload,
+                kore_cache=kore_cache,
+            )
+            kore = _interpret_llvm(init_kore, check=check, binary=binary, projection=projection)
+        case 'kllvm':
+            kore = _interpret_kllvm(
+                gst_data, schedule, mode, chainid, usegas, normalize=normalize, preload=preload, projection=projection
+            )
+            if check:
+                exit_code = get_exit_code(kore)
+                if exit_code != 0:
+                    raise RuntimeError(f'Interpreter returned non-zero exit code: {exit_code}')
+        case _:
+            raise ValueError(f'Unsupported interpreter backend: {backend}')
+
+    return kore
+
+
+def _llvm_init_kore(
+    gst_data: Any,
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    *,
+    binary: bool,
+    normalize: bool,
+    preload: bool,
+    kore_cache: KoreCache | None,
+) -> bytes:
+    if kore_cache is not None:
+        gst_bytes = json.dumps(gst_data, sort_keys=True).encode()
+        return kore_cache.gst_to_kore(
+            gst_bytes, schedule, mode, chainid, usegas, binary=binary, normalize=normalize, preload=preload
+        )
+    if preload:
+        init_pattern = preloaded_gst_to_kore(gst_data, schedule, mode, chainid, usegas, normalize=normalize)
+    else:
+        init_pattern = gst_to_kore(gst_data, schedule, mode, chainid, usegas, normalize=normalize)
+    return kore_to_binary(init_pattern) if binary else init_pattern.text.encode()
+
+
+def _interpret_llvm(init_kore: bytes, *, check: bool, binary: bool, projection: Projection) -> Pattern:
+    proc_res = _interpret(init_kore, binary=binary)
     if check:
         proc_res.check_returncode()
+    return _project_output(proc_res.stdout, binary, projection)
 
-    kore = KoreParser(proc_res.stdout).pattern()
-    return kore
+
+def _interpret_llvm_measured(
+    init_kore: bytes, *, binary: bool, projection: Projection, timeout: float | None
+) -> tuple[Pattern, int]:
+    proc_res, max_rss = _interpret_measured(init_kore, binary=binary, timeout=timeout)
+    return _project_output(proc_res.stdout, binary, projection), max_rss
+
+
+def _project_output(output: Any, binary: bool, projection: Projection) -> Pattern:
+    if binary:
+        return _project_llvm(binary_to_llvm(output), projection)
+    return _project_text(output, projection)
 
 
-def _interpret(gst_data: Any, schedule: str, mode: str, chainid: int, usegas: bool) -> CompletedProcess:
+def _interpret(init_kore: bytes, *, binary: bool = False, depth: int = -1) -> CompletedProcess:
     interpreter = kdist.get('evm-semantics.llvm') / 'interpreter'
-    init_kore = gst_to_kore(gst_data, schedule, mode, chainid, usegas)
-    proc_res = run_process_2([str(interpreter), '/dev/stdin', '-1', '/dev/stdout'], input=init_kore.text, check=False)
-    return proc_res
+
+    if not binary:
+        return run_process_2(
+            [str(interpreter), '/dev/stdin', str(depth), '/dev/stdout'], input=init_kore.decode(), check=False
+        )
+
+    # The interpreter sniffs the binary KORE header before deserializing, so the input must be seekable
+    with NamedTemporaryFile(suffix='.kore.bin') as input_file:
+        input_file.write(init_kore)
+        input_file.flush()
+        args = [str(interpreter), input_file.name, str(depth), '/dev/stdout', '--binary-output']
+        _LOGGER.info(f'Running: {" ".join(args)}')
+        return subprocess.run(args, capture_output=True, check=False)
+
+
+def _interpret_measured(
+    init_kore: bytes, *, binary: bool = False, timeout: float | None = None
+) -> tuple[CompletedProcess, int]:
+    """Like `_interpret`, but also return the peak RSS of the interpreter process in KiB.
+
+    The process is reaped with `os.wait4` to get its own resource usage, so its input and output go through files.
+    Raises `subprocess.TimeoutExpired` if the process is killed after running for `timeout` seconds.
+    """
+    interpreter = kdist.get('evm-semantics.llvm') / 'interpreter'
+
+    with (
+        NamedTemporaryFile(suffix='.kore') as input_file,
+        TemporaryFile() as output_file,
+        TemporaryFile() as error_file,
+    ):
+        input_file.write(init_kore)
+        input_file.flush()
+        args = [str(interpreter), input_file.name, '-1', '/dev/stdout'] + (['--binary-output'] if binary else [])
+        _LOGGER.info(f'Running: {" ".join(args)}')
+        proc = subprocess.Popen(args, stdout=output_file, stderr=error_file)
+
+        timed_out = Event()
+
+        def kill() -> None:
+            timed_out.set()
+            # Not `proc.kill()`, which polls and could reap the process before `os.wait4`
+            os.kill(proc.pid, signal.SIGKILL)
+
+        timer = Timer(timeout, kill) if timeout is not None else None
+        if timer is not None:
+            timer.start()
+        try:
+            _, status, rusage = os.wait4(proc.pid, 0)
+        finally:
+            if timer is not None:
+                timer.cancel()
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(args, timeout)  # type: ignore[arg-type]
+
+        output_file.seek(0)
+        error_file.seek(0)
+        stdout = output_file.read()
+        stderr = error_file.read().decode()
+        return CompletedProcess(args, proc.returncode, stdout if binary else stdout.decode(), stderr), rusage.ru_maxrss
+
+
+def _interpret_kllvm(
+    gst_data: Any,
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    *,
+    normalize: bool,
+    preload: bool,
+    projection: Projection,
+) -> Pattern:
+    from pyk.kllvm.convert import pattern_to_llvm
+
+    runtime = kllvm_runtime()
+    if preload:
+        init_kore = preloaded_gst_to_kore(
+            gst_data, schedule, mode, chainid, usegas, backend='kllvm', normalize=normalize
+        )
+    else:
+        init_kore = gst_to_kore(gst_data, schedule, mode, chainid, usegas, normalize=normalize)
+    return _project_llvm(runtime.run(pattern_to_llvm(init_kore)), projection)
+
+
+_KORE_DELIMITERS: Final = re.compile(r'\\.|[()"]')
+
+
+def _project_text(text: str, projection: Projection) -> Pattern:
+    symbol = projection.cell_symbol
+    if symbol is None:
+        return KoreParser(text).pattern()
+
+    # Locate the cell textually and only parse its subterm, skipping over parentheses in string literals
+    start = text.find(f'{symbol}{{}}(')
+    if start < 0:
+        raise ValueError(f'Cell not found in interpreter output: {symbol}')
+    depth = 0
+    in_string = False
+    for match in _KORE_DELIMITERS.finditer(text, start):
+        token = match.group()
+        if token == '"':
+            in_string = not in_string
+        elif in_string or len(token) > 1:
+            continue
+        elif token == '(':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return KoreParser(text[start : match.end()]).pattern()
+    raise ValueError(f'Unbalanced cell in interpreter output: {symbol}')
+
+
+def _project_llvm(pattern: LLVMPattern, projection: Projection) -> Pattern:
+    from pyk.kllvm.ast import CompositePattern
+    from pyk.kllvm.convert import llvm_to_pattern
+
+    symbol = projection.cell_symbol
+    if symbol is None:
+        return llvm_to_pattern(pattern)
+
+    # Only convert the projected cell back from the LLVM AST
+    stack = [pattern]
+    while stack:
+        curr = stack.pop()
+        if isinstance(curr, CompositePattern):
+            if curr.constructor.name == symbol:
+                return llvm_to_pattern(curr)
+            stack.extend(reversed(curr.arguments))
+    raise ValueError(f'Cell not found in interpreter output: {symbol}')
+
+
+def get_exit_code(pattern: Pattern) -> int:
+    assert type(pattern) is App
+    exit_code_cell: Pattern = pattern
+    if pattern.symbol != Projection.EXIT_CODE.cell_symbol:
+        kevm_cell = pattern.args[0]
+        assert type(kevm_cell) is App
+        exit_code_cell = kevm_cell.args[1]
+    assert type(exit_code_cell) is App
+    exit_code = exit_code_cell.args[0]
+    assert type(exit_code) is DV
+    return int(exit_code.value.value)
+
+
+def llvm_exit_code(pattern: LLVMPattern) -> int:
+    return get_exit_code(_project_llvm(pattern, Projection.EXIT_CODE))
+
+
+@dataclass(frozen=True)
+class InterpretResult:
+    gst_file: Path
+    exit_code: int | None
+    error: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return self.exit_code == 0
+
+
+def interpret_batch(
+    gst_files: Iterable[Path],
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    *,
+    workers: int = 1,
+    backend: str = 'llvm',
+    binary: bool = False,
+    normalize: bool = False,
+    preload: bool = False,
+    kore_cache: KoreCache | None = None,
+    max_pending: int | None = None,
+) -> Iterator[InterpretResult]:
+    if workers <= 1:
+        for gst_file in gst_files:
+            yield _interpret_file(
+                gst_file, schedule, mode, chainid, usegas, backend, binary, normalize, preload, kore_cache
+            )
+        return
+
+    if max_pending is None:
+        max_pending = 2 * workers
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: set[Future[InterpretResult]] = set()
+        for gst_file in gst_files:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+            pending.add(
+                executor.submit(
+                    _interpret_file,
+                    gst_file,
+                    schedule,
+                    mode,
+                    chainid,
+                    usegas,
+                    backend,
+                    binary,
+                    normalize,
+                    preload,
+                    kore_cache,
+                )
+            )
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+
+
+def _interpret_file(
+    gst_file: Path,
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    backend: str,
+    binary: bool,
+    normalize: bool,
+    preload: bool,
+    kore_cache: KoreCache | None,
+) -> InterpretResult:
+    _LOGGER.info(f'Running GST file: {gst_file}')
+    try:
+        if kore_cache is not None and backend == 'llvm':
+            binary = binary and kllvm_available()
+            init_kore = kore_cache.gst_to_kore(
+                gst_file.read_bytes(),
+                schedule,
+                mode,
+                chainid,
+                usegas,
+                binary=binary,
+                normalize=normalize,
+                preload=preload,
+            )
+            pattern = _interpret_llvm(init_kore, check=False, binary=binary, projection=Projection.EXIT_CODE)
+        else:
+            gst_data = json.loads(gst_file.read_text())
+            pattern = interpret(
+                gst_data,
+                schedule,
+                mode,
+                chainid,
+                usegas,
+                check=False,
+                backend=backend,
+                binary=binary,
+                normalize=normalize,
+                preload=preload,
+                projection=Projection.EXIT_CODE,
+            )
+        return InterpretResult(gst_file, get_exit_code(pattern))
+    except Exception as err:
+        _LOGGER.error(f'Failed to run GST file: {gst_file}', exc_info=True)
+        return InterpretResult(gst_file, None, f'{type(err).__name__}: {err}')
+
+
+@dataclass(frozen=True)
+class GSTTestResult:
+    test_name: str
+    exit_code: int | None
+    error: str | None = None
+    skipped: bool = False
+    timed_out: bool = False
+    time: float | None = None
+    max_rss: int | None = None
+    cached: bool = False
+
+    @property
+    def passed(self) -> bool:
+        return self.exit_code == 0
+
+
+def interpret_tests(
+    gst_data: Mapping[str, Any],
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    *,
+    executor: Executor | None = None,
+    skip: Container[str] = (),
+    backend: str = 'llvm',
+    binary: bool = False,
+    normalize: bool = False,
+    preload: bool = False,
+    snapshot: bool = False,
+    measure: bool = False,
+    timeout: float | None = None,
+    result_cache: ResultCache | None = None,
+) -> Iterator[GSTTestResult]:
+    """Run each test of a GST fixture separately, fanning them out to `executor` if given.
+
+    With `snapshot`, tests sharing a pre-state are run from a single `PreStateSnapshot`, falling back to `preload`
+    for pre-states that cannot be snapshotted. With `measure`, the peak RSS of each interpreter process is recorded
+    and processes running longer than `timeout` seconds are killed. Tests with a result in `result_cache` are not
+    re-run. Skipped and cached tests are reported first, the remaining results are yielded in completion order.
+    """
+    if (snapshot or measure) and backend != 'llvm':
+        raise ValueError(f'Pre-state snapshots and measurements are not supported for interpreter backend: {backend}')
+
+    snapshots: dict[str, PreStateSnapshot | None] = {}
+    cache_keys: dict[str, str] = {}
+    futures: list[Future[GSTTestResult]] = []
+    for test_name, test in gst_data.items():
+        if test_name in skip:
+            yield GSTTestResult(test_name, None, skipped=True)
+            continue
+
+        if result_cache is not None:
+            cache_key = result_cache.key(
+                test_name, test, schedule, mode, chainid, usegas, normalize=normalize, preload=preload or snapshot
+            )
+            cached_result = result_cache.get(cache_key, test_name)
+            if cached_result is not None:
+                yield cached_result
+                continue
+            cache_keys[test_name] = cache_key
+
+        fn: Callable[..., GSTTestResult]
+        args: tuple[Any, ...]
+        pre_snapshot = _pre_state_snapshot(snapshots, test, schedule, mode, chainid, usegas) if snapshot else None
+        if pre_snapshot is not None:
+            fn, args = _interpret_snapshot_test, (test_name, test, pre_snapshot, normalize, measure, timeout)
+        else:
+            fn = _interpret_test
+            args = (
+                test_name,
+                test,
+                schedule,
+                mode,
+                chainid,
+                usegas,
+                backend,
+                binary,
+                normalize,
+                preload or snapshot,
+                measure,
+                timeout,
+            )
+
+        if executor is None:
+            yield _cache_result(result_cache, cache_keys, fn(*args))
+        else:
+            futures.append(executor.submit(fn, *args))
+
+    for future in as_completed(futures):
+        yield _cache_result(result_cache, cache_keys, future.result())
+
+
+def _cache_result(
+    result_cache: ResultCache | None, cache_keys: Mapping[str, str], result: GSTTestResult
+) -> GSTTestResult:
+    if result_cache is not None:
+        result_cache.put(cache_keys[result.test_name], result)
+    return result
+
+
+def _pre_state_snapshot(
+    snapshots: dict[str, PreStateSnapshot | None],
+    test: Any,
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+) -> PreStateSnapshot | None:
+    if type(test) is not dict:
+        return None
+    pre = test.get('pre')
+    key = json.dumps(pre, sort_keys=True)
+    if key not in snapshots:
+        snapshots[key] = PreStateSnapshot.create(pre, schedule, mode, chainid, usegas)
+    return snapshots[key]
+
+
+def _interpret_snapshot_test(
+    test_name: str,
+    test: Mapping[str, Any],
+    pre_snapshot: PreStateSnapshot,
+    normalize: bool,
+    measure: bool,
+    timeout: float | None,
+) -> GSTTestResult:
+    _LOGGER.info(f'Running test from pre-state snapshot: {test_name}')
+    start = time.perf_counter()
+    try:
+        init_kore = pre_snapshot.to_kore_text(test_name, test, normalize=normalize).encode()
+        return _run_llvm_test(test_name, init_kore, False, measure, timeout, start)
+    except Exception as err:
+        return _failed_test(test_name, err, timeout, start)
+
+
+def _interpret_test(
+    test_name: str,
+    test: Any,
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    backend: str,
+    binary: bool,
+    normalize: bool,
+    preload: bool,
+    measure: bool,
+    timeout: float | None,
+) -> GSTTestResult:
+    _LOGGER.info(f'Running test: {test_name}')
+    start = time.perf_counter()
+    try:
+        if measure:
+            binary = binary and kllvm_available()
+            init_kore = _llvm_init_kore(
+                {test_name: test},
+                schedule,
+                mode,
+                chainid,
+                usegas,
+                binary=binary,
+                normalize=normalize,
+                preload=preload,
+                kore_cache=None,
+            )
+            return _run_llvm_test(test_name, init_kore, binary, measure, timeout, start)
+
+        pattern = interpret(
+            {test_name: test},
+            schedule,
+            mode,
+            chainid,
+            usegas,
+            check=False,
+            backend=backend,
+            binary=binary,
+            normalize=normalize,
+            preload=preload,
+            projection=Projection.EXIT_CODE,
+        )
+        return GSTTestResult(test_name, get_exit_code(pattern), time=time.perf_counter() - start)
+    except Exception as err:
+        return _failed_test(test_name, err, timeout, start)
+
+
+def _run_llvm_test(
+    test_name: str, init_kore: bytes, binary: bool, measure: bool, timeout: float | None, start: float
+) -> GSTTestResult:
+    if not measure:
+        pattern = _interpret_llvm(init_kore, check=False, binary=binary, projection=Projection.EXIT_CODE)
+        return GSTTestResult(test_name, get_exit_code(pattern), time=time.perf_counter() - start)
+    pattern, max_rss = _interpret_llvm_measured(
+        init_kore, binary=binary, projection=Projection.EXIT_CODE, timeout=timeout
+    )
+    return GSTTestResult(test_name, get_exit_code(pattern), time=time.perf_counter() - start, max_rss=max_rss)
+
+
+def _failed_test(test_name: str, err: Exception, timeout: float | None, start: float) -> GSTTestResult:
+    elapsed = time.perf_counter() - start
+    if isinstance(err, subprocess.TimeoutExpired):
+        _LOGGER.warning(f'Test timed out after {timeout}s: {test_name}')
+        return GSTTestResult(test_name, None, f'Timed out after {timeout}s', timed_out=True, time=elapsed)
+    _LOGGER.error(f'Failed to run test: {test_name}', exc_info=err)
+    return GSTTestResult(test_name, None, f'{type(err).__name__}: {err}', time=elapsed)
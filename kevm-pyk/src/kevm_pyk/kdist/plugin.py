@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import logging
 import shutil
 import sys
 from distutils.dir_util import copy_tree
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
 
 from pyk.kbuild.utils import k_version
@@ -11,14 +14,20 @@ from pyk.kllvm.compiler import compile_kllvm, compile_runtime
 from pyk.utils import run_process_2
 
 from .. import config
+from ..conformance import read_test_list, select_tests
+from ..gst_to_kore import gst_to_kore
 from ..kompile import KompileTarget, kevm_kompile, lib_ccopts
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
-    from pathlib import Path
+    from collections.abc import Iterable, Mapping
     from typing import Any, Final
 
 
+_LOGGER: Final = logging.getLogger(__name__)
+
+PGO_TRAINING_LIST: Final = Path(__file__).parent / 'pgo-training.llvm'
+
+
 class KEVMTarget(Target):
     _kompile_args: dict[str, Any]
 
@@ -26,6 +35,17 @@ class KEVMTarget(Target):
         self._kompile_args = dict(kompile_args)
 
     def build(self, output_dir: Path, deps: dict[str, Path], args: dict[str, Any], verbose: bool) -> None:
+        self._kompile(output_dir, deps, args, verbose)
+
+    def _kompile(
+        self,
+        output_dir: Path,
+        deps: dict[str, Path],
+        args: dict[str, Any],
+        verbose: bool,
+        *,
+        extra_ccopts: Iterable[str] = (),
+    ) -> None:
         enable_llvm_debug = bool(args.get('enable-llvm-debug', ''))
         debug_build = bool(args.get('debug-build', ''))
         ccopts = [ccopt for ccopt in args.get('ccopts', '').split(' ') if ccopt]
@@ -34,7 +54,7 @@ class KEVMTarget(Target):
             output_dir=output_dir,
             enable_llvm_debug=enable_llvm_debug,
             verbose=verbose,
-            ccopts=ccopts,
+            ccopts=ccopts + list(extra_ccopts),
             plugin_dir=deps['evm-semantics.plugin'],
             debug_build=debug_build,
             **self._kompile_args,
@@ -50,6 +70,68 @@ class KEVMTarget(Target):
         return {'k-version': k_version().text}
 
 
+class PGOTarget(KEVMTarget):
+    """Build the LLVM interpreter with profile-guided optimization.
+
+    An interpreter instrumented with `-fprofile-generate` is built first and run on the tests of `PGO_TRAINING_LIST`,
+    then the interpreter is rebuilt with the merged profile. The fixtures are read from the `ethereum/tests` checkout
+    given by the `pgo-tests-dir` argument, by default the `tests/ethereum-tests` submodule of the repository checkout
+    the target is built from. Outside of a checkout, the argument must be given, as an absolute path.
+    """
+
+    def build(self, output_dir: Path, deps: dict[str, Path], args: dict[str, Any], verbose: bool) -> None:
+        tests_dir = Path(args.get('pgo-tests-dir', config.ETHEREUM_TESTS_DIR))
+        if not tests_dir.is_absolute():
+            # kdist builds in a temporary working directory
+            raise ValueError(f'Expected an absolute path for the pgo-tests-dir argument, got: {tests_dir}')
+        llvm_profdata = args.get('llvm-profdata', 'llvm-profdata')
+        try:
+            training_inputs = [
+                (test_name, gst_to_kore({test_name: test}, fixture.schedule, fixture.mode, 1, True).text)
+                for fixture, test_name, test in select_tests(tests_dir, read_test_list(PGO_TRAINING_LIST))
+            ]
+        except OSError as err:
+            raise ValueError(f'Cannot read the PGO training fixtures, set the pgo-tests-dir argument: {err}') from err
+
+        with TemporaryDirectory(prefix='kevm-pgo-') as tmp_dir_str:
+            tmp_dir = Path(tmp_dir_str)
+            profile_dir = tmp_dir / 'profile'
+            instrumented_dir = tmp_dir / 'instrumented'
+            self._kompile(instrumented_dir, deps, args, verbose, extra_ccopts=[f'-fprofile-generate={profile_dir}'])
+
+            interpreter = instrumented_dir / 'interpreter'
+            for i, (test_name, init_kore) in enumerate(training_inputs):
+                _LOGGER.info(f'Running PGO training test {i + 1}/{len(training_inputs)}: {test_name}')
+                proc_res = run_process_2(
+                    [str(interpreter), '/dev/stdin', '-1', '/dev/null'], input=init_kore, check=False
+                )
+                if proc_res.returncode:
+                    _LOGGER.warning(f'PGO training test returned non-zero exit code {proc_res.returncode}: {test_name}')
+
+            profdata = tmp_dir / 'interpreter.profdata'
+            profraws = sorted(str(profraw) for profraw in profile_dir.glob('*.profraw'))
+            run_process_2([llvm_profdata, 'merge', f'--output={profdata}'] + profraws)
+            self._kompile(
+                output_dir,
+                deps,
+                args,
+                verbose,
+                extra_ccopts=[f'-fprofile-use={profdata}', '-Wno-profile-instr-unprofiled'],
+            )
+
+    def source(self) -> tuple[Path, ...]:
+        return super().source() + (PGO_TRAINING_LIST,)
+
+    def context(self) -> dict[str, str]:
+        # The training fixtures are outside of the package, so they cannot be part of `source()`
+        fixtures = {config.ETHEREUM_TESTS_DIR / fixture_path for fixture_path, _ in read_test_list(PGO_TRAINING_LIST)}
+        timestamps = [fixture.stat().st_mtime_ns for fixture in fixtures if fixture.exists()]
+        return super().context() | {
+            'pgo-tests-dir': str(config.ETHEREUM_TESTS_DIR),
+            'pgo-fixtures': str(max(timestamps, default=0)),
+        }
+
+
 class PluginTarget(Target):
     def build(self, output_dir: Path, deps: dict[str, Any], args: dict[str, Any], verbose: bool) -> None:
         copy_tree(str(config.PLUGIN_DIR), '.')
@@ -105,6 +187,34 @@ __TARGETS__: Final = {
             'optimization': 3,
         },
     ),
+    'llvm-profile': KEVMTarget(
+        {
+            'target': KompileTarget.LLVM,
+            'main_file': config.EVM_SEMANTICS_DIR / 'driver.md',
+            'main_module': 'ETHEREUM-SIMULATION',
+            'syntax_module': 'ETHEREUM-SIMULATION',
+            'optimization': 3,
+            'llvm_proof_hint_instrumentation': True,
+        },
+    ),
+    'llvm-trace': KEVMTarget(
+        {
+            'target': KompileTarget.LLVM,
+            'main_file': config.EVM_SEMANTICS_DIR / 'trace.md',
+            'main_module': 'EVM-TRACE',
+            'syntax_module': 'EVM-TRACE',
+            'optimization': 3,
+        },
+    ),
+    'llvm-pgo': PGOTarget(
+        {
+            'target': KompileTarget.LLVM,
+            'main_file': config.EVM_SEMANTICS_DIR / 'driver.md',
+            'main_module': 'ETHEREUM-SIMULATION',
+            'syntax_module': 'ETHEREUM-SIMULATION',
+            'optimization': 3,
+        },
+    ),
     'haskell': KEVMTarget(
         {
             'target': KompileTarget.HASKELL,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from pyk.cterm import CTerm
@@ -22,8 +23,10 @@ from pyk.kast.pretty import paren
 from pyk.kcfg.kcfg import Step
 from pyk.kcfg.semantics import DefaultSemantics
 from pyk.kcfg.show import NodePrinter
+from pyk.kore.parser import KoreParser
+from pyk.kore.tools import PrintOutput, kore_print
 from pyk.ktool.kprove import KProve
-from pyk.ktool.krun import KRun
+from pyk.ktool.krun import KRun, KRunOutput, _krun
 from pyk.prelude.bytes import BYTES, pretty_bytes
 from pyk.prelude.kint import INT, gtInt, intToken, ltInt
 from pyk.prelude.ml import mlEqualsFalse, mlEqualsTrue
@@ -34,7 +37,7 @@ from pyk.proof.show import APRProofNodePrinter
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
-    from pathlib import Path
+    from subprocess import CompletedProcess
     from typing import Final
 
     from pyk.kast.inner import KAst, Subst
@@ -392,6 +395,59 @@ class KEVM(KProve, KRun):
             cterm = cterm.add_constraint(c)
         return cterm
 
+    def run_kore_text(
+        self,
+        kore: str,
+        *,
+        depth: int | None = None,
+        expand_macros: bool = True,
+        output: KRunOutput = KRunOutput.PRETTY,
+        check: bool = False,
+        debugger: bool = False,
+    ) -> None:
+        """Like `KRun.run`, but for an already serialized configuration, which is never parsed on the Python side."""
+        result = self.krun_kore_text(kore, depth=depth, expand_macros=expand_macros, debugger=debugger)
+        self.print_krun_output(result.stdout, output)
+        if check:
+            result.check_returncode()
+
+    def krun_kore_text(
+        self,
+        kore: str,
+        *,
+        depth: int | None = None,
+        expand_macros: bool = True,
+        debugger: bool = False,
+    ) -> CompletedProcess:
+        with self._temp_file() as ntf:
+            ntf.write(kore)
+            ntf.flush()
+            return _krun(
+                command=self.command,
+                input_file=Path(ntf.name),
+                definition_dir=self.definition_dir,
+                output=KRunOutput.KORE,
+                depth=depth,
+                parser='cat',
+                term=True,
+                temp_dir=self.use_directory,
+                no_expand_macros=not expand_macros,
+                bug_report=self._bug_report,
+                check=False,
+                debugger=debugger,
+            )
+
+    def print_krun_output(self, kore: str, output: KRunOutput) -> None:
+        match output:
+            case KRunOutput.NONE:
+                pass
+            case KRunOutput.KORE:
+                print(kore.rstrip())
+            case KRunOutput.JSON:
+                print(self.kore_to_kast(KoreParser(kore).pattern()).to_json())
+            case _:
+                print(kore_print(kore, definition_dir=self.definition_dir, output=PrintOutput(output.value)))
+
     @property
     def use_hex_encoding(self) -> bool:
         return self._use_hex
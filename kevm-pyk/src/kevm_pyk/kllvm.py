@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import logging
+from functools import cache
+from typing import TYPE_CHECKING
+
+from pyk.kdist import kdist
+
+if TYPE_CHECKING:
+    from types import ModuleType
+    from typing import Final
+
+    from pyk.kllvm.ast import Pattern as LLVMPattern
+    from pyk.kllvm.runtime import Runtime
+    from pyk.kore.syntax import Pattern
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@cache
+def kllvm_module() -> ModuleType:
+    from pyk.kllvm.importer import import_kllvm
+
+    return import_kllvm(kdist.get('evm-semantics.kllvm'))
+
+
+@cache
+def kllvm_runtime() -> Runtime:
+    from pyk.kllvm.importer import import_runtime
+
+    kllvm_module()
+    return import_runtime(kdist.get('evm-semantics.kllvm-runtime'))
+
+
+@cache
+def kllvm_available() -> bool:
+    try:
+        kllvm_module()
+    except ValueError:
+        _LOGGER.warning('Target evm-semantics.kllvm is not built, falling back to textual KORE')
+        return False
+    return True
+
+
+@cache
+def kllvm_runtime_available() -> bool:
+    try:
+        kllvm_runtime()
+    except ValueError:
+        _LOGGER.warning('Target evm-semantics.kllvm-runtime is not built, falling back to the interpreter binary')
+        return False
+    return True
+
+
+def kore_to_binary(pattern: Pattern) -> bytes:
+    kllvm_module()
+    from pyk.kllvm.convert import pattern_to_llvm
+
+    return pattern_to_llvm(pattern).serialize()
+
+
+def binary_to_kore(kore_bytes: bytes) -> Pattern:
+    llvm_pattern = binary_to_llvm(kore_bytes)
+    from pyk.kllvm.convert import llvm_to_pattern
+
+    return llvm_to_pattern(llvm_pattern)
+
+
+def text_to_llvm(kore_text: str) -> LLVMPattern:
+    kllvm_module()
+    from pyk.kllvm.parser import parse_pattern
+
+    return parse_pattern(kore_text)
+
+
+def binary_to_llvm(kore_bytes: bytes) -> LLVMPattern:
+    kllvm_module()
+    from pyk.kllvm.ast import Pattern as LLVMPattern
+
+    return LLVMPattern.deserialize(kore_bytes)
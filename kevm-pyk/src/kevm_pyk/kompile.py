@@ -6,7 +6,6 @@ import sys
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from pyk.kdist import kdist
 from pyk.ktool import TypeInferenceMode
 from pyk.ktool.kompile import HaskellKompile, KompileArgs, LLVMKompile, LLVMKompileType, MaudeKompile
 
@@ -56,6 +55,7 @@ def kevm_kompile(
     optimization: int = 0,
     llvm_kompile_type: LLVMKompileType | None = None,
     enable_llvm_debug: bool = False,
+    llvm_proof_hint_instrumentation: bool = False,
     plugin_dir: Path | None = None,
     debug_build: bool = False,
     debug: bool = False,
@@ -64,6 +64,8 @@ def kevm_kompile(
     ignore_warnings: Iterable[str] = (),
 ) -> Path:
     if plugin_dir is None:
+        from pyk.kdist import kdist
+
         plugin_dir = kdist.get('evm-semantics.plugin')
 
     ccopts = list(ccopts) + lib_ccopts(plugin_dir, debug_build=debug_build) + _warning_ccopts()
@@ -80,6 +82,7 @@ def kevm_kompile(
         optimization=optimization,
         llvm_kompile_type=llvm_kompile_type,
         enable_llvm_debug=enable_llvm_debug,
+        llvm_proof_hint_instrumentation=llvm_proof_hint_instrumentation,
         debug_build=debug_build,
         debug=debug,
         verbose=verbose,
@@ -102,6 +105,7 @@ def run_kompile(
     optimization: int = 0,
     llvm_kompile_type: LLVMKompileType | None = None,
     enable_llvm_debug: bool = False,
+    llvm_proof_hint_instrumentation: bool = False,
     debug_build: bool = False,
     debug: bool = False,
     verbose: bool = False,
@@ -136,6 +140,7 @@ def run_kompile(
                 opt_level=optimization,
                 llvm_kompile_type=llvm_kompile_type,
                 enable_llvm_debug=enable_llvm_debug,
+                llvm_proof_hint_instrumentation=llvm_proof_hint_instrumentation,
             )
             return kompile(
                 output_dir=output_dir,
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from functools import cached_property
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+from filelock import FileLock
+from pyk.kdist import kdist
+
+from . import VERSION
+from .gst_to_kore import gst_to_kore
+from .interpreter import preloaded_gst_to_kore
+from .kllvm import kore_to_binary
+from .result_cache import definition_digest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Final
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_SIZE: Final = 1 << 30
+
+
+class KoreCache:
+    """On-disk LRU cache of initial configurations, keyed by the GST contents and the chain options.
+
+    Preloaded configurations are built from interpreter output, so their keys also cover the kompiled LLVM definition.
+    Entries are written atomically, so concurrent processes may share a cache directory.
+    Recency is tracked through file modification times, which are bumped on every hit.
+    """
+
+    cache_dir: Path
+    max_size: int
+    _definition_dir: Path | None
+
+    def __init__(self, cache_dir: Path, *, max_size: int = DEFAULT_MAX_SIZE, definition_dir: Path | None = None):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._definition_dir = definition_dir
+
+    @cached_property
+    def definition_digest(self) -> str:
+        return definition_digest(self._definition_dir or kdist.get('evm-semantics.llvm'))
+
+    def key(
+        self,
+        gst_bytes: bytes,
+        schedule: str,
+        mode: str,
+        chainid: int,
+        usegas: bool,
+        *,
+        binary: bool = False,
+        normalize: bool = False,
+        preload: bool = False,
+    ) -> str:
+        digest = hashlib.sha256(gst_bytes)
+        # A key without preload does not need the definition, so it is not hashed then
+        definition = self.definition_digest if preload else None
+        options = (schedule, mode, chainid, usegas, binary, normalize, preload, VERSION, definition)
+        digest.update(''.join(f'\0{option}' for option in options).encode())
+        return digest.hexdigest()
+
+    def gst_to_kore(
+        self,
+        gst_bytes: bytes,
+        schedule: str,
+        mode: str,
+        chainid: int,
+        usegas: bool,
+        *,
+        binary: bool = False,
+        normalize: bool = False,
+        preload: bool = False,
+    ) -> bytes:
+        key = self.key(gst_bytes, schedule, mode, chainid, usegas, binary=binary, normalize=normalize, preload=preload)
+        entry = self._entry(key, binary)
+
+        try:
+            kore_bytes = entry.read_bytes()
+            os.utime(entry)
+            _LOGGER.info(f'KORE cache hit: {entry}')
+            return kore_bytes
+        except FileNotFoundError:
+            pass
+
+        _LOGGER.info(f'KORE cache miss: {entry}')
+        gst_data = json.loads(gst_bytes)
+        if preload:
+            kore = preloaded_gst_to_kore(gst_data, schedule, mode, chainid, usegas, normalize=normalize)
+        else:
+            kore = gst_to_kore(gst_data, schedule, mode, chainid, usegas, normalize=normalize)
+        kore_bytes = kore_to_binary(kore) if binary else kore.text.encode()
+        self._put(entry, kore_bytes)
+        return kore_bytes
+
+    def _entry(self, key: str, binary: bool) -> Path:
+        suffix = '.kore.bin' if binary else '.kore'
+        return self.cache_dir / key[:2] / f'{key}{suffix}'
+
+    def _put(self, entry: Path, kore_bytes: bytes) -> None:
+        entry.parent.mkdir(exist_ok=True)
+        with NamedTemporaryFile(dir=entry.parent, prefix='.', delete=False) as tmp_file:
+            tmp_file.write(kore_bytes)
+        os.replace(tmp_file.name, entry)
+        self._evict()
+
+    def _evict(self) -> None:
+        with FileLock(self.cache_dir / '.lock'):
+            entries = []
+            for entry in self.cache_dir.glob('*/*.kore*'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries, key=lambda e: e[0]):
+                if total_size <= self.max_size:
+                    break
+                entry.unlink(missing_ok=True)
+                total_size -= size
+                _LOGGER.info(f'Evicted KORE cache entry: {entry}')
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import time
+from collections import Counter
+from dataclasses import dataclass, replace
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, NamedTuple
+
+from pyk.kdist import kdist
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from typing import Final, TextIO
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+def _opcodes() -> dict[int, str]:
+    opcodes = {
+        0x00: 'STOP', 0x01: 'ADD', 0x02: 'MUL', 0x03: 'SUB', 0x04: 'DIV', 0x05: 'SDIV', 0x06: 'MOD', 0x07: 'SMOD',
+        0x08: 'ADDMOD', 0x09: 'MULMOD', 0x0A: 'EXP', 0x0B: 'SIGNEXTEND', 0x10: 'LT', 0x11: 'GT', 0x12: 'SLT',
+        0x13: 'SGT', 0x14: 'EQ', 0x15: 'ISZERO', 0x16: 'AND', 0x17: 'OR', 0x18: 'XOR', 0x19: 'NOT', 0x1A: 'BYTE',
+        0x1B: 'SHL', 0x1C: 'SHR', 0x1D: 'SAR', 0x20: 'SHA3', 0x30: 'ADDRESS', 0x31: 'BALANCE', 0x32: 'ORIGIN',
+        0x33: 'CALLER', 0x34: 'CALLVALUE', 0x35: 'CALLDATALOAD', 0x36: 'CALLDATASIZE', 0x37: 'CALLDATACOPY',
+        0x38: 'CODESIZE', 0x39: 'CODECOPY', 0x3A: 'GASPRICE', 0x3B: 'EXTCODESIZE', 0x3C: 'EXTCODECOPY',
+        0x3D: 'RETURNDATASIZE', 0x3E: 'RETURNDATACOPY', 0x3F: 'EXTCODEHASH', 0x40: 'BLOCKHASH', 0x41: 'COINBASE',
+        0x42: 'TIMESTAMP', 0x43: 'NUMBER', 0x44: 'PREVRANDAO', 0x45: 'GASLIMIT', 0x46: 'CHAINID',
+        0x47: 'SELFBALANCE', 0x48: 'BASEFEE', 0x49: 'BLOBHASH', 0x4A: 'BLOBBASEFEE', 0x50: 'POP', 0x51: 'MLOAD',
+        0x52: 'MSTORE', 0x53: 'MSTORE8', 0x54: 'SLOAD', 0x55: 'SSTORE', 0x56: 'JUMP', 0x57: 'JUMPI', 0x58: 'PC',
+        0x59: 'MSIZE', 0x5A: 'GAS', 0x5B: 'JUMPDEST', 0x5C: 'TLOAD', 0x5D: 'TSTORE', 0x5E: 'MCOPY', 0x5F: 'PUSH0',
+        0xF0: 'CREATE', 0xF1: 'CALL', 0xF2: 'CALLCODE', 0xF3: 'RETURN', 0xF4: 'DELEGATECALL', 0xF5: 'CREATE2',
+        0xFA: 'STATICCALL', 0xFD: 'REVERT', 0xFE: 'INVALID', 0xFF: 'SELFDESTRUCT',
+    }  # fmt: skip
+    opcodes.update((0x60 + i, f'PUSH{i + 1}') for i in range(32))
+    opcodes.update((0x80 + i, f'DUP{i + 1}') for i in range(16))
+    opcodes.update((0x90 + i, f'SWAP{i + 1}') for i in range(16))
+    opcodes.update((0xA0 + i, f'LOG{i}') for i in range(5))
+    return opcodes
+
+
+OPCODES: Final = _opcodes()
+
+# Instructions after which the current call frame, or the transaction at depth 0, has ended
+FRAME_ENDING_OPCODES: Final = frozenset({0x00, 0xF3, 0xFD, 0xFE, 0xFF})
+
+
+def opcode_name(opcode: int) -> str:
+    return OPCODES.get(opcode, f'UNDEFINED(0x{opcode:02x})')
+
+
+class TraceEntry(NamedTuple):
+    """An executed instruction, with the gas available before executing it and the call depth it executed at."""
+
+    pc: int
+    opcode: int
+    gas: int
+    depth: int
+
+
+def parse_trace(lines: Iterable[str]) -> Iterator[TraceEntry]:
+    """Parse the `[PC,OPCODE,GAS,DEPTH]` lines of an `evm-semantics.llvm-trace` run, skipping any other output."""
+    for line in lines:
+        if not line.startswith('['):
+            continue
+        pc, opcode, gas, depth = json.loads(line)
+        yield TraceEntry(pc, opcode, gas, depth)
+
+
+@dataclass(frozen=True)
+class OpcodeStats:
+    """Per-opcode instruction counts and gas, aggregated from an opcode trace.
+
+    The gas of an instruction is the difference to the gas available at the next instruction at the same call depth,
+    so it includes the gas spent in calls it makes. Instructions that end a call frame have no next instruction, and
+    are counted without gas. So are instructions followed by one with more gas at the same depth, which can only
+    start another transaction, as after an exceptional halt.
+    """
+
+    counts: Counter[int]
+    gas: Counter[int]
+    elapsed: float | None = None
+
+    @property
+    def instructions(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def instructions_per_sec(self) -> float | None:
+        if not self.elapsed:
+            return None
+        return self.instructions / self.elapsed
+
+    def table(self) -> str:
+        total_gas = sum(self.gas.values())
+        lines = [f'{"Opcode":<16} {"Count":>12} {"%":>6} {"Gas":>14} {"Gas %":>6}']
+        for opcode, count in self.counts.most_common():
+            gas = self.gas[opcode]
+            count_percent = 100 * count / self.instructions
+            gas_percent = 100 * gas / total_gas if total_gas else 0
+            lines.append(f'{opcode_name(opcode):<16} {count:>12} {count_percent:>6.2f} {gas:>14} {gas_percent:>6.2f}')
+        lines.append(f'Instructions: {self.instructions}')
+        if self.instructions_per_sec is not None:
+            lines.append(f'Instructions/sec: {self.instructions_per_sec:.0f}')
+        return '\n'.join(lines)
+
+
+def aggregate_trace(entries: Iterable[TraceEntry], *, elapsed: float | None = None) -> OpcodeStats:
+    """Aggregate a trace in a single pass, keeping only the last instruction of each active call frame."""
+    counts: Counter[int] = Counter()
+    gas: Counter[int] = Counter()
+    frames: dict[int, TraceEntry] = {}
+
+    for entry in entries:
+        counts[entry.opcode] += 1
+        # Returning from a call ends the frames above this one
+        while frames and max(frames) > entry.depth:
+            frames.pop(max(frames))
+        prev = frames.get(entry.depth)
+        if prev is not None and prev.gas >= entry.gas:
+            gas[prev.opcode] += prev.gas - entry.gas
+        if entry.opcode in FRAME_ENDING_OPCODES:
+            frames.pop(entry.depth, None)
+        else:
+            frames[entry.depth] = entry
+
+    return OpcodeStats(counts, gas, elapsed)
+
+
+def trace_opcodes(
+    init_kore: bytes,
+    *,
+    definition_dir: Path | None = None,
+    depth: int = -1,
+    trace: TextIO | None = None,
+) -> OpcodeStats:
+    """Run the interpreter of the `evm-semantics.llvm-trace` target and aggregate its trace while it runs.
+
+    The trace is not stored, unless it is also copied to `trace`.
+    """
+    if definition_dir is None:
+        definition_dir = kdist.get('evm-semantics.llvm-trace')
+
+    with NamedTemporaryFile(suffix='.kore') as input_file:
+        input_file.write(init_kore)
+        input_file.flush()
+        args = [str(definition_dir / 'interpreter'), input_file.name, str(depth), '/dev/null']
+        _LOGGER.info(f'Running: {" ".join(args)}')
+
+        start_time = time.time()
+        with subprocess.Popen(args, stderr=subprocess.PIPE, text=True) as proc:
+            assert proc.stderr is not None
+            stats = aggregate_trace(parse_trace(_tee(proc.stderr, trace)))
+        elapsed = time.time() - start_time
+
+    if proc.returncode:
+        raise RuntimeError(f'Interpreter returned non-zero exit code: {proc.returncode}')
+    return replace(stats, elapsed=elapsed)
+
+
+def _tee(lines: Iterable[str], output: TextIO | None) -> Iterator[str]:
+    for line in lines:
+        if not line.startswith('['):
+            _LOGGER.warning(f'Interpreter: {line.rstrip()}')
+        elif output is not None:
+            output.write(line)
+        yield line
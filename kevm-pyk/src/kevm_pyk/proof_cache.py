@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from functools import cached_property
+from tempfile import mkdtemp
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from pathlib import Path
+    from typing import Any, Final
+
+    from pyk.proof.proof import Proof
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class ProofCache:
+    """On-disk cache of passed proofs, shared between save directories, and between machines on a shared filesystem.
+
+    Entries are keyed by the KORE definitions the prover loads, the digest of the claim and its dependencies, and the
+    prover `options` that change what is proven. An entry holds the proof data of the claim and of its subproofs,
+    including their KCFGs. Entries are written to a temporary directory, then renamed, so only complete entries are
+    ever read.
+    """
+
+    cache_dir: Path
+    _definition_dir: Path
+    _options: dict[str, Any]
+
+    def __init__(self, cache_dir: Path, *, definition_dir: Path, options: Mapping[str, Any] | None = None):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cache_dir
+        self._definition_dir = definition_dir
+        self._options = dict(options or {})
+
+    @cached_property
+    def definition_digest(self) -> str:
+        digest = hashlib.sha256()
+        for definition_file in (
+            self._definition_dir / 'definition.kore',
+            self._definition_dir / 'llvm-library' / 'definition.kore',
+        ):
+            if not definition_file.exists():
+                continue
+            digest.update(f'\0{definition_file.relative_to(self._definition_dir).as_posix()}\0'.encode())
+            with definition_file.open('rb') as f:
+                while chunk := f.read(1 << 20):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def key(self, claim_digest: str) -> str:
+        digest = hashlib.sha256(f'{self.definition_digest}\0{claim_digest}\0'.encode())
+        digest.update(json.dumps(self._options, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def restore(self, claim_digest: str, proof_id: str, proof_dir: Path) -> bool:
+        """Copy the cached proof data of a claim into `proof_dir`, returning whether there was an entry.
+
+        The data of the proof and of its own subproofs replaces any existing data. Other subproofs, the proofs of the
+        claim's dependencies, are only copied if missing, as they may be in use by other workers.
+        """
+        entry = self._entry(claim_digest)
+        if not entry.is_dir():
+            return False
+        proof_dir.mkdir(parents=True, exist_ok=True)
+        for cached_subdir in entry.iterdir():
+            subdir = proof_dir / cached_subdir.name
+            if _is_own(cached_subdir.name, proof_id):
+                shutil.rmtree(subdir, ignore_errors=True)
+            elif subdir.exists():
+                continue
+            shutil.copytree(cached_subdir, subdir)
+        _LOGGER.info(f'Proof cache hit: {proof_id}')
+        return True
+
+    def put(self, claim_digest: str, proof: Proof) -> None:
+        if not proof.passed or proof.admitted or proof.proof_dir is None:
+            return
+        entry = self._entry(claim_digest)
+        if entry.is_dir():
+            return
+        entry.parent.mkdir(exist_ok=True)
+        tmp_dir = mkdtemp(dir=entry.parent, prefix='.')
+        try:
+            for proof_id in sorted({p.id for p in _with_subproofs(proof)}):
+                shutil.copytree(proof.proof_dir / proof_id, os.path.join(tmp_dir, proof_id))
+            os.rename(tmp_dir, entry)
+        except OSError:
+            # Another worker or runner stored the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not entry.is_dir():
+                raise
+            return
+        _LOGGER.info(f'Stored proof in cache: {proof.id}')
+
+    def _entry(self, claim_digest: str) -> Path:
+        key = self.key(claim_digest)
+        return self.cache_dir / key[:2] / key
+
+
+def _is_own(subproof_id: str, proof_id: str) -> bool:
+    return subproof_id == proof_id or subproof_id.startswith(f'{proof_id}.')
+
+
+def _with_subproofs(proof: Proof) -> Iterator[Proof]:
+    yield proof
+    for subproof in proof.subproofs:
+        yield from _with_subproofs(subproof)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from .timings import ClaimTiming
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import Any, Final
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+SCHEMA_VERSION: Final = 1
+
+
+class ProofStore:
+    """Digests, status and timings of the claims proven in a save directory, in an SQLite database.
+
+    The database is in WAL mode, so reads are not blocked by the workers updating their claims, and each update only
+    writes the row of its claim. Each operation opens its own connection, so a store can be passed to worker
+    processes. When the database is created, the digests of an existing `digest` file and the timings of an existing
+    `timings` file are imported into it.
+    """
+
+    db_file: Path
+
+    def __init__(self, save_directory: Path):
+        self.db_file = save_directory / 'proofs.db'
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('BEGIN IMMEDIATE')
+            if conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS claims ('
+                    'label TEXT PRIMARY KEY, digest TEXT, status TEXT, time REAL, nodes INTEGER, updated REAL'
+                    ')'
+                )
+                _migrate(conn, save_directory)
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.execute('COMMIT')
+
+    def digest(self, label: str) -> str | None:
+        return self._get(label, 'digest')
+
+    def set_digest(self, label: str, digest: str) -> None:
+        self._set(label, digest=digest)
+
+    def status(self, label: str) -> str | None:
+        return self._get(label, 'status')
+
+    def set_status(self, label: str, status: str) -> None:
+        self._set(label, status=status)
+
+    def timings(self) -> dict[str, ClaimTiming]:
+        with self._connect() as conn:
+            rows = conn.execute('SELECT label, time, nodes FROM claims WHERE time IS NOT NULL').fetchall()
+        return {label: ClaimTiming(time, nodes) for label, time, nodes in rows}
+
+    def record_timing(self, label: str, timing: ClaimTiming) -> None:
+        self._set(label, time=round(timing.time, 3), nodes=timing.nodes)
+
+    def _get(self, label: str, column: str) -> Any:
+        with self._connect() as conn:
+            row = conn.execute(f'SELECT {column} FROM claims WHERE label = ?', (label,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _set(self, label: str, **values: Any) -> None:
+        values['updated'] = time.time()
+        columns = ', '.join(values)
+        placeholders = ', '.join('?' for _ in values)
+        updates = ', '.join(f'{column} = excluded.{column}' for column in values)
+        with self._connect() as conn:
+            conn.execute(
+                f'INSERT INTO claims (label, {columns}) VALUES (?, {placeholders}) '
+                f'ON CONFLICT (label) DO UPDATE SET {updates}',
+                (label, *values.values()),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_file, timeout=60, isolation_level=None)
+        try:
+            conn.execute('PRAGMA synchronous = NORMAL')
+            yield conn
+        finally:
+            conn.close()
+
+
+def _migrate(conn: sqlite3.Connection, save_directory: Path) -> None:
+    digest_file = save_directory / 'digest'
+    if digest_file.exists():
+        digests = json.loads(digest_file.read_text()).get('claims', {})
+        conn.executemany(
+            'INSERT INTO claims (label, digest) VALUES (?, ?) ON CONFLICT (label) DO UPDATE SET digest = excluded.digest',
+            digests.items(),
+        )
+        _LOGGER.info(f'Imported {len(digests)} claim digests from: {digest_file}')
+
+    timings_file = save_directory / 'timings'
+    if timings_file.exists():
+        timings = json.loads(timings_file.read_text()).get('claims', {})
+        conn.executemany(
+            'INSERT INTO claims (label, time, nodes) VALUES (?, ?, ?) '
+            'ON CONFLICT (label) DO UPDATE SET time = excluded.time, nodes = excluded.nodes',
+            [(label, timing['time'], timing.get('nodes')) for label, timing in timings.items()],
+        )
+        _LOGGER.info(f'Imported {len(timings)} claim timings from: {timings_file}')
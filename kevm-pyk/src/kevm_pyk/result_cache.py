@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from functools import cache, cached_property
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+from pyk.kdist import kdist
+
+from . import VERSION
+from .interpreter import GSTTestResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Final
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """On-disk cache of GST test results, keyed by the test, the chain options and the kompiled LLVM definition.
+
+    Keys also include the kevm-pyk version, as the conversion of the test to KORE changes with it. Only results with an exit code are stored, errors and timeouts are always re-run. With `refresh`, stored results
+    are never reused, but are still overwritten by fresh ones.
+    """
+
+    cache_dir: Path
+    refresh: bool
+    _definition_dir: Path | None
+
+    def __init__(self, cache_dir: Path, *, definition_dir: Path | None = None, refresh: bool = False):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.refresh = refresh
+        self._definition_dir = definition_dir
+
+    @cached_property
+    def definition_digest(self) -> str:
+        return definition_digest(self._definition_dir or kdist.get('evm-semantics.llvm'))
+
+    def key(
+        self,
+        test_name: str,
+        test: Any,
+        schedule: str,
+        mode: str,
+        chainid: int,
+        usegas: bool,
+        *,
+        normalize: bool = False,
+        preload: bool = False,
+    ) -> str:
+        digest = hashlib.sha256(json.dumps({test_name: test}, sort_keys=True).encode())
+        options = (schedule, mode, chainid, usegas, normalize, preload, VERSION, self.definition_digest)
+        digest.update(''.join(f'\0{option}' for option in options).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str, test_name: str) -> GSTTestResult | None:
+        if self.refresh:
+            return None
+        try:
+            dct = json.loads(self._entry(key).read_text())
+        except FileNotFoundError:
+            return None
+        _LOGGER.info(f'Result cache hit: {test_name}')
+        return GSTTestResult(test_name, dct['exit_code'], time=dct.get('time'), max_rss=dct.get('max_rss'), cached=True)
+
+    def put(self, key: str, result: GSTTestResult) -> None:
+        if result.exit_code is None or result.cached:
+            return
+        entry = self._entry(key)
+        entry.parent.mkdir(exist_ok=True)
+        dct = {'exit_code': result.exit_code, 'time': result.time, 'max_rss': result.max_rss}
+        with NamedTemporaryFile('w', dir=entry.parent, prefix='.', delete=False) as tmp_file:
+            tmp_file.write(json.dumps(dct))
+        os.replace(tmp_file.name, entry)
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.json'
+
+
+@cache
+def definition_digest(definition_dir: Path) -> str:
+    """Hash the names and contents of all files of a kompiled definition, including the interpreter binary."""
+    digest = hashlib.sha256()
+    for path in sorted(path for path in definition_dir.rglob('*') if path.is_file()):
+        digest.update(f'\0{path.relative_to(definition_dir).as_posix()}\0'.encode())
+        with path.open('rb') as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+    return digest.hexdigest()
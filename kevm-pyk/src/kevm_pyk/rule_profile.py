@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, NamedTuple
+
+from pyk.kdist import kdist
+from pyk.konvert import unmunge
+from pyk.kore.parser import KoreParser
+from pyk.kore.syntax import Rewrites, String
+from pyk.utils import run_process_2
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from typing import Final, TextIO
+
+    from pyk.kore.syntax import Axiom
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class Rule(NamedTuple):
+    name: str
+    rewrite: bool
+
+
+@dataclass(frozen=True)
+class RuleProfile:
+    """Rule application counts of an LLVM run, from the proof hints of a definition kompiled with instrumentation.
+
+    `stacks` counts the applications of each rule by the semantic step and function it was applied in, as frames
+    from the outermost in.
+    """
+
+    counts: Counter[str]
+    stacks: Counter[tuple[str, ...]]
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def table(self, *, limit: int | None = None) -> str:
+        rows = self.counts.most_common(limit)
+        width = max([len('Count')] + [len(str(count)) for _, count in rows])
+        lines = [f'{"Count".rjust(width)}  {"%":>6}  Rule']
+        lines += [f'{count:>{width}}  {100 * count / self.total:>6.2f}  {rule}' for rule, count in rows]
+        return '\n'.join(lines)
+
+    def write_collapsed(self, output: TextIO) -> None:
+        """Write the stacks in the collapsed format of `flamegraph.pl` and compatible tools."""
+        for stack, count in sorted(self.stacks.items()):
+            output.write(';'.join(frame.replace(';', ',') for frame in stack) + f' {count}\n')
+
+
+def profile_rules(init_kore: bytes, *, definition_dir: Path | None = None, depth: int = -1) -> RuleProfile:
+    """Run the interpreter of a definition kompiled with `--llvm-proof-hint-instrumentation` and count rules."""
+    if definition_dir is None:
+        definition_dir = kdist.get('evm-semantics.llvm-profile')
+
+    with TemporaryDirectory(prefix='kevm-profile-') as tmp_dir_name:
+        tmp_dir = Path(tmp_dir_name)
+        input_file = tmp_dir / 'input.kore'
+        input_file.write_bytes(init_kore)
+        header_file = tmp_dir / 'header.bin'
+        hints_file = tmp_dir / 'hints.bin'
+
+        run_process_2(
+            ['kore-rich-header', str(definition_dir / 'definition.kore'), '-o', str(header_file)], logger=_LOGGER
+        )
+        args = [str(definition_dir / 'interpreter'), str(input_file), str(depth), str(hints_file), '--proof-output']
+        run_process_2(args, logger=_LOGGER)
+
+        return _profile_events(_hint_events(hints_file, header_file), rules(definition_dir))
+
+
+def _hint_events(hints_file: Path, header_file: Path) -> Iterator[int | str]:
+    from pyk.kllvm.hints.prooftrace import KoreHeader, LLVMFunctionEvent, LLVMRewriteTraceIterator, LLVMRuleEvent
+
+    for annotated in LLVMRewriteTraceIterator.from_file(hints_file, KoreHeader.create(header_file)):
+        if not annotated.event.is_step_event():
+            continue
+        event = annotated.event.step_event
+        if isinstance(event, LLVMRuleEvent):
+            yield event.rule_ordinal
+        elif isinstance(event, LLVMFunctionEvent):
+            yield event.name
+
+
+def _profile_events(events: Iterable[int | str], rules: Mapping[int, Rule]) -> RuleProfile:
+    """Count rule applications, given as rule ordinals, and function calls, given as symbols, in trace order."""
+    counts: Counter[str] = Counter()
+    stacks: Counter[tuple[str, ...]] = Counter()
+    step: str | None = None
+    function: str | None = None
+    for event in events:
+        if isinstance(event, str):
+            function = _function_name(event)
+        else:
+            rule = rules.get(event, Rule(f'<rule {event}>', False))
+            counts[rule.name] += 1
+            if rule.rewrite:
+                step, function = rule.name, None
+                stacks[(rule.name,)] += 1
+            else:
+                stacks[(step or '<init>', function or '<function>', rule.name)] += 1
+    return RuleProfile(counts, stacks)
+
+
+def _function_name(symbol: str) -> str:
+    return unmunge(symbol[3:]) if symbol.startswith('Lbl') else symbol
+
+
+_LOCATION_PATTERN: Final = re.compile(r'Location\((\d+),')
+_SOURCE_PATTERN: Final = re.compile(r'Source\((.*)\)')
+
+
+@cache
+def rules(definition_dir: Path) -> dict[int, Rule]:
+    """Name the axioms of a kompiled definition by their ordinal, by label or else by source file and line."""
+    _LOGGER.info(f'Parsing definition: {definition_dir}')
+    definition = KoreParser((definition_dir / 'definition.kore').read_text()).definition()
+    return {ordinal: _rule(ordinal, axiom) for ordinal, axiom in enumerate(definition.axioms)}
+
+
+def _rule(ordinal: int, axiom: Axiom) -> Rule:
+    attrs: dict[str, str] = {}
+    for attr in axiom.attrs:
+        if len(attr.args) == 1 and isinstance(attr.args[0], String):
+            attrs[attr.symbol] = attr.args[0].value
+    rewrite = type(axiom.pattern) is Rewrites
+    if 'label' in attrs:
+        return Rule(attrs['label'], rewrite)
+    source = _SOURCE_PATTERN.fullmatch(attrs.get("org'Stop'kframework'Stop'attributes'Stop'Source", ''))
+    location = _LOCATION_PATTERN.match(attrs.get("org'Stop'kframework'Stop'attributes'Stop'Location", ''))
+    if source and location:
+        return Rule(f'{Path(source.group(1)).name}:{location.group(1)}', rewrite)
+    return Rule(f'<rule {ordinal}>', rewrite)
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import logging
+import socketserver
+from pathlib import Path
+from threading import BoundedSemaphore, Lock
+from typing import TYPE_CHECKING
+
+from pyk.kdist import kdist
+from pyk.kore.parser import KoreParser
+from pyk.kore.tools import PrintOutput, kore_print
+from pyk.ktool.krun import KRunOutput
+from pyk.utils import run_process_2
+
+from .cli import EVMChainOptions
+from .gst_to_kore import gst_to_kore
+from .interpreter import llvm_exit_code
+from .kevm import KEVM
+from .kllvm import kllvm_runtime, kllvm_runtime_available, text_to_llvm
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from typing import Any, Final
+
+    from .kore_cache import KoreCache
+
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class KEVMServer:
+    """Serve `run`, `kast` and `gst-to-kore` requests, keeping definitions and their parsers loaded between requests.
+
+    A request is a JSON object `{"id": ..., "method": ..., "params": {...}}`. It is answered with a message
+    `{"id": ..., "result": {...}}` per result, then `{"id": ..., "done": true}`, or `{"id": ..., "error": "..."}`
+    if it fails. The input is given in `params` as one of `input_file`, a GST file, or `gst`, a GST object. Programs
+    in concrete syntax are rejected, as parsing them starts a `kast` process per request. With `"stream": true`, each
+    test of a GST is converted or run separately, with its own result. The chain options and the `target`, `depth`
+    and `output` of `kevm run` and `kevm kast` can be given in `params`.
+
+    With the `kllvm` backend, the `llvm` target runs in the kllvm runtime loaded into the server, one run at a time, as
+    the runtime is not thread-safe. Otherwise, or if the runtime is not built, each run starts an interpreter process,
+    and at most `workers` of them run at the same time.
+    """
+
+    _kevms: dict[str, KEVM]
+    _kevms_lock: Lock
+    _workers: BoundedSemaphore
+    _runtime_lock: Lock
+    _backend: str
+    _kore_cache: KoreCache | None
+
+    def __init__(self, *, workers: int = 1, backend: str = 'kllvm', kore_cache: KoreCache | None = None):
+        if backend not in ('llvm', 'kllvm'):
+            raise ValueError(f'Unsupported interpreter backend: {backend}')
+        self._kevms = {}
+        self._kevms_lock = Lock()
+        self._workers = BoundedSemaphore(workers)
+        self._runtime_lock = Lock()
+        self._backend = backend
+        self._kore_cache = kore_cache
+
+    def kevm(self, target: str = 'llvm') -> KEVM:
+        with self._kevms_lock:
+            if target not in self._kevms:
+                _LOGGER.info(f'Loading definition: evm-semantics.{target}')
+                self._kevms[target] = KEVM(kdist.get(f'evm-semantics.{target}'))
+            return self._kevms[target]
+
+    def load(self, target: str) -> None:
+        """Load the definition of a target, and the kllvm runtime for it, upfront, instead of on its first request."""
+        self.kevm(target).definition
+        if target == 'llvm':
+            self._use_runtime(target)
+
+    def _use_runtime(self, target: str) -> bool:
+        return self._backend == 'kllvm' and target == 'llvm' and kllvm_runtime_available()
+
+    def handle(self, request: Mapping[str, Any]) -> Iterator[dict[str, Any]]:
+        request_id = request.get('id')
+        try:
+            params = request.get('params', {})
+            match request.get('method'):
+                case 'run':
+                    results = self._run(params)
+                case 'kast':
+                    results = self._kast(params)
+                case 'gst-to-kore':
+                    results = self._gst_to_kore(params)
+                case method:
+                    raise ValueError(f'Unknown method: {method}')
+            for result in results:
+                yield {'id': request_id, 'result': result}
+        except Exception as err:
+            _LOGGER.warning(f'Request failed: {request_id}', exc_info=True)
+            yield {'id': request_id, 'error': f'{type(err).__name__}: {err}'}
+            return
+        yield {'id': request_id, 'done': True}
+
+    def _gst_to_kore(self, params: Mapping[str, Any]) -> Iterator[dict[str, Any]]:
+        for test_name, kore_text in self._init_kore(params):
+            yield _with_test({'kore': kore_text}, test_name)
+
+    def _run(self, params: Mapping[str, Any]) -> Iterator[dict[str, Any]]:
+        target = params.get('target', 'llvm')
+        kevm = self.kevm(target)
+        output = KRunOutput(params.get('output', 'kore'))
+        depth = params.get('depth')
+        interpret = self._interpret_runtime if self._use_runtime(target) else self._interpret
+        for test_name, kore_text in self._init_kore(params):
+            exit_code, output_text = interpret(kevm, kore_text, -1 if depth is None else depth)
+            result = {'exit_code': exit_code, 'output': _krun_output(kevm, output_text, output)}
+            yield _with_test(result, test_name)
+
+    def _kast(self, params: Mapping[str, Any]) -> Iterator[dict[str, Any]]:
+        kevm = self.kevm(params.get('target', 'llvm'))
+        output = PrintOutput(params.get('output', 'kore'))
+        for test_name, kore_text in self._init_kore(params):
+            output_text = kore_text if output is PrintOutput.KORE else _kore_print(kevm, kore_text, output)
+            yield _with_test({'output': output_text}, test_name)
+
+    def _interpret(self, kevm: KEVM, kore_text: str, depth: int) -> tuple[int, str]:
+        interpreter = kevm.definition_dir / 'interpreter'
+        with self._workers:
+            proc_res = run_process_2(
+                [str(interpreter), '/dev/stdin', str(depth), '/dev/stdout'], input=kore_text, check=False
+            )
+        return proc_res.returncode, proc_res.stdout
+
+    def _interpret_runtime(self, kevm: KEVM, kore_text: str, depth: int) -> tuple[int, str]:
+        init_pattern = text_to_llvm(kore_text)
+        with self._runtime_lock:
+            pattern = kllvm_runtime().step(init_pattern, depth=None if depth < 0 else depth)
+        return llvm_exit_code(pattern), str(pattern)
+
+    def _init_kore(self, params: Mapping[str, Any]) -> Iterator[tuple[str | None, str]]:
+        chain = {key: params.get(key, default) for key, default in EVMChainOptions.default().items()}
+        gst_data = _read_input(params)
+
+        if params.get('stream', False):
+            for test_name, test in gst_data.items():
+                yield test_name, self._gst_to_kore_text({test_name: test}, chain)
+            return
+        yield None, self._gst_to_kore_text(gst_data, chain)
+
+    def _gst_to_kore_text(self, gst_data: Any, chain: Mapping[str, Any]) -> str:
+        if self._kore_cache is not None:
+            gst_bytes = json.dumps(gst_data, sort_keys=True).encode()
+            return self._kore_cache.gst_to_kore(gst_bytes, **chain).decode()
+        return gst_to_kore(gst_data, **chain).text
+
+
+def _read_input(params: Mapping[str, Any]) -> Any:
+    if 'pgm' in params:
+        raise ValueError('Programs are not supported by the server, give a GST or convert them with kevm kast')
+    inputs = [key for key in ('input_file', 'gst') if key in params]
+    if len(inputs) != 1:
+        raise ValueError(f'Expected exactly one of input_file and gst, got: {", ".join(inputs) or "none"}')
+
+    if 'gst' in params:
+        return params['gst']
+
+    input_file = Path(params['input_file'])
+    try:
+        return json.loads(input_file.read_text())
+    except json.JSONDecodeError as err:
+        raise ValueError(f'Expected a GST file, programs are not supported by the server: {input_file}') from err
+
+
+def _with_test(result: dict[str, Any], test_name: str | None) -> dict[str, Any]:
+    return result if test_name is None else {'test': test_name} | result
+
+
+def _krun_output(kevm: KEVM, kore_text: str, output: KRunOutput) -> str | None:
+    match output:
+        case KRunOutput.NONE:
+            return None
+        case KRunOutput.KORE:
+            return kore_text.rstrip()
+        case KRunOutput.JSON:
+            return kevm.kore_to_kast(KoreParser(kore_text).pattern()).to_json()
+        case _:
+            return _kore_print(kevm, kore_text, PrintOutput(output.value))
+
+
+def _kore_print(kevm: KEVM, kore_text: str, output: PrintOutput) -> str:
+    return kore_print(kore_text, definition_dir=kevm.definition_dir, output=output)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: _ThreadingUnixServer | _ThreadingTCPServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as err:
+                self._send([{'id': None, 'error': f'Invalid request: {err}'}])
+                continue
+            if type(request) is not dict:
+                self._send([{'id': None, 'error': f'Invalid request, expected an object: {line.decode().strip()}'}])
+                continue
+            self._send(self.server.kevm_server.handle(request))
+
+    def _send(self, messages: Iterable[dict[str, Any]]) -> None:
+        for message in messages:
+            self.wfile.write(json.dumps(message).encode() + b'\n')
+            self.wfile.flush()
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    kevm_server: KEVMServer
+
+
+class _ThreadingTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    kevm_server: KEVMServer
+
+
+def make_server(
+    kevm_server: KEVMServer, *, socket_path: Path | None = None, port: int | None = None
+) -> _ThreadingUnixServer | _ThreadingTCPServer:
+    """Listen on a Unix socket or on a localhost TCP port, answering the JSON lines requests of each connection.
+
+    Each connection is served by its own thread, requests on a connection are answered in order.
+    """
+    server: _ThreadingUnixServer | _ThreadingTCPServer
+    if socket_path is not None and port is None:
+        if socket_path.is_socket():
+            socket_path.unlink()
+        server = _ThreadingUnixServer(str(socket_path), _RequestHandler)
+    elif port is not None and socket_path is None:
+        server = _ThreadingTCPServer(('127.0.0.1', port), _RequestHandler)
+    else:
+        raise ValueError('Expected exactly one of a socket path and a port')
+    server.kevm_server = kevm_server
+    return server
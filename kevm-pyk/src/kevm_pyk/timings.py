@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import graphlib
+import heapq
+from dataclasses import dataclass
+from statistics import fmean
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+
+@dataclass(frozen=True)
+class ClaimTiming:
+    """Wall time in seconds of the last run of a proof, and the number of nodes in its KCFG if it has one."""
+
+    time: float
+    nodes: int | None = None
+
+
+def claim_costs(labels: Iterable[str], timings: Mapping[str, ClaimTiming], default: float = 1.0) -> dict[str, float]:
+    """Expected time of each claim: its last time, or the mean time of the claims with timings if it has none."""
+    labels = list(labels)
+    known = [timings[label].time for label in labels if label in timings]
+    unknown_cost = fmean(known) if known else default
+    return {label: timings[label].time if label in timings else unknown_cost for label in labels}
+
+
+def critical_path_priorities(graph: Mapping[str, Iterable[str]], costs: Mapping[str, float]) -> dict[str, float]:
+    """Cost of the most expensive chain of claims starting at each claim, ending at a claim nothing depends on.
+
+    Starting the ready claim with the highest priority first schedules the critical path, then longest-first.
+    """
+    dependents: dict[str, list[str]] = {label: [] for label in graph}
+    for label, dependencies in graph.items():
+        for dependency in dependencies:
+            dependents.setdefault(dependency, []).append(label)
+
+    priorities: dict[str, float] = {}
+    for label in reversed(list(graphlib.TopologicalSorter(graph).static_order())):
+        priorities[label] = costs[label] + max((priorities[dependent] for dependent in dependents[label]), default=0)
+    return priorities
+
+
+@dataclass(frozen=True)
+class MakespanEstimate:
+    makespan: float
+    total: float
+    critical_path: float
+
+
+def estimate_makespan(graph: Mapping[str, Iterable[str]], costs: Mapping[str, float], workers: int) -> MakespanEstimate:
+    """Simulate running the claims on `workers` workers, starting the ready claims by `critical_path_priorities`."""
+    priorities = critical_path_priorities(graph, costs)
+    sorter = graphlib.TopologicalSorter(graph)
+    sorter.prepare()
+    ready: list[tuple[float, str]] = []
+    running: list[tuple[float, str]] = []
+    now = 0.0
+    while sorter.is_active():
+        for label in sorter.get_ready():
+            heapq.heappush(ready, (-priorities[label], label))
+        while ready and len(running) < workers:
+            _, label = heapq.heappop(ready)
+            heapq.heappush(running, (now + costs[label], label))
+        now, label = heapq.heappop(running)
+        sorter.done(label)
+    return MakespanEstimate(
+        makespan=now,
+        total=sum(costs[label] for label in priorities),
+        critical_path=max(priorities.values(), default=0),
+    )
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import graphlib
+import heapq
 import logging
+import socket
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
+from itertools import count
+from multiprocessing.managers import BaseManager
 from pathlib import Path
+from threading import Condition
 from typing import TYPE_CHECKING
 
 from pyk.cterm import CTermSymbolic
@@ -27,19 +34,21 @@ from pyk.proof.proof import parallel_advance_proof
 from pyk.utils import single
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Iterable, Iterator
-    from typing import Final, TypeVar
+    from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+    from concurrent.futures import Future
+    from typing import Any, Final, TypeVar
 
     from pyk.kast.outer import KClaim, KDefinition
     from pyk.kcfg import KCFG
     from pyk.kcfg.semantics import KCFGSemantics
-    from pyk.kore.rpc import FallbackReason
+    from pyk.kore.rpc import FallbackReason, KoreServer
     from pyk.ktool.kprint import KPrint
     from pyk.ktool.kprove import KProve
     from pyk.proof.proof import Proof
     from pyk.utils import BugReport
     from rich.progress import Progress, TaskID
 
+    T = TypeVar('T')
     T1 = TypeVar('T1')
     T2 = TypeVar('T2')
 
@@ -64,6 +73,38 @@ def claim_dependency_dict(claims: Iterable[KClaim], spec_module_name: str | None
     return graph
 
 
+def run_in_dependency_order(
+    graph: Mapping[str, Iterable[str]],
+    start: Callable[[str], Callable[[], T]],
+    *,
+    max_running: int = 1,
+    priorities: Mapping[str, float] | None = None,
+) -> Iterator[tuple[str, T]]:
+    """Start each node of a dependency graph as soon as its own dependencies are done, yielding results as they arrive.
+
+    `start` begins running a node and returns a function that waits for its result. At most `max_running` nodes
+    are running at a time. Of the nodes ready to start, those with the highest `priorities` are started first.
+    """
+    sorter = graphlib.TopologicalSorter(graph)
+    sorter.prepare()
+    ready: list[tuple[float, int, str]] = []
+    ready_order = count()
+    running: dict[Future[T], str] = {}
+    with ThreadPoolExecutor(max_workers=max_running) as executor:
+        while sorter.is_active():
+            for node in sorter.get_ready():
+                priority = priorities.get(node, 0) if priorities is not None else 0
+                heapq.heappush(ready, (-priority, next(ready_order), node))
+            while ready and len(running) < max_running:
+                *_, node = heapq.heappop(ready)
+                running[executor.submit(start(node))] = node
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                sorter.done(node)
+                yield node, future.result()
+
+
 def get_apr_proof_for_spec(
     kprove: KProve,
     spec_file: Path,
@@ -401,3 +442,106 @@ def legacy_explore(
                 client, kprint.definition, log_succ_rewrites=log_succ_rewrites, log_fail_rewrites=log_fail_rewrites
             )
             yield KCFGExplore(cterm_symbolic, kcfg_semantics=kcfg_semantics, id=id)
+
+
+class KoreServerPool:
+    """Kore RPC servers that are kept running between claims, each leased to one claim at a time.
+
+    Up to `size` servers are started on demand with the `kore_server` arguments `server_args`. Before a server is
+    leased again, it is checked to still accept connections, and restarted if it does not.
+    """
+
+    _server_args: dict[str, Any]
+    _size: int
+    _started: int
+    _idle: list[KoreServer]
+    _leased: dict[int, KoreServer]
+    _cond: Condition
+
+    def __init__(self, size: int = 1, **server_args: Any):
+        if size < 1:
+            raise ValueError(f'Expected positive pool size, got: {size}')
+        self._server_args = server_args
+        self._size = size
+        self._started = 0
+        self._idle = []
+        self._leased = {}
+        self._cond = Condition()
+
+    def acquire(self) -> int:
+        """Lease a server, waiting for one to be released if all are leased, and return its port."""
+        server: KoreServer | None = None
+        with self._cond:
+            while not self._idle and self._started >= self._size:
+                self._cond.wait()
+            if self._idle:
+                server = self._idle.pop()
+            else:
+                self._started += 1
+
+        if server is not None and not _accepts_connections(server):
+            _LOGGER.warning(f'Restarting KoreServer that stopped responding: {server.host}:{server.port}')
+            server.close()
+            server = None
+
+        if server is None:
+            try:
+                server = kore_server(**self._server_args)
+            except BaseException:
+                with self._cond:
+                    self._started -= 1
+                    self._cond.notify()
+                raise
+
+        with self._cond:
+            self._leased[server.port] = server
+        return server.port
+
+    def release(self, port: int, *, restart: bool = False) -> None:
+        """Return a leased server to the pool, or stop it if `restart` is set, for a new one to be started instead."""
+        with self._cond:
+            server = self._leased.pop(port)
+            if not restart:
+                self._idle.append(server)
+                self._cond.notify()
+                return
+        server.close()
+        with self._cond:
+            self._started -= 1
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            servers = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+            self._started = 0
+        for server in servers:
+            server.close()
+
+
+class KoreServerPoolManager(BaseManager):
+    """Run a `KoreServerPool` in a separate process, to share it between the processes of a process pool."""
+
+
+KoreServerPoolManager.register('KoreServerPool', KoreServerPool)
+
+
+@contextmanager
+def lease_kore_server(server_pool: KoreServerPool) -> Iterator[int]:
+    """Lease a server from the pool, and have it restarted if the code using it raises an exception."""
+    port = server_pool.acquire()
+    try:
+        yield port
+    except BaseException:
+        server_pool.release(port, restart=True)
+        raise
+    server_pool.release(port)
+
+
+def _accepts_connections(server: KoreServer) -> bool:
+    try:
+        with socket.create_connection((server.host, server.port), timeout=1):
+            return True
+    except OSError:
+        return False
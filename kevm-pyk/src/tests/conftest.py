@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
+from kevm_pyk.result_cache import ResultCache
+
 if TYPE_CHECKING:
-    from pytest import FixtureRequest, Parser
+    from pytest import Config, FixtureRequest, Item, Parser, Session, TestReport
+
+
+# Test durations in seconds, by node ID, recorded on the xdist controller or the only process
+_DURATIONS: dict[str, float] = {}
 
 
 def pytest_addoption(parser: Parser) -> None:
@@ -45,6 +52,83 @@ def pytest_addoption(parser: Parser) -> None:
         action='store_true',
         help='Use sequential, single-threaded proof loop.',
     )
+    parser.addoption(
+        '--conformance-workers',
+        type=int,
+        default=1,
+        help='Number of processes to run the tests of a single conformance fixture with.',
+    )
+    parser.addoption(
+        '--normalize-gst',
+        default=False,
+        action='store_true',
+        help='Normalize GST input in Python before running conformance tests.',
+    )
+    parser.addoption(
+        '--preload-pre-state',
+        default=False,
+        action='store_true',
+        help='Build the pre-state into the initial configuration for conformance tests.',
+    )
+    parser.addoption(
+        '--snapshot-pre-state',
+        default=False,
+        action='store_true',
+        help='Run conformance tests sharing a pre-state from a single serialized initial configuration.',
+    )
+    parser.addoption(
+        '--result-cache-dir',
+        type=Path,
+        help='Only re-run conformance tests whose input or kompiled definition changed since they were cached here.',
+    )
+    parser.addoption(
+        '--force-rerun',
+        default=False,
+        action='store_true',
+        help='Re-run all conformance tests, refreshing the result cache.',
+    )
+    parser.addoption(
+        '--conformance-durations',
+        type=Path,
+        help='Run the longest conformance tests first by their durations in this file, and update it with the new durations.',
+    )
+
+
+def pytest_collection_modifyitems(config: Config, items: list[Item]) -> None:
+    durations_file = config.getoption('--conformance-durations')
+    if durations_file is None:
+        return
+    durations = json.loads(durations_file.read_text()) if durations_file.exists() else {}
+    # Longest processing time first, tests without a duration might be the longest. The order is the same on every
+    # xdist worker, so the load scheduler hands out the longest remaining test to whichever worker is idle first.
+    # Other tests keep their positions, the conformance tests are only reordered among themselves.
+    positions = [i for i, item in enumerate(items) if _is_conformance(item.nodeid)]
+    conformance = sorted((items[i] for i in positions), key=lambda item: -durations.get(item.nodeid, float('inf')))
+    for i, item in zip(positions, conformance, strict=True):
+        items[i] = item
+
+
+def pytest_runtest_logreport(report: TestReport) -> None:
+    if not _is_conformance(report.nodeid):
+        return
+    if report.when == 'call' or report.when == 'setup' and report.skipped:
+        _DURATIONS[report.nodeid] = round(report.duration, 3)
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    config = session.config
+    durations_file = config.getoption('--conformance-durations')
+    if durations_file is None or hasattr(config, 'workerinput'):
+        return
+    # Keep the durations of tests that were deselected or not run this time
+    durations = json.loads(durations_file.read_text()) if durations_file.exists() else {}
+    durations.update(_DURATIONS)
+    durations_file.parent.mkdir(parents=True, exist_ok=True)
+    durations_file.write_text(json.dumps(durations, indent=2, sort_keys=True) + '\n')
+
+
+def _is_conformance(nodeid: str) -> bool:
+    return nodeid.split('::', 1)[0].endswith('integration/test_conformance.py')
 
 
 @pytest.fixture
@@ -75,3 +159,31 @@ def spec_name(request: FixtureRequest) -> str | None:
 @pytest.fixture(scope='session')
 def kompiled_targets_dir(request: FixtureRequest) -> Path | None:
     return request.config.getoption('--kompiled-targets-dir')
+
+
+@pytest.fixture(scope='session')
+def conformance_workers(request: FixtureRequest) -> int:
+    return request.config.getoption('--conformance-workers')
+
+
+@pytest.fixture(scope='session')
+def normalize_gst(request: FixtureRequest) -> bool:
+    return request.config.getoption('--normalize-gst')
+
+
+@pytest.fixture(scope='session')
+def preload_pre_state(request: FixtureRequest) -> bool:
+    return request.config.getoption('--preload-pre-state')
+
+
+@pytest.fixture(scope='session')
+def snapshot_pre_state(request: FixtureRequest) -> bool:
+    return request.config.getoption('--snapshot-pre-state')
+
+
+@pytest.fixture(scope='session')
+def result_cache(request: FixtureRequest) -> ResultCache | None:
+    result_cache_dir = request.config.getoption('--result-cache-dir')
+    if result_cache_dir is None:
+        return None
+    return ResultCache(result_cache_dir, refresh=request.config.getoption('--force-rerun'))
@@ -1,26 +1,32 @@
 from __future__ import annotations
 
-import csv
+import difflib
 import json
 import logging
 import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from typing import TYPE_CHECKING
 
 import pytest
 from pyk.kdist import kdist
-from pyk.kore.prelude import int_dv
-from pyk.kore.syntax import App
 from pyk.kore.tools import PrintOutput, kore_print
 
-from kevm_pyk.interpreter import interpret
+from kevm_pyk.conformance import read_test_list, skipped_tests
+from kevm_pyk.interpreter import interpret, interpret_tests
 
 from ..utils import REPO_ROOT
 
 if TYPE_CHECKING:
-    from typing import Final
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Executor
+    from pathlib import Path
+    from typing import Any, Final
 
-    from pyk.kore.syntax import Pattern
+    from pytest import Metafunc
+
+    from kevm_pyk.interpreter import GSTTestResult
+    from kevm_pyk.result_cache import ResultCache
 
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -33,99 +39,170 @@ TEST_DIR: Final = REPO_ROOT / 'tests/ethereum-tests'
 GOLDEN: Final = (REPO_ROOT / 'tests/templates/output-success-llvm.json').read_text().rstrip()
 
 
-def _test(gst_file: Path, schedule: str, mode: str, chainid: int, usegas: bool) -> None:
-    skipped_gst_tests = SKIPPED_TESTS.get(gst_file, [])
+@pytest.fixture(scope='module')
+def executor(conformance_workers: int) -> Iterator[Executor | None]:
+    if conformance_workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=conformance_workers) as executor:
+        yield executor
+
+
+@pytest.fixture(scope='module')
+def interpret_options(
+    normalize_gst: bool, preload_pre_state: bool, snapshot_pre_state: bool, result_cache: ResultCache | None
+) -> dict[str, Any]:
+    return {
+        'normalize': normalize_gst,
+        'preload': preload_pre_state,
+        'snapshot': snapshot_pre_state,
+        'result_cache': result_cache,
+    }
+
+
+def _test(
+    gst_file: Path,
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    executor: Executor | None,
+    interpret_options: dict[str, Any],
+    record_property: Callable[[str, object], None],
+) -> None:
+    skipped_gst_tests = _skipped_tests().get(gst_file, [])
     if '*' in skipped_gst_tests:
         pytest.skip()
 
     with gst_file.open() as f:
         gst_data = json.load(f)
 
-    for test_name, test in gst_data.items():
-        _LOGGER.info(f'Running test: {gst_file} - {test_name}')
-        if test_name in skipped_gst_tests:
-            continue
-        res = interpret({test_name: test}, schedule, mode, chainid, usegas, check=False)
-        _assert_exit_code_zero(res)
-
-
-def _assert_exit_code_zero(pattern: Pattern) -> None:
-    assert type(pattern) is App
-    kevm_cell = pattern.args[0]
-    assert type(kevm_cell) is App
-    exit_code_cell = kevm_cell.args[1]
-    assert type(exit_code_cell) is App
+    _LOGGER.info(f'Running tests: {gst_file}')
+    results = list(
+        interpret_tests(
+            gst_data,
+            schedule,
+            mode,
+            chainid,
+            usegas,
+            executor=executor,
+            skip=skipped_gst_tests,
+            **interpret_options,
+        )
+    )
+    for result in results:
+        record_property(result.test_name, 'skipped' if result.skipped else 'passed' if result.passed else 'failed')
+
+    if all(result.skipped for result in results):
+        pytest.skip()
 
-    exit_code = exit_code_cell.args[0]
-    if exit_code == int_dv(0):
-        return
+    failures = [
+        _failure(gst_data, result, schedule, mode, chainid, usegas, interpret_options)
+        for result in results
+        if _failed(result)
+    ]
+    assert not failures, '\n\n'.join(failures)
+
+
+def _failed(result: GSTTestResult) -> bool:
+    return not result.skipped and not result.passed
+
+
+def _failure(
+    gst_data: dict,
+    result: GSTTestResult,
+    schedule: str,
+    mode: str,
+    chainid: int,
+    usegas: bool,
+    interpret_options: dict[str, Any],
+) -> str:
+    if result.error is not None:
+        return f'{result.test_name}: {result.error}'
+
+    # Re-run for the full configuration only to report the failure, a snapshot is the preloaded configuration
+    test_name = result.test_name
+    res = interpret(
+        {test_name: gst_data[test_name]},
+        schedule,
+        mode,
+        chainid,
+        usegas,
+        check=False,
+        normalize=interpret_options['normalize'],
+        preload=interpret_options['preload'] or interpret_options['snapshot'],
+    )
+    pretty = kore_print(res, definition_dir=kdist.get('evm-semantics.llvm'), output=PrintOutput.PRETTY)
+    diff = difflib.unified_diff(GOLDEN.splitlines(), pretty.splitlines(), 'expected', test_name, lineterm='')
+    return f'{test_name}: exit code {result.exit_code}\n' + '\n'.join(diff)
+
+
+@cache
+def _skipped_tests() -> dict[Path, list[str]]:
+    test_lists = (read_test_list(REPO_ROOT / 'tests/slow.llvm'), read_test_list(REPO_ROOT / 'tests/failing.llvm'))
+    return {TEST_DIR / test_file: tests for test_file, tests in skipped_tests(test_lists).items()}
 
-    pretty = kore_print(pattern, definition_dir=kdist.get('evm-semantics.llvm'), output=PrintOutput.PRETTY)
-    assert pretty == GOLDEN
 
+VM_TEST_DIR: Final = TEST_DIR / 'BlockchainTests/GeneralStateTests/VMTests'
+ALL_TEST_DIR: Final = TEST_DIR / 'BlockchainTests/GeneralStateTests'
 
-def _skipped_tests() -> dict[Path, list[str]]:
-    slow_tests = read_csv_file(REPO_ROOT / 'tests/slow.llvm')
-    failing_tests = read_csv_file(REPO_ROOT / 'tests/failing.llvm')
-    skipped: dict[Path, list[str]] = {}
-    for test_file, test in slow_tests + failing_tests:
-        test_file = TEST_DIR / test_file
-        skipped.setdefault(test_file, []).append(test)
-    return skipped
 
+@cache
+def _vm_tests() -> tuple[Path, ...]:
+    return tuple(sorted(VM_TEST_DIR.glob('*/*.json')))
 
-def read_csv_file(csv_file: Path) -> tuple[tuple[Path, str], ...]:
-    with csv_file.open(newline='') as file:
-        reader = csv.reader(file)
-        return tuple((Path(row[0]), row[1]) for row in reader)
 
+@cache
+def _bchain_tests() -> tuple[Path, ...]:
+    vm_tests = set(_vm_tests())
+    return tuple(sorted(test_file for test_file in ALL_TEST_DIR.glob('**/*.json') if test_file not in vm_tests))
 
-SKIPPED_TESTS: Final = _skipped_tests()
 
-VM_TEST_DIR: Final = TEST_DIR / 'BlockchainTests/GeneralStateTests/VMTests'
-VM_TESTS: Final = tuple(VM_TEST_DIR.glob('*/*.json'))
-SKIPPED_VM_TESTS: Final = tuple(test_file for test_file in VM_TESTS if test_file in SKIPPED_TESTS)
+def pytest_generate_tests(metafunc: Metafunc) -> None:
+    # Glob the fixtures on collection, not on import
+    if 'test_file' not in metafunc.fixturenames:
+        return
+    test_name = metafunc.function.__name__
+    test_dir = VM_TEST_DIR if test_name.endswith('_vm') else ALL_TEST_DIR
+    files = _vm_tests() if test_dir == VM_TEST_DIR else _bchain_tests()
+    if test_name.startswith('test_rest_'):
+        files = tuple(test_file for test_file in files if test_file in _skipped_tests())
+    metafunc.parametrize('test_file', files, ids=[str(test_file.relative_to(test_dir)) for test_file in files])
 
 
-@pytest.mark.parametrize(
-    'test_file',
-    VM_TESTS,
-    ids=[str(test_file.relative_to(VM_TEST_DIR)) for test_file in VM_TESTS],
-)
-def test_vm(test_file: Path) -> None:
-    _test(test_file, 'DEFAULT', 'VMTESTS', 1, True)
+def test_vm(
+    test_file: Path,
+    executor: Executor | None,
+    interpret_options: dict[str, Any],
+    record_property: Callable[[str, object], None],
+) -> None:
+    _test(test_file, 'DEFAULT', 'VMTESTS', 1, True, executor, interpret_options, record_property)
 
 
 @pytest.mark.skip(reason='failing / slow VM tests')
-@pytest.mark.parametrize(
-    'test_file',
-    SKIPPED_VM_TESTS,
-    ids=[str(test_file.relative_to(VM_TEST_DIR)) for test_file in SKIPPED_VM_TESTS],
-)
-def test_rest_vm(test_file: Path) -> None:
-    _test(test_file, 'DEFAULT', 'VMTESTS', 1, True)
-
-
-ALL_TEST_DIR: Final = TEST_DIR / 'BlockchainTests/GeneralStateTests'
-ALL_TESTS: Final = tuple(ALL_TEST_DIR.glob('**/*.json'))
-BCHAIN_TESTS: Final = tuple(test_file for test_file in ALL_TESTS if test_file not in set(VM_TESTS))
-SKIPPED_BCHAIN_TESTS: Final = tuple(test_file for test_file in BCHAIN_TESTS if test_file in SKIPPED_TESTS)
+def test_rest_vm(
+    test_file: Path,
+    executor: Executor | None,
+    interpret_options: dict[str, Any],
+    record_property: Callable[[str, object], None],
+) -> None:
+    _test(test_file, 'DEFAULT', 'VMTESTS', 1, True, executor, interpret_options, record_property)
 
 
-@pytest.mark.parametrize(
-    'test_file',
-    BCHAIN_TESTS,
-    ids=[str(test_file.relative_to(ALL_TEST_DIR)) for test_file in BCHAIN_TESTS],
-)
-def test_bchain(test_file: Path) -> None:
-    _test(test_file, 'CANCUN', 'NORMAL', 1, True)
+def test_bchain(
+    test_file: Path,
+    executor: Executor | None,
+    interpret_options: dict[str, Any],
+    record_property: Callable[[str, object], None],
+) -> None:
+    _test(test_file, 'CANCUN', 'NORMAL', 1, True, executor, interpret_options, record_property)
 
 
 @pytest.mark.skip(reason='failing / slow blockchain tests')
-@pytest.mark.parametrize(
-    'test_file',
-    SKIPPED_BCHAIN_TESTS,
-    ids=[str(test_file.relative_to(ALL_TEST_DIR)) for test_file in SKIPPED_BCHAIN_TESTS],
-)
-def test_rest_bchain(test_file: Path) -> None:
-    _test(test_file, 'CANCUN', 'NORMAL', 1, True)
+def test_rest_bchain(
+    test_file: Path,
+    executor: Executor | None,
+    interpret_options: dict[str, Any],
+    record_property: Callable[[str, object], None],
+) -> None:
+    _test(test_file, 'CANCUN', 'NORMAL', 1, True, executor, interpret_options, record_property)
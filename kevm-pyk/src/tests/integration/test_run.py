@@ -20,9 +20,16 @@ FAILING_DIR: Final = REPO_ROOT / 'tests/failing'
 TEST_DATA: Final = tuple(FAILING_DIR.glob('*.json'))
 assert TEST_DATA
 
+INTERPRETER_MODES: Final = (('llvm', False), ('llvm', True), ('kllvm', False))
 
+
+@pytest.mark.parametrize(
+    'backend,binary',
+    INTERPRETER_MODES,
+    ids=[f'{backend}-binary' if binary else backend for backend, binary in INTERPRETER_MODES],
+)
 @pytest.mark.parametrize('gst_file', TEST_DATA, ids=[str(gst_file.relative_to(FAILING_DIR)) for gst_file in TEST_DATA])
-def test_run(gst_file: Path, update_expected_output: bool) -> None:
+def test_run(gst_file: Path, backend: str, binary: bool, update_expected_output: bool) -> None:
     # Given
     expected_file = gst_file.with_suffix('.json.expected')
     expected = expected_file.read_text()
@@ -31,7 +38,7 @@ def test_run(gst_file: Path, update_expected_output: bool) -> None:
         gst_data = json.load(f)
 
     # When
-    pattern = interpret(gst_data, 'SHANGHAI', 'NORMAL', 1, True, check=False)
+    pattern = interpret(gst_data, 'SHANGHAI', 'NORMAL', 1, True, check=False, backend=backend, binary=binary)
     actual = kore_print(pattern, definition_dir=kdist.get('evm-semantics.llvm'), output=PrintOutput.PRETTY)
 
     # Then
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .test_startup import STARTUP_TIME_PROPERTY, TRIALS
+
+if TYPE_CHECKING:
+    from pytest import TerminalReporter
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter) -> None:
+    startup_times = [
+        (report.nodeid, value)
+        for report in terminalreporter.stats.get('passed', [])
+        for name, value in report.user_properties
+        if name == STARTUP_TIME_PROPERTY
+    ]
+    if not startup_times:
+        return
+    terminalreporter.write_sep('=', f'startup time (best of {TRIALS})')
+    for nodeid, startup_time in sorted(startup_times):
+        terminalreporter.write_line(f'{startup_time:.3f}s  {nodeid}')
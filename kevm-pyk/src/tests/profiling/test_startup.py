@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+    from typing import Final
+
+
+COMMANDS: Final = (
+    ('version',),
+    ('run', '--help'),
+    ('run-batch', '--help'),
+    ('conformance-report', '--help'),
+    ('bench', 'compare', '--help'),
+)
+
+# Only needed by the prover and the interactive commands
+HEAVY_MODULES: Final = ('pathos', 'textual', 'pyk.kcfg', 'pyk.kore.rpc', 'pyk.proof', 'kevm_pyk.kevm', 'kevm_pyk.utils')
+
+TRIALS: Final = 5
+
+STARTUP_TIME_PROPERTY: Final = 'startup_time'
+
+
+@pytest.mark.parametrize('command', COMMANDS, ids=[' '.join(command) for command in COMMANDS])
+def test_startup(command: tuple[str, ...], tmp_path: Path, record_property: Callable[[str, object], None]) -> None:
+    # Given
+    args = [sys.executable, '-X', 'importtime', '-m', 'kevm_pyk', *command]
+
+    # When
+    times = []
+    for _ in range(TRIALS):
+        start_time = time.perf_counter()
+        proc_res = subprocess.run(args, capture_output=True, text=True, check=True)
+        times.append(time.perf_counter() - start_time)
+
+    # Then
+    # Shown in the terminal summary, see `pytest_terminal_summary`
+    record_property(STARTUP_TIME_PROPERTY, min(times))
+    imports = _cumulative_import_times(proc_res.stderr)
+    with (tmp_path / 'startup.txt').open('w') as report:
+        report.write(f'Startup time: {min(times):.3f}s (best of {TRIALS})\n')
+        for module, usecs in sorted(imports.items(), key=lambda item: item[1], reverse=True):
+            report.write(f'{usecs:>10} us  {module}\n')
+
+    assert not [module for module in imports if _is_heavy(module)]
+
+
+def _is_heavy(module: str) -> bool:
+    return any(module == heavy or module.startswith(f'{heavy}.') for heavy in HEAVY_MODULES)
+
+
+def _cumulative_import_times(importtime_output: str) -> dict[str, int]:
+    """Parse the output of `python -X importtime` into the cumulative import time of each module in microseconds."""
+    res: dict[str, int] = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.removeprefix('import time:').split('|')
+        res[module.strip()] = int(cumulative)
+    return res
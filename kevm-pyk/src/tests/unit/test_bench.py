@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kevm_pyk.bench import Samples, compare_samples, read_samples, t_quantile
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Final
+
+
+T_QUANTILE_TEST_DATA: Final = (
+    (0.975, 1, 12.706, 0.001),
+    (0.975, 2, 4.303, 0.001),
+    (0.975, 3, 3.182, 0.001),
+    (0.975, 4, 2.776, 0.001),
+    (0.975, 5, 2.571, 0.005),
+    (0.025, 2, -4.303, 0.001),
+    (0.95, 1, 6.314, 0.001),
+    (0.975, 30, 2.042, 0.001),
+    (0.95, 10, 1.812, 0.001),
+)
+
+
+@pytest.mark.parametrize(
+    'p,df,expected,tolerance', T_QUANTILE_TEST_DATA, ids=[f'{p}-{df}' for p, df, *_ in T_QUANTILE_TEST_DATA]
+)
+def test_t_quantile(p: float, df: int, expected: float, tolerance: float) -> None:
+    assert t_quantile(p, df) == pytest.approx(expected, abs=tolerance)
+
+
+def test_read_samples(tmp_path: Path) -> None:
+    # Given
+    record = tmp_path / 'record.jsonl'
+    record.write_text(
+        '\n'.join(
+            json.dumps(entry)
+            for entry in (
+                {'test': 'prove', 'status': 'passed', 'time': 1.0, 'max_rss': 100},
+                {'test': 'prove', 'status': 'passed', 'time': 2.0, 'max_rss': 200},
+                {'test': 'failing', 'status': 'failed', 'time': 2.0},
+            )
+        )
+    )
+    conformance = tmp_path / 'conformance.jsonl'
+    conformance.write_text(
+        '\n'.join(
+            json.dumps(entry)
+            for entry in (
+                {'fixture': 'a.json', 'test': 'test', 'status': 'passed', 'time': 3.0},
+                {'fixture': 'a.json', 'test': 'test', 'status': 'passed', 'time': 3.0, 'cached': True},
+                {'fixture': 'a.json', 'test': 'cached', 'status': 'passed', 'time': 1.0, 'cached': True},
+            )
+        )
+    )
+
+    # When
+    actual = read_samples([record, conformance])
+
+    # Then
+    assert actual == {'prove': Samples([1.0, 2.0], [100, 200]), 'a.json:test': Samples([3.0], [])}
+
+
+def test_compare_samples() -> None:
+    # Given
+    baseline = {
+        'slower': Samples([10.0, 10.2, 9.8], [1000, 1000, 1000]),
+        'noisy': Samples([10.0, 6.0, 14.0], [1000, 1000, 1000]),
+        'fast': Samples([0.1, 0.1, 0.1], [1000, 1000, 1000]),
+        'removed': Samples([1.0], [1000]),
+    }
+    candidate = {
+        'slower': Samples([11.0, 11.2, 10.8], [1000, 1000, 1000]),
+        'noisy': Samples([12.0, 8.0, 16.0], [1200, 1200, 1200]),
+        'fast': Samples([0.2, 0.2, 0.2], [1000, 1000, 1000]),
+    }
+
+    # When
+    actual = compare_samples(baseline, candidate)
+
+    # Then
+    comparisons = {comparison.test: comparison for comparison in actual.tests}
+    assert comparisons['slower'].time_regression
+    assert comparisons['slower'].time.ci is not None
+    assert comparisons['slower'].time.ci[0] == pytest.approx(0.547, abs=0.005)
+    assert not comparisons['noisy'].time_regression
+    assert comparisons['noisy'].memory_regression
+    assert not comparisons['fast'].time_regression
+    assert actual.total.time.candidate == pytest.approx(23.2)
+    assert actual.baseline_only == ('removed',)
+    assert [comparison.test for comparison in actual.regressions] == ['noisy', 'slower', 'TOTAL']
+
+
+def test_compare_samples_single_trial() -> None:
+    # Given
+    baseline = {'test': Samples([10.0], [1000])}
+    candidate = {'test': Samples([10.5], [1000])}
+
+    # When
+    actual = compare_samples(baseline, candidate)
+
+    # Then
+    assert actual.tests[0].time.ci is None
+    assert actual.tests[0].time_regression
+    assert not compare_samples(baseline, candidate, time_threshold=0.1).tests[0].time_regression
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kevm_pyk.conformance import (
+    ALL_TESTS,
+    Fixture,
+    ManifestEntry,
+    ResultStatus,
+    classify_tests,
+    discover_fixtures,
+    merge_manifests,
+    run_conformance,
+    select_tests,
+    shard_fixtures,
+)
+
+from .test_interpreter import final_config
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_discover_fixtures(tmp_path: Path) -> None:
+    # Given
+    for fixture in ('VMTests/vmTests/add.json', 'stExample/add11.json', 'Pyspecs/cancun/eip4844/blob.json'):
+        fixture_path = tmp_path / 'BlockchainTests/GeneralStateTests' / fixture
+        fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        fixture_path.write_text('{}')
+
+    # When
+    actual = discover_fixtures(tmp_path)
+
+    # Then
+    assert actual == [
+        Fixture(Path('BlockchainTests/GeneralStateTests/Pyspecs/cancun/eip4844/blob.json'), 'CANCUN', 'NORMAL'),
+        Fixture(Path('BlockchainTests/GeneralStateTests/VMTests/vmTests/add.json'), 'DEFAULT', 'VMTESTS'),
+        Fixture(Path('BlockchainTests/GeneralStateTests/stExample/add11.json'), 'CANCUN', 'NORMAL'),
+    ]
+
+
+def test_select_tests(tmp_path: Path) -> None:
+    # Given
+    vm_fixture = 'BlockchainTests/GeneralStateTests/VMTests/vmTests/add.json'
+    fixture = 'BlockchainTests/GeneralStateTests/stExample/add11.json'
+    for fixture_path, tests in ((vm_fixture, ('add_d0', 'add_d1')), (fixture, ('add11_d0', 'add11_d1'))):
+        (tmp_path / fixture_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / fixture_path).write_text(json.dumps({test: {'test': test} for test in tests}))
+
+    # When
+    actual = list(select_tests(tmp_path, [(fixture, 'add11_d1'), (vm_fixture, ALL_TESTS)]))
+
+    # Then
+    assert actual == [
+        (Fixture(Path(fixture), 'CANCUN', 'NORMAL'), 'add11_d1', {'test': 'add11_d1'}),
+        (Fixture(Path(vm_fixture), 'DEFAULT', 'VMTESTS'), 'add_d0', {'test': 'add_d0'}),
+        (Fixture(Path(vm_fixture), 'DEFAULT', 'VMTESTS'), 'add_d1', {'test': 'add_d1'}),
+    ]
+    with pytest.raises(ValueError, match='Test not found'):
+        list(select_tests(tmp_path, [(fixture, 'add11_d2')]))
+
+
+def test_shard_fixtures() -> None:
+    # Given
+    fixtures = [Fixture(Path(f'fixture{i}.json'), 'CANCUN', 'NORMAL') for i in range(100)]
+
+    # When
+    shards = [shard_fixtures(fixtures, shard, 4) for shard in range(4)]
+
+    # Then
+    assert sorted(fixture.path for shard in shards for fixture in shard) == sorted(fixture.path for fixture in fixtures)
+    assert all(shards)
+    assert shard_fixtures(fixtures[:50], 1, 4) == [fixture for fixture in shards[1] if fixture in fixtures[:50]]
+
+
+def test_run_conformance(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Given
+    fixture = Fixture(Path('fixture.json'), 'CANCUN', 'NORMAL')
+    (tmp_path / 'fixture.json').write_text(json.dumps({'passing': {}, 'failing': {}, 'skipped': {}}))
+    mocker.patch(
+        'kevm_pyk.interpreter._interpret_llvm_measured',
+        side_effect=lambda init_kore, **kwargs: (final_config(1 if b'failing' in init_kore else 0), 1024),
+    )
+
+    # When
+    entries = {entry.test: entry for entry in run_conformance(tmp_path, [fixture], skip={'fixture.json': ['skipped']})}
+
+    # Then
+    assert entries['passing'].status is ResultStatus.PASSED
+    assert entries['passing'].max_rss == 1024
+    assert entries['passing'].time is not None
+    assert entries['failing'].status is ResultStatus.FAILED
+    assert entries['failing'].exit_code == 1
+    assert entries['skipped'].status is ResultStatus.SKIPPED
+
+
+def test_manifest_entry_to_dict() -> None:
+    entry = ManifestEntry('fixture.json', 'test', ResultStatus.TIMEOUT, time=1.5, error='Timed out after 1.0s')
+    assert ManifestEntry.from_dict(json.loads(json.dumps(entry.to_dict()))) == entry
+
+
+def test_merge_manifests() -> None:
+    # Given
+    shard0 = [
+        ManifestEntry('b.json', 'test', ResultStatus.PASSED, time=1.0),
+        ManifestEntry('a.json', 'test', ResultStatus.SKIPPED),
+    ]
+    shard1 = [
+        ManifestEntry('a.json', 'test', ResultStatus.FAILED, time=2.0),
+        ManifestEntry('b.json', 'test', ResultStatus.SKIPPED),
+    ]
+
+    # When
+    actual = merge_manifests([shard0, shard1])
+
+    # Then
+    assert actual == [shard1[0], shard0[0]]
+
+
+def test_classify_tests() -> None:
+    # Given
+    entries = [
+        ManifestEntry('a.json', 'passing', ResultStatus.PASSED, time=1.0),
+        ManifestEntry('a.json', 'failing', ResultStatus.FAILED, time=1.0),
+        ManifestEntry('a.json', 'slow', ResultStatus.PASSED, time=100.0),
+        ManifestEntry('b.json', 'timeout', ResultStatus.TIMEOUT, time=60.0),
+        ManifestEntry('c.json', 'skipped', ResultStatus.SKIPPED),
+    ]
+    slow = [('d.json', ALL_TESTS)]
+    failing = [('c.json', 'skipped'), ('a.json', 'passing'), ('b.json', ALL_TESTS)]
+
+    # When
+    new_slow, new_failing = classify_tests(entries, slow_threshold=60, slow=slow, failing=failing)
+
+    # Then
+    assert new_slow == [('d.json', ALL_TESTS), ('a.json', 'slow'), ('b.json', ALL_TESTS)]
+    assert new_failing == [('c.json', 'skipped'), ('a.json', 'failing')]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from pyk.kore.parser import KoreParser
+from pyk.kore.prelude import BYTES, INT, SORT_JSON, bytes_dv, inj, int_dv, json_to_kore
+
+from kevm_pyk.gst_normalize import (
+    SORT_ACCOUNT_CODE,
+    IntMap,
+    _parse_byte_stack,
+    _parse_hex_word,
+    _parse_word,
+    normalize_gst,
+    pre_state_to_kore,
+)
+from kevm_pyk.gst_to_kore import gst_to_kore
+
+from ..utils import REPO_ROOT
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+
+PARSE_TEST_DATA: Final = (
+    ('word-empty', _parse_word, '', 0),
+    ('word-decimal', _parse_word, '1234', 1234),
+    ('word-hex', _parse_word, '0x10', 16),
+    ('word-invalid', _parse_word, 'abc', 'abc'),
+    ('hex-word-empty', _parse_hex_word, '0x', 0),
+    ('hex-word', _parse_hex_word, '0xff', 255),
+    ('hex-word-no-prefix', _parse_hex_word, 'ff', 255),
+    ('hex-word-invalid', _parse_hex_word, '0xzz', '0xzz'),
+    ('byte-stack-empty', _parse_byte_stack, '0x', b''),
+    ('byte-stack', _parse_byte_stack, '0x6001', b'\x60\x01'),
+    ('byte-stack-odd', _parse_byte_stack, '0x601', b'\x06\x01'),
+    ('byte-stack-invalid', _parse_byte_stack, '0xzz', '0xzz'),
+)
+
+
+@pytest.mark.parametrize(
+    'parse,s,expected',
+    [(parse, s, expected) for _, parse, s, expected in PARSE_TEST_DATA],
+    ids=[test_id for test_id, *_ in PARSE_TEST_DATA],
+)
+def test_parse(parse: Any, s: str, expected: Any) -> None:
+    assert parse(s) == expected
+
+
+def test_normalize_gst() -> None:
+    # Given
+    gst_data = {
+        'test': {
+            'pre': {
+                '0x01': {
+                    'balance': '0x0a',
+                    'code': '0x6001',
+                    'nonce': '1',
+                    'storage': {'0x01': '0x02', '0x02': '0x00', '0x0001': '0x03'},
+                },
+            },
+            'network': 'Cancun',
+            '_info': {'comment': ''},
+            'genesisBlockHeader': {'hash': '0x0100', 'number': '0x00'},
+            'blocks': [{'blockHeader': {'number': '0x01'}, 'expectException': '', 'rlp': '0xc0'}],
+            'lastblockhash': '0x00',
+        },
+    }
+
+    # When
+    actual = normalize_gst(gst_data)
+
+    # Then
+    assert actual == {
+        'test': {
+            'blocks': [{'blockHeader': {'number': b'\x01'}, 'rlp': '0xc0'}],
+            'genesisBlockHeader': {'hash': 256},
+            'network': 'Cancun',
+            'pre': {
+                '0x01': {'balance': 10, 'code': b'\x60\x01', 'nonce': 1, 'storage': IntMap({1: 2})},
+            },
+        },
+    }
+    assert list(actual['test']) == sorted(actual['test'])
+
+
+def test_gst_to_kore_normalize() -> None:
+    # Given
+    gst_data = json.loads((REPO_ROOT / 'tests/interactive/log3.json').read_text())
+
+    # When
+    kore = gst_to_kore(gst_data, 'SHANGHAI', 'NORMAL', 1, True, normalize=True)
+
+    # Then
+    assert KoreParser(kore.text).pattern() == kore
+    assert inj(INT, SORT_JSON, int_dv(0x0BA1A9CE0BA1A9CE)).text in kore.text
+    assert json_to_kore('0x0ba1a9ce0ba1a9ce').text not in kore.text
+
+
+def test_pre_state_to_kore() -> None:
+    # Given
+    pre = {
+        '0x02': {'balance': '0x0a', 'code': '0x6001', 'nonce': '0x01', 'storage': {'0x01': '0x02'}},
+        '0x1' + 40 * '0': {'balance': '0', 'code': '', 'nonce': '0', 'storage': {}},
+    }
+
+    # When
+    actual = pre_state_to_kore(pre)
+
+    # Then
+    assert actual is not None
+    assert actual.symbol == "Lbl'Unds'AccountCellMap'Unds'"  # type: ignore[attr-defined]
+    text = actual.text
+    assert text.index('"0"') < text.index('"2"')
+    assert "Lbl'-LT-'transientStorage'-GT-'{}(Lbl'Stop'Map{}())" in text
+    assert inj(BYTES, SORT_ACCOUNT_CODE, bytes_dv(b'\x60\x01')).text in text
+
+
+PRE_STATE_FALLBACK_TEST_DATA: Final[tuple[tuple[str, Any], ...]] = (
+    ('not-an-object', '0x00'),
+    ('invalid-address', {'0xzz': {}}),
+    ('duplicate-address', {'0x01': {}, '0x1' + 39 * '0' + '1': {}}),
+    ('unknown-field', {'0x01': {'balance': '0x00', 'foo': '0x00'}}),
+    ('invalid-storage', {'0x01': {'storage': {'0x01': 1}}}),
+)
+
+
+@pytest.mark.parametrize(
+    'pre',
+    [pre for _, pre in PRE_STATE_FALLBACK_TEST_DATA],
+    ids=[test_id for test_id, _ in PRE_STATE_FALLBACK_TEST_DATA],
+)
+def test_pre_state_to_kore_fallback(pre: Any) -> None:
+    assert pre_state_to_kore(pre) is None
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import json
+from io import StringIO
 from typing import TYPE_CHECKING
 
 import pytest
 from pyk.kore.parser import KoreParser
 
-from kevm_pyk.gst_to_kore import gst_to_kore
+from kevm_pyk.gst_to_kore import gst_to_kore, gst_to_kore_stream, iter_gst_tests, prepare_gst
 
 from ..utils import REPO_ROOT
 
@@ -49,3 +50,76 @@ def test_gst_to_kore(gst_path: str, expected_path: str, update_expected_output:
         return
 
     assert actual == expected
+
+
+STREAM_TEST_DATA: Final = (
+    'tests/interactive/log3.json',
+    'tests/interactive/add.json',
+    'tests/interactive/TestNameRegistrator.json',
+)
+
+
+@pytest.mark.parametrize('chunk_size', (1, 7, 1 << 20))
+@pytest.mark.parametrize('gst_path', STREAM_TEST_DATA)
+def test_iter_gst_tests(gst_path: str, chunk_size: int) -> None:
+    # Given
+    gst_file = REPO_ROOT / gst_path
+    expected = list(json.loads(gst_file.read_text()).items())
+
+    # When
+    with gst_file.open() as f:
+        actual = list(iter_gst_tests(f, chunk_size=chunk_size))
+
+    # Then
+    assert actual == expected
+
+
+@pytest.mark.parametrize('text', ('{}', ' { } ', '{"a": 1, "b": [2, 3.5]}', '{"a" : {"b": "}"} }'))
+def test_iter_gst_tests_small(text: str) -> None:
+    assert list(iter_gst_tests(StringIO(text), chunk_size=1)) == list(json.loads(text).items())
+
+
+@pytest.mark.parametrize('text', ('', '[]', '{"a": 1', '{"a" 1}', '{"a": 1,}', '{1: 2}'))
+def test_iter_gst_tests_malformed(text: str) -> None:
+    with pytest.raises(ValueError):
+        list(iter_gst_tests(StringIO(text), chunk_size=1))
+
+
+def test_gst_to_kore_stream() -> None:
+    # Given
+    gst_file = REPO_ROOT / 'tests/interactive/log3.json'
+    gst_data = json.loads(gst_file.read_text())
+    expected = [
+        (test_name, gst_to_kore({test_name: test}, 'SHANGHAI', 'NORMAL', 1, True))
+        for test_name, test in gst_data.items()
+    ]
+
+    # When
+    with gst_file.open() as f:
+        actual = list(gst_to_kore_stream(f, 'SHANGHAI', 'NORMAL', 1, True))
+
+    # Then
+    assert actual == expected
+
+
+CHAIN_OPTIONS: Final = (
+    ('SHANGHAI', 'NORMAL', 1, True),
+    ('CANCUN', 'NORMAL', 1, True),
+    ('CANCUN', 'VMTESTS', 5, False),
+)
+
+
+@pytest.mark.parametrize('schedule,mode,chainid,usegas', CHAIN_OPTIONS)
+def test_prepare_gst(schedule: str, mode: str, chainid: int, usegas: bool) -> None:
+    # Given
+    gst_data = json.loads((REPO_ROOT / 'tests/interactive/log3.json').read_text())
+    expected = gst_to_kore(gst_data, schedule, mode, chainid, usegas)
+    prepared = prepare_gst(gst_data)
+
+    # When
+    actual = prepared.to_kore(schedule, mode, chainid, usegas)
+    actual_text = prepared.to_kore_text(schedule, mode, chainid, usegas)
+
+    # Then
+    assert actual == expected
+    assert actual_text == expected.text
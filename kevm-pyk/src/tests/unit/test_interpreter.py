@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+from pyk.kore.parser import KoreParser
+from pyk.kore.prelude import JSON_NULL, SORT_JSON, SORT_K_ITEM, inj, int_dv, json_to_kore, kseq, map_pattern
+from pyk.kore.syntax import App
+
+from kevm_pyk.gst_normalize import pre_state_to_kore
+from kevm_pyk.interpreter import (
+    PreStateSnapshot,
+    Projection,
+    _interpret_measured,
+    _project_text,
+    get_exit_code,
+    interpret_batch,
+    interpret_tests,
+    preloaded_gst_to_kore,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Final
+
+    from pyk.kore.syntax import Pattern
+    from pytest_mock import MockerFixture
+
+
+def final_config(exit_code: int) -> Pattern:
+    return App(
+        "Lbl'-LT-'generatedTop'-GT-'",
+        (),
+        (
+            App(
+                "Lbl'-LT-'kevm'-GT-'",
+                (),
+                (App("Lbl'-LT-'k'-GT-'"), App("Lbl'-LT-'exit-code'-GT-'", (), (int_dv(exit_code),))),
+            ),
+        ),
+    )
+
+
+def test_get_exit_code() -> None:
+    assert get_exit_code(final_config(0)) == 0
+    assert get_exit_code(final_config(1)) == 1
+
+
+def test_get_exit_code_projected() -> None:
+    exit_code_cell = final_config(3).args[0].args[1]  # type: ignore[attr-defined]
+    assert get_exit_code(exit_code_cell) == 3
+
+
+PROJECT_TEXT_TEST_DATA: Final = (
+    ('exit-code', Projection.EXIT_CODE, final_config(1).args[0].args[1]),  # type: ignore[attr-defined]
+    ('full', Projection.FULL, final_config(1)),
+)
+
+
+@pytest.mark.parametrize(
+    'projection,expected',
+    [(projection, expected) for _, projection, expected in PROJECT_TEXT_TEST_DATA],
+    ids=[test_id for test_id, *_ in PROJECT_TEXT_TEST_DATA],
+)
+def test_project_text(projection: Projection, expected: Pattern) -> None:
+    # When
+    actual = _project_text(final_config(1).text, projection)
+
+    # Then
+    assert actual == expected
+
+
+def test_project_text_string_literal() -> None:
+    # Given
+    text = """Lbl'-LT-'generatedTop'-GT-'{}(Lbl'-LT-'accounts'-GT-'{}(\\dv{SortString{}}("(\\")")), Lbl'-LT-'k'-GT-'{}())"""
+
+    # When
+    actual = _project_text(text, Projection.ACCOUNTS)
+
+    # Then
+    assert actual == KoreParser(text).pattern().args[0]  # type: ignore[attr-defined]
+
+
+def test_project_text_missing_cell() -> None:
+    with pytest.raises(ValueError, match='Cell not found'):
+        _project_text(final_config(0).text, Projection.ACCOUNTS)
+
+
+def test_interpret_batch(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Given
+    passing = tmp_path / 'passing.json'
+    passing.write_text('{"passing": {}}')
+    failing = tmp_path / 'failing.json'
+    failing.write_text('{"failing": {}}')
+    malformed = tmp_path / 'malformed.json'
+    malformed.write_text('{')
+
+    def fake_interpret(gst_data: dict, *args: object, **kwargs: object) -> Pattern:
+        return final_config(0 if 'passing' in gst_data else 1)
+
+    mocker.patch('kevm_pyk.interpreter.interpret', side_effect=fake_interpret)
+
+    # When
+    results = list(interpret_batch([passing, failing, malformed], 'SHANGHAI', 'NORMAL', 1, True))
+
+    # Then
+    assert [result.gst_file for result in results] == [passing, failing, malformed]
+    assert [result.passed for result in results] == [True, False, False]
+    assert [result.exit_code for result in results] == [0, 1, None]
+    assert results[2].error is not None
+
+
+@pytest.mark.parametrize('threads', [False, True], ids=['inline', 'executor'])
+def test_interpret_tests(threads: bool, mocker: MockerFixture) -> None:
+    # Given
+    gst_data: dict[str, Any] = {'passing_d0g0v0': {}, 'failing_d1g0v0': {}, 'skipped_d2g0v0': {}, 'crashing_d3g0v0': {}}
+
+    def fake_interpret(gst_data: dict, *args: object, **kwargs: object) -> Pattern:
+        (test_name,) = gst_data
+        if test_name.startswith('crashing'):
+            raise RuntimeError('crashed')
+        return final_config(0 if test_name.startswith('passing') else 1)
+
+    mocker.patch('kevm_pyk.interpreter.interpret', side_effect=fake_interpret)
+
+    # When
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = {
+            result.test_name: result
+            for result in interpret_tests(
+                gst_data,
+                'SHANGHAI',
+                'NORMAL',
+                1,
+                True,
+                executor=executor if threads else None,
+                skip=['skipped_d2g0v0'],
+            )
+        }
+
+    # Then
+    assert results.keys() == gst_data.keys()
+    assert results['passing_d0g0v0'].passed
+    assert results['failing_d1g0v0'].exit_code == 1
+    assert results['skipped_d2g0v0'].skipped
+    assert results['crashing_d3g0v0'].error == 'RuntimeError: crashed'
+
+
+CONFIG_TEMPLATE: Final = App(
+    "Lbl'-LT-'generatedTop'-GT-'",
+    (),
+    (
+        App("Lbl'-LT-'k'-GT-'", (), (kseq([inj(SORT_JSON, SORT_K_ITEM, JSON_NULL)]),)),
+        App("Lbl'-LT-'accounts'-GT-'", (), (map_pattern(cell='AccountCell'),)),
+    ),
+)
+
+
+def test_preloaded_gst_to_kore(mocker: MockerFixture) -> None:
+    # Given
+    mocker.patch('kevm_pyk.interpreter._config_template', return_value=CONFIG_TEMPLATE)
+    gst_data = {'test': {'network': 'Cancun', 'pre': {'0x01': {'balance': '0x01'}}}}
+
+    # When
+    actual = preloaded_gst_to_kore(gst_data, 'CANCUN', 'NORMAL', 1, True)
+
+    # Then
+    expected = App(
+        "Lbl'-LT-'generatedTop'-GT-'",
+        (),
+        (
+            App(
+                "Lbl'-LT-'k'-GT-'",
+                (),
+                (kseq([inj(SORT_JSON, SORT_K_ITEM, json_to_kore({'test': {'network': 'Cancun'}}))]),),
+            ),
+            App("Lbl'-LT-'accounts'-GT-'", (), (pre_state_to_kore(gst_data['test']['pre']),)),  # type: ignore[arg-type]
+        ),
+    )
+    assert actual == expected
+
+
+def test_preloaded_gst_to_kore_multiple_tests() -> None:
+    with pytest.raises(ValueError, match='single test'):
+        preloaded_gst_to_kore({'test1': {}, 'test2': {}}, 'CANCUN', 'NORMAL', 1, True)
+
+
+def test_pre_state_snapshot(mocker: MockerFixture) -> None:
+    # Given
+    mocker.patch('kevm_pyk.interpreter._config_template', return_value=CONFIG_TEMPLATE)
+    pre = {'0x01': {'balance': '0x01'}}
+    gst_data = {
+        'test_d0g0v0': {'network': 'Cancun', 'pre': pre, 'blocks': []},
+        'test_d1g0v0': {'network': 'Cancun', 'pre': pre},
+    }
+
+    # When
+    snapshot = PreStateSnapshot.create(pre, 'CANCUN', 'NORMAL', 1, True)
+
+    # Then
+    assert snapshot is not None
+    for test_name, test in gst_data.items():
+        expected = preloaded_gst_to_kore({test_name: test}, 'CANCUN', 'NORMAL', 1, True)
+        assert snapshot.to_kore_text(test_name, test) == expected.text
+
+
+def test_interpret_tests_snapshot(mocker: MockerFixture) -> None:
+    # Given
+    mocker.patch('kevm_pyk.interpreter._config_template', return_value=CONFIG_TEMPLATE)
+    interpret_llvm = mocker.patch('kevm_pyk.interpreter._interpret_llvm', return_value=final_config(0))
+    create = mocker.spy(PreStateSnapshot, 'create')
+    pre = {'0x01': {'balance': '0x01'}}
+    gst_data = {f'test_d{i}g0v0': {'network': 'Cancun', 'pre': pre} for i in range(3)}
+
+    # When
+    results = list(interpret_tests(gst_data, 'CANCUN', 'NORMAL', 1, True, snapshot=True))
+
+    # Then
+    assert all(result.passed for result in results)
+    assert create.call_count == 1
+    assert interpret_llvm.call_count == 3
+
+
+def fake_interpreter(tmp_path: Path, mocker: MockerFixture, script: str) -> None:
+    interpreter = tmp_path / 'interpreter'
+    interpreter.write_text(f'#!/bin/sh\n{script}\n')
+    interpreter.chmod(0o755)
+    mocker.patch('kevm_pyk.interpreter.kdist').get.return_value = tmp_path
+
+
+def test_interpret_measured(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Given
+    fake_interpreter(tmp_path, mocker, 'cat "$1" > "$3"; exit 3')
+
+    # When
+    proc_res, max_rss = _interpret_measured(b'kore')
+
+    # Then
+    assert proc_res.returncode == 3
+    assert proc_res.stdout == 'kore'
+    assert max_rss > 0
+
+
+def test_interpret_measured_timeout(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Given
+    fake_interpreter(tmp_path, mocker, 'exec sleep 10')
+
+    # Then
+    with pytest.raises(subprocess.TimeoutExpired):
+        _interpret_measured(b'kore', timeout=0.1)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from kevm_pyk.kllvm import kllvm_available
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_kllvm_available_cached(mocker: MockerFixture) -> None:
+    # Given
+    kllvm_module = mocker.patch('kevm_pyk.kllvm.kllvm_module', side_effect=ValueError('Target is not built'))
+    kllvm_available.cache_clear()
+
+    # When
+    try:
+        actual = [kllvm_available(), kllvm_available()]
+    finally:
+        kllvm_available.cache_clear()
+
+    # Then
+    assert actual == [False, False]
+    assert kllvm_module.call_count == 1
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+from kevm_pyk.gst_to_kore import gst_to_kore
+from kevm_pyk.kore_cache import KoreCache
+from kevm_pyk.result_cache import definition_digest
+
+from ..utils import REPO_ROOT
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+GST_FILE = REPO_ROOT / 'tests/interactive/log3.json'
+
+
+def test_kore_cache_hit(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Given
+    gst_bytes = GST_FILE.read_bytes()
+    cache = KoreCache(tmp_path)
+    spy = mocker.spy(cache, '_put')
+
+    # When
+    first = cache.gst_to_kore(gst_bytes, 'SHANGHAI', 'NORMAL', 1, True)
+    second = cache.gst_to_kore(gst_bytes, 'SHANGHAI', 'NORMAL', 1, True)
+    other_schedule = cache.gst_to_kore(gst_bytes, 'CANCUN', 'NORMAL', 1, True)
+
+    # Then
+    expected = gst_to_kore(json.loads(gst_bytes), 'SHANGHAI', 'NORMAL', 1, True).text.encode()
+    assert first == second == expected
+    assert other_schedule != first
+    assert spy.call_count == 2
+
+
+def test_kore_cache_key(tmp_path: Path) -> None:
+    cache = KoreCache(tmp_path)
+    key = cache.key(b'{}', 'SHANGHAI', 'NORMAL', 1, True)
+    assert key == cache.key(b'{}', 'SHANGHAI', 'NORMAL', 1, True)
+    assert key != cache.key(b'{ }', 'SHANGHAI', 'NORMAL', 1, True)
+    assert key != cache.key(b'{}', 'SHANGHAI', 'VMTESTS', 1, True)
+    assert key != cache.key(b'{}', 'SHANGHAI', 'NORMAL', 2, True)
+    assert key != cache.key(b'{}', 'SHANGHAI', 'NORMAL', 1, False)
+    assert key != cache.key(b'{}', 'SHANGHAI', 'NORMAL', 1, True, binary=True)
+
+
+def test_kore_cache_key_preload(tmp_path: Path) -> None:
+    # Given
+    definition_dir = tmp_path / 'llvm'
+    definition_dir.mkdir()
+    (definition_dir / 'interpreter').write_bytes(b'old')
+    old_cache = KoreCache(tmp_path / 'cache', definition_dir=definition_dir)
+    old_key = old_cache.key(b'{}', 'SHANGHAI', 'NORMAL', 1, True, preload=True)
+    old_plain_key = old_cache.key(b'{}', 'SHANGHAI', 'NORMAL', 1, True)
+
+    # When
+    (definition_dir / 'interpreter').write_bytes(b'new')
+    definition_digest.cache_clear()
+    new_cache = KoreCache(tmp_path / 'cache', definition_dir=definition_dir)
+
+    # Then
+    assert new_cache.key(b'{}', 'SHANGHAI', 'NORMAL', 1, True, preload=True) != old_key
+    assert new_cache.key(b'{}', 'SHANGHAI', 'NORMAL', 1, True) == old_plain_key
+
+
+def test_kore_cache_eviction(tmp_path: Path) -> None:
+    # Given
+    cache = KoreCache(tmp_path)
+    cache.gst_to_kore(b'{}', 'SHANGHAI', 'NORMAL', 1, True)
+    (old_entry,) = tmp_path.glob('*/*.kore')
+    os.utime(old_entry, (0, 0))
+    cache.max_size = old_entry.stat().st_size + 16
+
+    # When
+    cache.gst_to_kore(b'{}', 'CANCUN', 'NORMAL', 1, True)
+
+    # Then
+    (new_entry,) = tmp_path.glob('*/*.kore')
+    assert new_entry != old_entry
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import socket
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kevm_pyk import utils
+from kevm_pyk.utils import KoreServerPool, KoreServerPoolManager, lease_kore_server
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Final
+
+    from pytest_mock import MockerFixture
+
+
+# Stands in for kore-rpc: listens on the --server-port, and exits on receiving 'exit'
+FAKE_SERVER: Final = """
+import socket
+import sys
+
+port = int(sys.argv[sys.argv.index('--server-port') + 1])
+with socket.create_server(('localhost', port)) as server:
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            if conn.recv(4) == b'exit':
+                sys.exit(1)
+"""
+
+
+@pytest.fixture
+def server_args(tmp_path: Path) -> dict[str, Any]:
+    definition_dir = tmp_path / 'kompiled'
+    definition_dir.mkdir()
+    (definition_dir / 'definition.kore').touch()
+    script = tmp_path / 'fake_server.py'
+    script.write_text(FAKE_SERVER)
+    return {'definition_dir': definition_dir, 'module_name': 'MAIN', 'command': (sys.executable, str(script))}
+
+
+def _stop(port: int) -> None:
+    with socket.create_connection(('localhost', port)) as conn:
+        conn.sendall(b'exit')
+        conn.recv(1)
+
+
+def test_reuse_and_restart(server_args: dict[str, Any], mocker: MockerFixture) -> None:
+    # Given
+    start = mocker.spy(utils, 'kore_server')
+    server_pool = KoreServerPool(**server_args)
+
+    try:
+        # When
+        first = server_pool.acquire()
+        server_pool.release(first)
+        reused = server_pool.acquire()
+        _stop(reused)
+        server_pool.release(reused)
+        restarted = server_pool.acquire()
+        server_pool.release(restarted)
+        with pytest.raises(RuntimeError), lease_kore_server(server_pool):
+            raise RuntimeError()
+        after_error = server_pool.acquire()
+        server_pool.release(after_error)
+    finally:
+        server_pool.close()
+
+    # Then
+    # Restarted servers are told apart by the number of starts, a new server might get the port of the old one
+    assert reused == first
+    assert start.call_count == 3
+
+
+def test_manager(server_args: dict[str, Any]) -> None:
+    with KoreServerPoolManager() as manager:
+        # Given
+        server_pool = manager.KoreServerPool(size=2, **server_args)  # type: ignore
+
+        try:
+            # When
+            first = server_pool.acquire()
+            second = server_pool.acquire()
+            server_pool.release(first)
+            third = server_pool.acquire()
+            server_pool.release(second)
+            server_pool.release(third)
+        finally:
+            server_pool.close()
+
+    # Then
+    assert first != second
+    assert third == first
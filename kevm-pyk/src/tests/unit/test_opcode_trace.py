@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from kevm_pyk.opcode_trace import OpcodeStats, TraceEntry, aggregate_trace, opcode_name, parse_trace
+
+
+def test_parse_trace() -> None:
+    # Given
+    lines = ['[0,96,100,0]\n', 'warning: something\n', '[2,0,97,0]\n']
+
+    # When
+    actual = list(parse_trace(lines))
+
+    # Then
+    assert actual == [TraceEntry(0, 0x60, 100, 0), TraceEntry(2, 0x00, 97, 0)]
+
+
+def test_aggregate_trace() -> None:
+    # Given
+    entries = [
+        TraceEntry(0, 0x60, 1000, 0),  # PUSH1: 3
+        TraceEntry(2, 0xF1, 997, 0),  # CALL: 997 - 900, including the call
+        TraceEntry(0, 0x60, 500, 1),  # PUSH1: 3
+        TraceEntry(2, 0x00, 497, 1),  # STOP: ends the frame
+        TraceEntry(3, 0x60, 900, 0),  # PUSH1: 3
+        TraceEntry(5, 0x00, 897, 0),  # STOP: ends the frame
+    ]
+
+    # When
+    actual = aggregate_trace(iter(entries), elapsed=2.0)
+
+    # Then
+    assert actual.counts == {0x60: 3, 0xF1: 1, 0x00: 2}
+    assert actual.gas == {0x60: 9, 0xF1: 97}
+    assert actual.instructions == 6
+    assert actual.instructions_per_sec == 3.0
+
+
+def test_aggregate_trace_transactions() -> None:
+    # Given
+    entries = [
+        TraceEntry(0, 0x60, 100, 0),  # PUSH1: 3
+        TraceEntry(2, 0x00, 97, 0),  # STOP: ends the first transaction
+        TraceEntry(0, 0x60, 5000, 0),  # PUSH1: 3
+        TraceEntry(2, 0x56, 4997, 0),  # JUMP: halts exceptionally, no frame-ending instruction
+        TraceEntry(0, 0x60, 8000, 0),  # PUSH1: 3
+        TraceEntry(2, 0xF3, 7997, 0),  # RETURN
+    ]
+
+    # When
+    actual = aggregate_trace(entries)
+
+    # Then
+    assert actual.counts == {0x60: 3, 0x00: 1, 0x56: 1, 0xF3: 1}
+    assert actual.gas == {0x60: 9}
+
+
+def test_opcode_stats_table() -> None:
+    # Given
+    stats = aggregate_trace([TraceEntry(0, 0x60, 10, 0), TraceEntry(2, 0x0C, 7, 0)])
+
+    # When
+    actual = stats.table().splitlines()
+
+    # Then
+    assert actual[1].split() == ['PUSH1', '1', '50.00', '3', '100.00']
+    assert actual[2].split() == ['UNDEFINED(0x0c)', '1', '50.00', '0', '0.00']
+    assert actual[3:] == ['Instructions: 2']
+    assert OpcodeStats(stats.counts, stats.gas, 1.0).table().splitlines()[-1] == 'Instructions/sec: 2'
+
+
+def test_opcode_name() -> None:
+    assert opcode_name(0x5F) == 'PUSH0'
+    assert opcode_name(0x7F) == 'PUSH32'
+    assert opcode_name(0x9F) == 'SWAP16'
+    assert opcode_name(0xA4) == 'LOG4'
+    assert opcode_name(0xA5) == 'UNDEFINED(0xa5)'
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyk.cterm import CSubst
+from pyk.kast.inner import KSort, KToken
+from pyk.prelude.ml import mlTop
+from pyk.proof.implies import EqualityProof
+from pyk.proof.proof import Proof, ProofStatus
+
+from kevm_pyk.proof_cache import ProofCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _equality_proof(
+    proof_id: str, proof_dir: Path, *, passed: bool = True, subproof_ids: tuple[str, ...] = ()
+) -> EqualityProof:
+    one = KToken('1', 'Int')
+    proof = EqualityProof(
+        proof_id,
+        one,
+        one,
+        KSort('Int'),
+        simplified_constraints=mlTop() if passed else None,
+        simplified_equality=mlTop() if passed else None,
+        csubst=CSubst(),
+        proof_dir=proof_dir,
+        subproof_ids=subproof_ids,
+    )
+    proof.write_proof_data()
+    return proof
+
+
+def test_proof_cache(tmp_path: Path) -> None:
+    # Given
+    definition_dir = tmp_path / 'kompiled'
+    definition_dir.mkdir()
+    (definition_dir / 'definition.kore').write_text('[]\nmodule MAIN endmodule []\n')
+    save_dir = tmp_path / 'save'
+    _equality_proof('b', save_dir)
+    _equality_proof('a.node-infeasible-1', save_dir)
+    proof = _equality_proof('a', save_dir, subproof_ids=('b', 'a.node-infeasible-1'))
+    proof_cache = ProofCache(tmp_path / 'cache', definition_dir=definition_dir, options={'assume_defined': False})
+
+    other_save_dir = tmp_path / 'other'
+    _equality_proof('a', other_save_dir, passed=False)
+    _equality_proof('b', other_save_dir, passed=False)
+
+    # When
+    proof_cache.put('digest-a', proof)
+    proof_cache.put('digest-c', _equality_proof('c', save_dir, passed=False))
+    restored = proof_cache.restore('digest-a', 'a', other_save_dir)
+
+    # Then
+    assert restored
+    assert EqualityProof.read_proof_data(other_save_dir, 'a').own_status is ProofStatus.PASSED
+    assert Proof.proof_data_exists('a.node-infeasible-1', other_save_dir)
+    assert not Proof.read_proof_data(other_save_dir, 'b').passed  # Dependencies present locally are not replaced
+    assert not proof_cache.restore('digest-c', 'c', other_save_dir)
+    assert not proof_cache.restore('digest-b', 'a', other_save_dir)
+    other_options = ProofCache(tmp_path / 'cache', definition_dir=definition_dir, options={'assume_defined': True})
+    assert not other_options.restore('digest-a', 'a', other_save_dir)
+    (definition_dir / 'definition.kore').write_text('[]\nmodule OTHER endmodule []\n')
+    assert not ProofCache(tmp_path / 'cache', definition_dir=definition_dir).restore('digest-a', 'a', other_save_dir)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from kevm_pyk.proof_store import ProofStore
+from kevm_pyk.timings import ClaimTiming
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_proof_store(tmp_path: Path) -> None:
+    # Given
+    proof_store = ProofStore(tmp_path)
+
+    # When
+    proof_store.set_digest('a', '0123')
+    proof_store.record_timing('a', ClaimTiming(1.5, 10))
+    proof_store.set_status('a', 'passed')
+    proof_store.record_timing('b', ClaimTiming(2.0))
+    proof_store.set_digest('a', '4567')
+
+    # Then
+    reopened = ProofStore(tmp_path)
+    assert reopened.digest('a') == '4567'
+    assert reopened.digest('b') is None
+    assert reopened.digest('c') is None
+    assert reopened.status('a') == 'passed'
+    assert reopened.timings() == {'a': ClaimTiming(1.5, 10), 'b': ClaimTiming(2.0)}
+
+
+def test_migrate(tmp_path: Path) -> None:
+    # Given
+    (tmp_path / 'digest').write_text(json.dumps({'claims': {'a': '0123', 'b': '4567'}}))
+    (tmp_path / 'timings').write_text(json.dumps({'claims': {'a': {'time': 1.5, 'nodes': 10}}}))
+
+    # When
+    proof_store = ProofStore(tmp_path)
+    proof_store.set_digest('a', '89ab')
+    (tmp_path / 'digest').write_text(json.dumps({'claims': {'a': 'old'}}))
+
+    # Then
+    reopened = ProofStore(tmp_path)
+    assert reopened.digest('a') == '89ab'
+    assert reopened.digest('b') == '4567'
+    assert reopened.timings() == {'a': ClaimTiming(1.5, 10)}
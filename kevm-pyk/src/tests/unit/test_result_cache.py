@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from kevm_pyk.interpreter import GSTTestResult, interpret_tests
+from kevm_pyk.result_cache import ResultCache, definition_digest
+
+from .test_interpreter import final_config
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+    from pytest_mock import MockerFixture
+
+
+def definition_dir(tmp_path: Path, interpreter: bytes) -> Path:
+    res = tmp_path / 'definition'
+    res.mkdir(parents=True, exist_ok=True)
+    (res / 'interpreter').write_bytes(interpreter)
+    return res
+
+
+def test_result_cache_key(tmp_path: Path) -> None:
+    # Given
+    cache = ResultCache(tmp_path / 'cache', definition_dir=definition_dir(tmp_path, b'v1'))
+    key = cache.key('test', {'pre': {}}, 'CANCUN', 'NORMAL', 1, True)
+
+    # Then
+    assert key == cache.key('test', {'pre': {}}, 'CANCUN', 'NORMAL', 1, True)
+    assert key != cache.key('other', {'pre': {}}, 'CANCUN', 'NORMAL', 1, True)
+    assert key != cache.key('test', {'pre': {'0x01': {}}}, 'CANCUN', 'NORMAL', 1, True)
+    assert key != cache.key('test', {'pre': {}}, 'SHANGHAI', 'NORMAL', 1, True)
+    assert key != cache.key('test', {'pre': {}}, 'CANCUN', 'VMTESTS', 1, True)
+    assert key != cache.key('test', {'pre': {}}, 'CANCUN', 'NORMAL', 1, True, preload=True)
+
+
+def test_result_cache_key_version(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Given
+    cache = ResultCache(tmp_path / 'cache', definition_dir=definition_dir(tmp_path, b'v1'))
+    key = cache.key('test', {'pre': {}}, 'CANCUN', 'NORMAL', 1, True)
+    cache.put(key, GSTTestResult('test', 0))
+
+    # When
+    mocker.patch('kevm_pyk.result_cache.VERSION', '0.0.0-other')
+    other_key = cache.key('test', {'pre': {}}, 'CANCUN', 'NORMAL', 1, True)
+
+    # Then
+    assert other_key != key
+    assert cache.get(other_key, 'test') is None
+
+
+def test_definition_digest(tmp_path: Path) -> None:
+    digest = definition_digest(definition_dir(tmp_path / 'v1', b'v1'))
+    assert digest == definition_digest(definition_dir(tmp_path / 'v1-copy', b'v1'))
+    assert digest != definition_digest(definition_dir(tmp_path / 'v2', b'v2'))
+
+
+def test_result_cache(tmp_path: Path) -> None:
+    # Given
+    cache = ResultCache(tmp_path / 'cache', definition_dir=definition_dir(tmp_path, b'v1'))
+
+    # When
+    cache.put('passed', GSTTestResult('passed', 0, time=1.5, max_rss=1024))
+    cache.put('error', GSTTestResult('error', None, 'RuntimeError: crashed'))
+
+    # Then
+    assert cache.get('passed', 'passed') == GSTTestResult('passed', 0, time=1.5, max_rss=1024, cached=True)
+    assert cache.get('error', 'error') is None
+    cache.refresh = True
+    assert cache.get('passed', 'passed') is None
+
+
+def test_interpret_tests_result_cache(tmp_path: Path, mocker: MockerFixture) -> None:
+    # Given
+    cache = ResultCache(tmp_path / 'cache', definition_dir=definition_dir(tmp_path, b'v1'))
+    interpret = mocker.patch('kevm_pyk.interpreter.interpret', return_value=final_config(0))
+    gst_data: dict[str, Any] = {'test_d0g0v0': {}, 'test_d1g0v0': {}}
+
+    # When
+    first = list(interpret_tests(gst_data, 'CANCUN', 'NORMAL', 1, True, result_cache=cache))
+    second = list(interpret_tests(gst_data, 'CANCUN', 'NORMAL', 1, True, result_cache=cache))
+
+    # Then
+    assert [result.passed for result in first + second] == [True] * 4
+    assert [result.cached for result in second] == [True, True]
+    assert interpret.call_count == 2
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from io import StringIO
+from typing import TYPE_CHECKING
+
+import pytest
+from pyk.kore.parser import KoreParser
+
+from kevm_pyk.rule_profile import Rule, _profile_events, _rule
+
+if TYPE_CHECKING:
+    from typing import Final
+
+
+RULES: Final = {
+    0: Rule('EVM.step', True),
+    1: Rule('EVM.pc.inc', True),
+    2: Rule('gas.md:120', False),
+}
+
+
+def test_profile_events() -> None:
+    # Given
+    events: list[int | str] = [0, "Lbl'Hash'gas", 2, 2, 1, "Lbl'Hash'gas", 2, 3]
+
+    # When
+    profile = _profile_events(events, RULES)
+
+    # Then
+    assert profile.counts == {'EVM.step': 1, 'EVM.pc.inc': 1, 'gas.md:120': 3, '<rule 3>': 1}
+    assert profile.stacks == {
+        ('EVM.step',): 1,
+        ('EVM.step', '#gas', 'gas.md:120'): 2,
+        ('EVM.pc.inc',): 1,
+        ('EVM.pc.inc', '#gas', 'gas.md:120'): 1,
+        ('EVM.pc.inc', '#gas', '<rule 3>'): 1,
+    }
+
+
+def test_rule_profile_output() -> None:
+    # Given
+    profile = _profile_events([0, 2, 2, 2], RULES)
+    stacks = StringIO()
+
+    # When
+    profile.write_collapsed(stacks)
+
+    # Then
+    assert profile.table().splitlines() == [
+        'Count       %  Rule',
+        '    3   75.00  gas.md:120',
+        '    1   25.00  EVM.step',
+    ]
+    assert profile.table(limit=1).splitlines()[1:] == ['    3   75.00  gas.md:120']
+    assert stacks.getvalue() == 'EVM.step 1\nEVM.step;<function>;gas.md:120 3\n'
+
+
+SOURCE: Final = "org'Stop'kframework'Stop'attributes'Stop'Source{}(\"Source(/evm-semantics/gas.md)\")"
+LOCATION: Final = "org'Stop'kframework'Stop'attributes'Stop'Location{}(\"Location(120,10,120,40)\")"
+
+RULE_TEST_DATA: Final = (
+    ('label', f'axiom{{}} \\rewrites{{S{{}}}}(X:S{{}}, Y:S{{}}) [label{{}}("EVM.step"), {SOURCE}]', 'EVM.step', True),
+    ('location', f'axiom{{}} \\equals{{S{{}}, R}}(X:S{{}}, Y:S{{}}) [{SOURCE}, {LOCATION}]', 'gas.md:120', False),
+    ('generated', 'axiom{} \\top{S{}}() []', '<rule 7>', False),
+)
+
+
+@pytest.mark.parametrize(
+    'text,expected_name,expected_rewrite',
+    [(text, name, rewrite) for _, text, name, rewrite in RULE_TEST_DATA],
+    ids=[test_id for test_id, *_ in RULE_TEST_DATA],
+)
+def test_rule(text: str, expected_name: str, expected_rewrite: bool) -> None:
+    # Given
+    axiom = KoreParser(text).axiom()
+
+    # When
+    actual = _rule(7, axiom)
+
+    # Then
+    assert actual == Rule(expected_name, expected_rewrite)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import socket
+from threading import Thread
+from typing import TYPE_CHECKING
+
+import pytest
+from pyk.kore.parser import KoreParser
+
+from kevm_pyk.gst_to_kore import gst_to_kore
+from kevm_pyk.server import KEVMServer, make_server
+
+from ..utils import REPO_ROOT
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Final
+
+    from pytest_mock import MockerFixture
+
+
+GST_FILE: Final = REPO_ROOT / 'tests/interactive/add.json'
+
+
+def test_handle_gst_to_kore() -> None:
+    # Given
+    gst_data = json.loads(GST_FILE.read_text())
+    request = {'id': 1, 'method': 'gst-to-kore', 'params': {'input_file': str(GST_FILE), 'stream': True}}
+
+    # When
+    actual = list(KEVMServer().handle(request))
+
+    # Then
+    assert [message['result']['test'] for message in actual[:-1]] == list(gst_data)
+    for message, (test_name, test) in zip(actual, gst_data.items(), strict=False):
+        expected = gst_to_kore({test_name: test}, 'SHANGHAI', 'NORMAL', 1, True)
+        assert KoreParser(message['result']['kore']).pattern() == expected
+    assert actual[-1] == {'id': 1, 'done': True}
+
+
+def test_handle_error() -> None:
+    # Given
+    server = KEVMServer()
+
+    # When
+    unknown_method = list(server.handle({'id': 'a', 'method': 'prove'}))
+    no_input = list(server.handle({'id': 'b', 'method': 'gst-to-kore', 'params': {}}))
+    pgm = list(server.handle({'id': 'c', 'method': 'gst-to-kore', 'params': {'pgm': 'run { } success'}}))
+
+    # Then
+    assert unknown_method == [{'id': 'a', 'error': 'ValueError: Unknown method: prove'}]
+    assert no_input == [
+        {'id': 'b', 'error': 'ValueError: Expected exactly one of input_file and gst, got: none'},
+    ]
+    assert pgm == [
+        {
+            'id': 'c',
+            'error': 'ValueError: Programs are not supported by the server, give a GST or convert them with kevm kast',
+        },
+    ]
+
+
+@pytest.mark.parametrize('backend', ['llvm', 'kllvm'])
+def test_handle_run(backend: str, mocker: MockerFixture) -> None:
+    # Given
+    mocker.patch.object(KEVMServer, 'kevm')
+    mocker.patch('kevm_pyk.server.kllvm_runtime_available', return_value=True)
+    runtime = mocker.patch('kevm_pyk.server.kllvm_runtime').return_value
+    mocker.patch('kevm_pyk.server.text_to_llvm')
+    mocker.patch('kevm_pyk.server.llvm_exit_code', return_value=0)
+    run_process = mocker.patch('kevm_pyk.server.run_process_2')
+    run_process.return_value.returncode = 0
+    gst = json.loads(GST_FILE.read_text())
+    request = {'id': 1, 'method': 'run', 'params': {'gst': gst, 'stream': True, 'output': 'none'}}
+
+    # When
+    actual = list(KEVMServer(backend=backend).handle(request))
+
+    # Then
+    assert [message['result'] for message in actual[:-1]] == [
+        {'test': test_name, 'exit_code': 0, 'output': None} for test_name in gst
+    ]
+    assert runtime.step.call_count == (len(gst) if backend == 'kllvm' else 0)
+    assert run_process.call_count == (len(gst) if backend == 'llvm' else 0)
+
+
+def test_serve_unix_socket(tmp_path: Path) -> None:
+    # Given
+    socket_path = tmp_path / 'kevm.sock'
+    gst = json.loads((REPO_ROOT / 'tests/interactive/log3.json').read_text())
+    requests = [
+        json.dumps({'id': 1, 'method': 'gst-to-kore', 'params': {'gst': gst, 'schedule': 'CANCUN'}}),
+        'not json',
+        json.dumps({'id': 2, 'method': 'gst-to-kore', 'params': {'gst': gst, 'chainid': 5}}),
+    ]
+
+    with make_server(KEVMServer(), socket_path=socket_path) as server:
+        thread = Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            # When
+            with socket.socket(socket.AF_UNIX) as client:
+                client.connect(str(socket_path))
+                client.sendall(''.join(f'{request}\n' for request in requests).encode())
+                client.shutdown(socket.SHUT_WR)
+                with client.makefile() as responses:
+                    actual = [json.loads(line) for line in responses]
+        finally:
+            server.shutdown()
+            thread.join()
+
+    # Then
+    assert [(message['id'], list(message)) for message in actual] == [
+        (1, ['id', 'result']),
+        (1, ['id', 'done']),
+        (None, ['id', 'error']),
+        (2, ['id', 'result']),
+        (2, ['id', 'done']),
+    ]
+    assert KoreParser(actual[0]['result']['kore']).pattern() == gst_to_kore(gst, 'CANCUN', 'NORMAL', 1, True)
+    assert KoreParser(actual[3]['result']['kore']).pattern() == gst_to_kore(gst, 'SHANGHAI', 'NORMAL', 5, True)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kevm_pyk.timings import ClaimTiming, claim_costs, critical_path_priorities, estimate_makespan
+
+if TYPE_CHECKING:
+    from typing import Final
+
+
+# 'a' -> 'c' is the critical path, 'b' and 'd' are cheap and independent
+GRAPH: Final = {'a': [], 'b': [], 'c': ['a'], 'd': []}
+COSTS: Final = {'a': 5.0, 'b': 4.0, 'c': 5.0, 'd': 1.0}
+
+
+def test_claim_costs() -> None:
+    # Given
+    timings = {'a': ClaimTiming(2.0), 'b': ClaimTiming(4.0)}
+
+    # When
+    actual = claim_costs(['a', 'b', 'c'], timings)
+
+    # Then
+    assert actual == {'a': 2.0, 'b': 4.0, 'c': 3.0}
+    assert claim_costs(['a'], {}) == {'a': 1.0}
+
+
+def test_critical_path_priorities() -> None:
+    assert critical_path_priorities(GRAPH, COSTS) == {'a': 10.0, 'b': 4.0, 'c': 5.0, 'd': 1.0}
+
+
+@pytest.mark.parametrize('workers,expected', [(1, 15.0), (2, 10.0), (4, 10.0)])
+def test_estimate_makespan(workers: int, expected: float) -> None:
+    # When
+    actual = estimate_makespan(GRAPH, COSTS, workers)
+
+    # Then
+    assert actual.makespan == expected
+    assert actual.total == 15.0
+    assert actual.critical_path == 10.0
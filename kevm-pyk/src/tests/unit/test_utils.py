@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import TYPE_CHECKING
+
+from kevm_pyk.utils import run_in_dependency_order
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_run_in_dependency_order() -> None:
+    # Given
+    graph = {'slow': [], 'fast': [], 'after-fast': ['fast'], 'last': ['slow', 'after-fast']}
+    after_fast_done = Event()
+
+    def run(node: str) -> str:
+        if node == 'slow':
+            # Only finishes if 'after-fast' does not wait for 'slow'
+            assert after_fast_done.wait(timeout=10)
+        if node == 'after-fast':
+            after_fast_done.set()
+        return node.upper()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+
+        def start(node: str) -> Callable[[], str]:
+            return pool.submit(run, node).result
+
+        # When
+        actual = list(run_in_dependency_order(graph, start, max_running=2))
+
+    # Then
+    assert actual[0] == ('fast', 'FAST')
+    assert actual[-1] == ('last', 'LAST')
+    assert sorted(actual[1:-1]) == [('after-fast', 'AFTER-FAST'), ('slow', 'SLOW')]
+
+
+def test_run_in_dependency_order_priorities() -> None:
+    # Given
+    graph = {'a': [], 'b': [], 'c': [], 'd': ['a']}
+    started: list[str] = []
+
+    def start(node: str) -> Callable[[], str]:
+        started.append(node)
+        return lambda: node
+
+    # When
+    list(run_in_dependency_order(graph, start, priorities={'a': 3.0, 'c': 4.0, 'd': 2.0}))
+
+    # Then
+    assert started == ['c', 'a', 'd', 'b']
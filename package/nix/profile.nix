@@ -1,17 +1,6 @@
-{ stdenv, writeScriptBin, src, kevm, time, which, kore-exec }:
+{ stdenv, src, kevm, kore-exec }:
 
-let
-  profile = writeScriptBin "profile" ''
-    #! ${stdenv.shell}
-    set -euo pipefail
-    test_log="$1" ; shift
-    exit_status='0'
-    `${which}/bin/which ${time}/bin/time` --quiet --format '%x %es %Us %Ss %MKB %C' --output "$test_log" --append \
-        "$@" &>/dev/null \
-        || exit_status="$?"
-    exit "$exit_status"
-  '';
-in stdenv.mkDerivation {
+stdenv.mkDerivation {
   name = "kevm-profile";
   inherit src;
   preferLocalBuild = true;
@@ -24,12 +13,12 @@ in stdenv.mkDerivation {
   buildPhase = ''
     mkdir -p .build/usr
     cp -r ${kevm}/* .build/usr/
-    ${kore-exec}/bin/kore-exec --version &> log
+    ${kore-exec}/bin/kore-exec --version
     make build-prove-haskell PYK_ACTIVATE=true -j4
-    make test-prove-smoke PYK_ACTIVATE=true TEST_SYMBOLIC_BACKEND=haskell KEVM='${profile}/bin/profile log timeout 600 kevm' -j6 -k
+    make test-prove-smoke PYK_ACTIVATE=true TEST_SYMBOLIC_BACKEND=haskell KEVM="kevm bench record --manifest $PWD/log.jsonl -- timeout 600 kevm" -j6 -k
   '';
   enableParallelBuilding = true;
   installPhase = ''
-    cp log $out
+    cp log.jsonl $out
   '';
 }